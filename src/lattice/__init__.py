@@ -1,8 +1,21 @@
 __version__ = "0.1.0"
 
-from lattice.indexing.api import PipelineOrchestrator, create_pipeline_orchestrator
-from lattice.querying.api import QueryEngine, QueryResult
-from lattice.shared.config import Settings, get_settings
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lattice.indexing.api import PipelineOrchestrator, create_pipeline_orchestrator
+    from lattice.querying.api import QueryEngine, QueryResult
+    from lattice.shared.config import Settings, get_settings
+
+_EXPORTS = {
+    "create_pipeline_orchestrator": "lattice.indexing.api",
+    "get_settings": "lattice.shared.config",
+    "PipelineOrchestrator": "lattice.indexing.api",
+    "QueryEngine": "lattice.querying.api",
+    "QueryResult": "lattice.querying.api",
+    "Settings": "lattice.shared.config",
+}
 
 __all__ = [
     "create_pipeline_orchestrator",
@@ -12,3 +25,12 @@ __all__ = [
     "QueryResult",
     "Settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -10,6 +10,7 @@ import logging
 import sys
 
 from lattice.cli.parser import create_parser
+from lattice.shared.event_loop import use_fast_event_loop
 
 logging.getLogger("grpc").setLevel(logging.ERROR)
 logging.getLogger("grpc._cython").setLevel(logging.ERROR)
@@ -23,10 +24,13 @@ def main() -> None:
     if args.command is None:
         parser.print_help()
         sys.exit(0)
-    elif args.command == "index":
+
+    use_fast_event_loop()
+
+    if args.command == "index":
         from lattice.cli.commands.index import run_index
 
-        asyncio.run(run_index(args.path, args.name, args.force, args.skip_metadata))
+        asyncio.run(run_index(args.path, args.name, args.force, args.skip_metadata, args.cache_dir))
     elif args.command == "metadata":
         from lattice.cli.commands.metadata import run_metadata_regenerate, run_metadata_show
 
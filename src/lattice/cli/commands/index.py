@@ -16,7 +16,11 @@ from lattice.indexing.api import PipelineProgress
 
 
 async def run_index(
-    path: str, name: str | None = None, force: bool = False, skip_metadata: bool = False
+    path: str,
+    name: str | None = None,
+    force: bool = False,
+    skip_metadata: bool = False,
+    cache_dir: str | None = None,
 ) -> None:
     console = Console()
     resolved_path = Path(path).resolve()
@@ -65,6 +69,7 @@ async def run_index(
             progress_callback=on_progress,
             force=force,
             skip_metadata=skip_metadata,
+            cache_dir=cache_dir,
         )
 
         try:
@@ -47,6 +47,9 @@ def _add_index_parser(subparsers: argparse._SubParsersAction) -> None:
     index_parser.add_argument(
         "--skip-metadata", action="store_true", help="Skip AI metadata generation"
     )
+    index_parser.add_argument(
+        "--cache-dir", help="Directory for caches reused across indexing runs"
+    )
 
 
 def _add_metadata_parser(subparsers: argparse._SubParsersAction) -> None:
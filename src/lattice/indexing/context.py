@@ -13,7 +13,7 @@ from lattice.parsing.api import (
     InheritanceTracker,
     ParsedFile,
 )
-from lattice.shared.cache import FunctionRegistry
+from lattice.shared.cache import ASTCache, FunctionRegistry, PersistentCache
 from lattice.shared.config import PipelineRuntimeConfig
 from lattice.summarization.api import CodeSummarizer
 
@@ -41,6 +41,8 @@ class PipelineContext:
     import_processor: ImportProcessor | None = None
     inheritance_tracker: InheritanceTracker | None = None
     call_processor: CallProcessor | None = None
+    return_type_store: PersistentCache | None = None
+    ast_cache: ASTCache = field(default_factory=ASTCache)
 
     parsed_files: list[ParsedFile] = field(default_factory=list)
     file_update_status: dict[str, bool] = field(default_factory=dict)
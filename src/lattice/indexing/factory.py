@@ -19,6 +19,7 @@ async def create_pipeline_orchestrator(
     progress_callback: Callable | None = None,
     force: bool = False,
     skip_metadata: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> PipelineOrchestrator:
     logger.info("Creating pipeline orchestrator with dependencies")
 
@@ -58,4 +59,5 @@ async def create_pipeline_orchestrator(
         summarizer=summarizer,
         max_workers=max_workers,
         max_concurrent_api=max_concurrent_api,
+        cache_dir=cache_dir,
     )
@@ -1,22 +1,57 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
+import mmap
+import os
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from lattice.parsing.api import FileInfo, get_config_for_file
-from lattice.shared.cache import ASTCache
+from lattice.parsing.api import FileInfo, ParsedFile, create_code_parser, get_config_for_file
+from lattice.shared.cache import ASTCache, BoundedCache
+from lattice.shared.hashing import compute_content_hash
 from lattice.shared.types import Language
 
 if TYPE_CHECKING:
+    from lattice.indexing.parse_cache import ParseCache
     from lattice.infrastructure.memgraph import GraphBuilder
     from lattice.infrastructure.qdrant import VectorIndexer
     from lattice.parsing.api import CodeParser
 
 logger = logging.getLogger(__name__)
 
+_MMAP_THRESHOLD = 64 * 1024
+_LINE_COUNT_CHUNK = 1024 * 1024
+
+_worker_parser: CodeParser | None = None
+
+
+def parse_file_in_worker(file_info: FileInfo) -> ParsedFile:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = create_code_parser()
+    return _worker_parser.parse_file(file_info)
+
+
+def _read_content_stats(file_path: Path) -> tuple[str, int, int]:
+    """Return the content hash, size and line count of a file.
+
+    Large files are memory-mapped so hashing reads the pages directly instead of
+    copying the whole file into a bytes object.
+    """
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            raw = f.read()
+            return compute_content_hash(raw), len(raw), raw.count(b"\n") + 1
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            newlines = sum(
+                mm[start : start + _LINE_COUNT_CHUNK].count(b"\n")
+                for start in range(0, len(mm), _LINE_COUNT_CHUNK)
+            )
+            return compute_content_hash(mm), len(mm), newlines + 1
+
 
 class FileUpdateHandler:
     def __init__(
@@ -27,13 +62,21 @@ class FileUpdateHandler:
         parser: CodeParser,
         ast_cache: ASTCache,
         recalculate_calls: bool = True,
+        parse_cache: ParseCache | None = None,
+        parse_executor: Executor | None = None,
     ):
         self.repo_path = repo_path
+        self._repo_name = repo_path.name
+        self._repo_prefix_length = len(str(repo_path)) + 1
         self.graph_builder = graph_builder
         self.vector_indexer = vector_indexer
         self.parser = parser
         self.ast_cache = ast_cache
         self.recalculate_calls = recalculate_calls
+        self.parse_cache = parse_cache
+        self.parse_executor = parse_executor
+        self._previous_parses: BoundedCache[Path, ParsedFile] = BoundedCache()
+        self._last_hash: dict[str, str] = {}
 
         self.files_updated = 0
         self.files_deleted = 0
@@ -44,72 +87,159 @@ class FileUpdateHandler:
         logger.info(f"Processing file change: {file_path}")
 
         try:
-            if not file_path.exists():
-                logger.debug(f"File no longer exists: {file_path}")
+            file_info = self._build_file_info(file_path)
+            if not file_info or self._is_unchanged(file_info):
                 return
 
-            lang_config = get_config_for_file(file_path)
-            if not lang_config:
-                logger.debug(f"Unsupported file type: {file_path}")
-                return
-
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-            content_hash = hashlib.sha256(content.encode()).hexdigest()
-
-            lang_map = {
-                "python": Language.PYTHON,
-                "javascript": Language.JAVASCRIPT,
-                "typescript": Language.TYPESCRIPT,
-                "jsx": Language.JSX,
-                "tsx": Language.TSX,
-            }
-            language = lang_map.get(lang_config.name, Language.PYTHON)
-            file_info = FileInfo(
-                path=file_path,
-                relative_path=str(file_path.relative_to(self.repo_path)),
-                language=language,
-                content_hash=content_hash,
-                size_bytes=len(content.encode()),
-                line_count=content.count("\n") + 1,
-            )
-
-            parsed_file = await asyncio.to_thread(self.parser.parse_file, file_info)
+            parsed_file = await self._parse(file_info)
 
             if parsed_file:
-                relative_path = str(file_path.relative_to(self.repo_path))
-
-                await self.graph_builder.delete_file_entities(relative_path)
-
-                if file_path in self.ast_cache:
-                    del self.ast_cache[file_path]
-
-                await self.graph_builder.build_from_parsed_file(parsed_file)
-
-                await self.vector_indexer.index_file(
-                    parsed_file,
-                    project_name=self.repo_path.name,
-                )
-
-                if hasattr(parsed_file, "_tree") and parsed_file._tree:
-                    self.ast_cache[file_path] = (
-                        parsed_file._tree.root_node,
-                        lang_config.name,
-                    )
-
-                self.files_updated += 1
-                logger.info(f"Updated: {file_path}")
-
-                if self.recalculate_calls:
-                    await self._recalculate_calls_for_file(file_path)
+                await self._apply_parsed_file(file_path, parsed_file)
 
         except Exception as e:
             logger.error(f"Failed to update {file_path}: {e}")
             self.errors += 1
 
-    async def _recalculate_calls_for_file(self, changed_file: Path) -> None:
-        try:
-            relative_path = str(changed_file.relative_to(self.repo_path))
+    async def handle_files_changed(self, file_paths: list[Path], executor: Executor) -> None:
+        logger.info(f"Processing {len(file_paths)} file changes")
+
+        file_infos: list[FileInfo] = []
+        for file_path in file_paths:
+            try:
+                file_info = self._build_file_info(file_path)
+            except Exception as e:
+                logger.error(f"Failed to update {file_path}: {e}")
+                self.errors += 1
+                continue
+            if file_info and not self._is_unchanged(file_info):
+                file_infos.append(file_info)
+
+        parsed_files = await self._parse_batch(file_infos, executor)
+
+        for file_info, parsed_file in zip(file_infos, parsed_files, strict=True):
+            try:
+                if isinstance(parsed_file, BaseException):
+                    raise parsed_file
+                await self._apply_parsed_file(file_info.path, parsed_file)
+            except Exception as e:
+                logger.error(f"Failed to update {file_info.path}: {e}")
+                self.errors += 1
+
+    def _build_file_info(self, file_path: Path) -> FileInfo | None:
+        if not file_path.exists():
+            logger.debug(f"File no longer exists: {file_path}")
+            return None
+
+        lang_config = get_config_for_file(file_path)
+        if not lang_config:
+            logger.debug(f"Unsupported file type: {file_path}")
+            return None
+
+        content_hash, size_bytes, line_count = _read_content_stats(file_path)
+
+        lang_map = {
+            "python": Language.PYTHON,
+            "javascript": Language.JAVASCRIPT,
+            "typescript": Language.TYPESCRIPT,
+            "jsx": Language.JSX,
+            "tsx": Language.TSX,
+        }
+        language = lang_map.get(lang_config.name, Language.PYTHON)
+        return FileInfo(
+            path=file_path,
+            relative_path=self._relative_path(file_path),
+            language=language,
+            content_hash=content_hash,
+            size_bytes=size_bytes,
+            line_count=line_count,
+        )
+
+    def _relative_path(self, file_path: Path) -> str:
+        return str(file_path)[self._repo_prefix_length :]
+
+    def _is_unchanged(self, file_info: FileInfo) -> bool:
+        if self._last_hash.get(file_info.relative_path) != file_info.content_hash:
+            return False
+        logger.debug(f"Content unchanged, skipping: {file_info.relative_path}")
+        return True
+
+    async def _apply_parsed_file(self, file_path: Path, parsed_file: ParsedFile) -> None:
+        relative_path = parsed_file.file_info.relative_path
+
+        await self.graph_builder.delete_file_entities(relative_path)
+
+        if file_path in self.ast_cache:
+            del self.ast_cache[file_path]
+
+        await asyncio.gather(
+            self.graph_builder.build_from_parsed_file(parsed_file),
+            self.vector_indexer.index_file(parsed_file, project_name=self._repo_name),
+        )
+
+        if parsed_file._tree is not None:
+            self.ast_cache[file_path] = (
+                parsed_file._tree.root_node,
+                parsed_file.file_info.language.value,
+            )
 
+        self._last_hash[relative_path] = parsed_file.file_info.content_hash
+        self.files_updated += 1
+        logger.info(f"Updated: {file_path}")
+
+        if self.recalculate_calls:
+            await self._recalculate_calls_for_file(relative_path)
+
+    def _cached_parse(self, file_info: FileInfo) -> ParsedFile | None:
+        if not self.parse_cache:
+            return None
+        cached = self.parse_cache.get(file_info.relative_path, file_info.content_hash)
+        if cached:
+            logger.debug(f"Parse cache hit: {file_info.relative_path}")
+        return cached
+
+    async def _parse(self, file_info: FileInfo) -> ParsedFile | None:
+        cached = self._cached_parse(file_info)
+        if cached:
+            return cached
+
+        previous = self._previous_parses.get(file_info.path)
+        del self._previous_parses[file_info.path]
+        loop = asyncio.get_running_loop()
+        parsed_file = await loop.run_in_executor(
+            self.parse_executor, self.parser.reparse_file, file_info, previous
+        )
+        if parsed_file:
+            self._previous_parses[file_info.path] = parsed_file
+            if self.parse_cache:
+                self.parse_cache.put(parsed_file)
+        return parsed_file
+
+    async def _parse_batch(
+        self, file_infos: list[FileInfo], executor: Executor
+    ) -> list[ParsedFile | BaseException]:
+        results: list[ParsedFile | BaseException | None] = [
+            self._cached_parse(file_info) for file_info in file_infos
+        ]
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        loop = asyncio.get_running_loop()
+        parsed_files = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, parse_file_in_worker, file_infos[index])
+                for index in misses
+            ),
+            return_exceptions=True,
+        )
+        for index, parsed_file in zip(misses, parsed_files, strict=True):
+            results[index] = parsed_file
+            del self._previous_parses[file_infos[index].path]
+            if self.parse_cache and isinstance(parsed_file, ParsedFile):
+                self.parse_cache.put(parsed_file)
+
+        return [result for result in results if result is not None]
+
+    async def _recalculate_calls_for_file(self, relative_path: str) -> None:
+        try:
             await self.graph_builder.delete_calls_for_file(relative_path)
             await self.graph_builder.rebuild_calls_for_file(relative_path)
 
@@ -119,19 +249,24 @@ class FileUpdateHandler:
         except AttributeError:
             logger.debug("CALLS recalculation not supported by graph builder")
         except Exception as e:
-            logger.warning(f"Failed to recalculate CALLS for {changed_file}: {e}")
+            logger.warning(f"Failed to recalculate CALLS for {relative_path}: {e}")
 
     async def handle_file_deleted(self, file_path: Path) -> None:
         logger.info(f"Processing file deletion: {file_path}")
 
         try:
-            relative_path = str(file_path.relative_to(self.repo_path))
+            relative_path = self._relative_path(file_path)
 
             await self.graph_builder.delete_file_entities(relative_path)
             await self.vector_indexer.delete_file(relative_path)
 
+            if self.parse_cache:
+                self.parse_cache.remove(relative_path)
+            self._last_hash.pop(relative_path, None)
+
             if file_path in self.ast_cache:
                 del self.ast_cache[file_path]
+            del self._previous_parses[file_path]
 
             self.files_deleted += 1
             logger.info(f"Deleted: {file_path}")
@@ -17,7 +17,7 @@ from lattice.infrastructure.llm import BaseEmbeddingProvider
 from lattice.infrastructure.memgraph import MemgraphClient
 from lattice.infrastructure.qdrant import QdrantManager
 from lattice.parsing.api import CodeParser, ImportProcessor, InheritanceTracker
-from lattice.shared.cache import FunctionRegistry
+from lattice.shared.cache import FunctionRegistry, PersistentCache
 from lattice.shared.exceptions import IndexingError
 from lattice.summarization.api import CodeSummarizer
 
@@ -39,11 +39,13 @@ class PipelineOrchestrator:
         summarizer: CodeSummarizer,
         max_workers: int,
         max_concurrent_api: int,
+        cache_dir: str | Path | None = None,
     ):
         self.repo_path = Path(repo_path).resolve()
         self.project_name = project_name or self.repo_path.name
         self.force = force
         self.skip_metadata = skip_metadata
+        self.cache_dir = Path(cache_dir).resolve() if cache_dir else None
 
         self.tracker = ProgressTracker()
         if progress_callback:
@@ -56,6 +58,7 @@ class PipelineOrchestrator:
         self._summarizer = summarizer
         self._max_workers = max_workers
         self._max_concurrent_api = max_concurrent_api
+        self._return_type_store: PersistentCache | None = None
 
         self._stages = [
             ScanStage(),
@@ -81,7 +84,7 @@ class PipelineOrchestrator:
             import_processor=import_processor,
         )
 
-        return PipelineContext(
+        context = PipelineContext(
             repo_path=self.repo_path,
             project_name=self.project_name,
             tracker=self.tracker,
@@ -100,8 +103,21 @@ class PipelineOrchestrator:
             import_processor=import_processor,
             inheritance_tracker=inheritance_tracker,
         )
+        if self.cache_dir:
+            self._return_type_store = PersistentCache(
+                self.cache_dir / f"{self.project_name}-return-types"
+            )
+            context.return_type_store = self._return_type_store
+        return context
 
     async def _cleanup(self) -> None:
+        if self._return_type_store:
+            try:
+                self._return_type_store.close()
+            except Exception as e:
+                logger.warning(f"Failed to close return type cache: {e}")
+            self._return_type_store = None
+
         if self._memgraph:
             try:
                 await self._memgraph.close()
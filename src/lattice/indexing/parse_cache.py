@@ -0,0 +1,68 @@
+import logging
+import sqlite3
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lattice.parsing.api import ParsedFile
+from lattice.shared.hashing import CONTENT_HASH_ALGORITHM
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """SQLite-backed store of parsed files keyed by path and content hash.
+
+    Only the latest parse of each path is kept, so the database grows with the
+    repository rather than with the number of edits.
+    """
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'hash_algorithm'").fetchone()
+        if row is None or row[0] != CONTENT_HASH_ALGORITHM:
+            self._conn.execute("DROP TABLE IF EXISTS parsed_files")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('hash_algorithm', ?)",
+                (CONTENT_HASH_ALGORITHM,),
+            )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsed_files ("
+            "relative_path TEXT PRIMARY KEY, "
+            "content_hash TEXT NOT NULL, "
+            "parsed_file TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, relative_path: str, content_hash: str) -> ParsedFile | None:
+        row = self._conn.execute(
+            "SELECT parsed_file FROM parsed_files WHERE relative_path = ? AND content_hash = ?",
+            (relative_path, content_hash),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return ParsedFile.model_validate_json(row[0])
+        except ValidationError as e:
+            logger.debug(f"Discarding unreadable parse cache entry for {relative_path}: {e}")
+            self.remove(relative_path)
+            return None
+
+    def put(self, parsed_file: ParsedFile) -> None:
+        file_info = parsed_file.file_info
+        self._conn.execute(
+            "INSERT OR REPLACE INTO parsed_files VALUES (?, ?, ?)",
+            (file_info.relative_path, file_info.content_hash, parsed_file.model_dump_json()),
+        )
+        self._conn.commit()
+
+    def remove(self, relative_path: str) -> None:
+        self._conn.execute("DELETE FROM parsed_files WHERE relative_path = ?", (relative_path,))
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -5,7 +5,6 @@ from pathlib import Path
 
 from lattice.indexing.context import PipelineContext
 from lattice.parsing.api import CallProcessor, ParsedFile, TypeInferenceEngine
-from lattice.shared.cache import ASTCache
 from lattice.shared.types import PipelineStage as PipelineStageEnum
 
 logger = logging.getLogger(__name__)
@@ -23,15 +22,15 @@ class ParseStage:
         logger.info(f"Parsing {len(ctx.scanned_files)} files with {ctx.max_workers} workers")
 
         loop = asyncio.get_event_loop()
-        parsed_results: list[tuple] = []
 
         def parse_file_sync(file_info):
             try:
-                parsed = ctx.parser.parse_file(file_info)
+                parsed = ctx.parser.parse_file(file_info, keep_tree=True)
                 return (file_info, parsed, None)
             except Exception as e:
                 return (file_info, None, e)
 
+        total_entities = 0
         with ThreadPoolExecutor(max_workers=ctx.max_workers) as executor:
             futures = [
                 loop.run_in_executor(executor, parse_file_sync, file_info)
@@ -40,46 +39,22 @@ class ParseStage:
 
             completed = 0
             for coro in asyncio.as_completed(futures):
-                result = await coro
-                parsed_results.append(result)
+                file_info, parsed, error = await coro
+                total_entities += self._collect_parsed_file(ctx, file_info, parsed, error)
                 completed += 1
                 ctx.tracker.update_stage(
                     completed,
                     message=f"Parsed {completed}/{len(ctx.scanned_files)} files",
                 )
 
-        total_entities = 0
-        for file_info, parsed, error in parsed_results:
-            if error:
-                logger.warning(
-                    f"Failed to parse {file_info.relative_path}: {error}",
-                    exc_info=True,
-                )
-                continue
-
-            if parsed:
-                ctx.parsed_files.append(parsed)
-                total_entities += len(parsed.all_entities)
-
-                module_qn = self._file_to_module_qn(ctx.project_name, file_info.relative_path)
-                self._register_entities(ctx, parsed, module_qn)
-
-                ast_cache = getattr(ctx.parser, "_ast_cache", None)
-                if ctx.import_processor and ast_cache:
-                    cached = ast_cache.get(file_info.path)
-                    if cached:
-                        root_node, lang = cached
-                        ctx.import_processor.parse_imports(
-                            root_node, module_qn, file_info.language.value
-                        )
-
         if ctx.function_registry and ctx.import_processor and ctx.inheritance_tracker:
             type_inference = TypeInferenceEngine(
                 function_registry=ctx.function_registry,
                 import_mapping=ctx.import_processor.import_mapping,
-                ast_cache=getattr(ctx.parser, "_ast_cache", None) or ASTCache(),
-                module_qn_to_file_path={},
-                simple_name_lookup={},
+                ast_cache=ctx.ast_cache,
+                module_qn_to_file_path=self._build_module_file_map(ctx),
+                simple_name_lookup=self._build_simple_name_lookup(ctx),
+                return_type_store=ctx.return_type_store,
             )
             ctx.call_processor = CallProcessor(
                 function_registry=ctx.function_registry,
@@ -96,6 +71,38 @@ class ParseStage:
         )
         logger.info(f"Parsed {len(ctx.parsed_files)} files, found {total_entities} entities")
 
+    def _collect_parsed_file(
+        self,
+        ctx: PipelineContext,
+        file_info,
+        parsed: ParsedFile | None,
+        error: Exception | None,
+    ) -> int:
+        if error:
+            logger.warning(
+                f"Failed to parse {file_info.relative_path}: {error}",
+                exc_info=True,
+            )
+            return 0
+
+        if not parsed:
+            return 0
+
+        ctx.parsed_files.append(parsed)
+        module_qn = self._file_to_module_qn(ctx.project_name, file_info.relative_path)
+        self._register_entities(ctx, parsed, module_qn)
+
+        # The bounded AST cache owns the tree from here on.
+        tree, parsed._tree = parsed._tree, None
+        if tree is not None:
+            ctx.ast_cache[file_info.path] = (tree.root_node, file_info.language.value)
+            if ctx.import_processor:
+                ctx.import_processor.parse_imports(
+                    tree.root_node, module_qn, file_info.language.value
+                )
+
+        return len(parsed.all_entities)
+
     def _file_to_module_qn(self, project_name: str, relative_path: str) -> str:
         path = Path(relative_path)
         parts = list(path.with_suffix("").parts)
@@ -105,6 +112,18 @@ class ParseStage:
 
         return f"{project_name}.{'.'.join(parts)}" if parts else project_name
 
+    def _build_module_file_map(self, ctx: PipelineContext) -> dict[str, Path]:
+        return {
+            self._file_to_module_qn(ctx.project_name, file_info.relative_path): file_info.path
+            for file_info in ctx.scanned_files
+        }
+
+    def _build_simple_name_lookup(self, ctx: PipelineContext) -> dict[str, set[str]]:
+        lookup: dict[str, set[str]] = {}
+        for qn, _ in ctx.function_registry.find_with_prefix(ctx.project_name):
+            lookup.setdefault(qn.rpartition(".")[2], set()).add(qn)
+        return lookup
+
     def _register_entities(
         self,
         ctx: PipelineContext,
@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from lattice.indexing.handlers import FileUpdateHandler
+from lattice.indexing.parse_cache import ParseCache
 from lattice.shared.cache import ASTCache
 from lattice.shared.config import WatcherConfig, get_settings
 
 if TYPE_CHECKING:
+    from watchfiles import Change
+
     from lattice.infrastructure.memgraph import GraphBuilder
     from lattice.infrastructure.qdrant import VectorIndexer
     from lattice.parsing.api import CodeParser
@@ -18,62 +24,69 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _import_watchdog():
+def _import_watchfiles():
     try:
-        from watchdog.events import FileSystemEventHandler
-        from watchdog.observers import Observer
+        from watchfiles import awatch
 
-        return FileSystemEventHandler, Observer
+        return awatch
     except ImportError:
         raise ImportError(
-            "Real-time updates require the 'watchdog' package. Install with: pip install watchdog"
+            "Real-time updates require the 'watchfiles' package. "
+            "Install with: pip install watchfiles"
         )
 
 
 class FileChangeHandler:
-    def __init__(
-        self,
-        repo_path: Path,
-        on_file_changed: Callable[[Path], None],
-        on_file_deleted: Callable[[Path], None],
-    ):
+    def __init__(self, repo_path: Path):
         self.repo_path = repo_path
-        self.on_file_changed = on_file_changed
-        self.on_file_deleted = on_file_deleted
+        self._repo_prefix = f"{repo_path}{os.sep}"
 
         settings = get_settings()
-        self.ignore_patterns = set(settings.ignore_patterns)
-        self.supported_extensions = set(settings.supported_extensions)
+        self.ignore_patterns = frozenset(settings.ignore_patterns)
+        self.supported_extensions = frozenset(settings.supported_extensions)
 
-        self._pending_changes: dict[Path, str] = {}
+        self._pending_changes: dict[str, str] = {}
+        self._last_seen: dict[str, float] = {}
         self._debounce_delay = WatcherConfig.debounce_delay
 
-    def _is_relevant(self, path: Path) -> bool:
-        if path.suffix.lower() not in self.supported_extensions:
+    def accepts(self, change: Change, src_path: str) -> bool:
+        if not src_path.startswith(self._repo_prefix):
             return False
-
-        try:
-            relative = path.relative_to(self.repo_path)
-            for part in relative.parts:
-                if part in self.ignore_patterns:
-                    return False
-        except ValueError:
+        if os.path.splitext(src_path)[1].lower() not in self.supported_extensions:
             return False
-
-        return True
-
-    def handle_event(self, event_type: str, src_path: str) -> None:
-        path = Path(src_path)
-
-        if path.is_dir() or not self._is_relevant(path):
-            return
-
-        logger.info(f"File {event_type}: {path}")
-
-        if event_type in ("created", "modified"):
-            self.on_file_changed(path)
-        elif event_type == "deleted":
-            self.on_file_deleted(path)
+        relative_parts = src_path[len(self._repo_prefix) :].split(os.sep)
+        return self.ignore_patterns.isdisjoint(relative_parts)
+
+    def record_changes(self, changes: set[tuple[Change, str]], now: float | None = None) -> None:
+        seen_at = time.monotonic() if now is None else now
+        for change, src_path in changes:
+            self._pending_changes[src_path] = change.name
+            self._last_seen[src_path] = seen_at
+
+    def pop_settled(self, now: float | None = None) -> tuple[set[Path], set[Path]]:
+        current = time.monotonic() if now is None else now
+        settled = [
+            src_path
+            for src_path, seen_at in self._last_seen.items()
+            if current - seen_at >= self._debounce_delay
+        ]
+
+        changed: set[Path] = set()
+        deleted: set[Path] = set()
+        for src_path in settled:
+            del self._last_seen[src_path]
+            event_type = self._pending_changes.pop(src_path)
+            path = Path(src_path)
+            if path.is_file():
+                changed.add(path)
+            elif not path.exists():
+                deleted.add(path)
+            else:
+                logger.debug(f"Ignoring {event_type} event for non-file path: {path}")
+
+        if changed or deleted:
+            logger.info(f"Detected {len(changed)} changed and {len(deleted)} deleted files")
+        return changed, deleted
 
 
 class FileWatcher:
@@ -85,8 +98,10 @@ class FileWatcher:
         parser: CodeParser,
         ast_cache: ASTCache,
         recalculate_calls: bool = True,
+        parse_cache_path: Path | None = None,
     ):
         self.repo_path = repo_path.resolve()
+        self.parse_cache_path = parse_cache_path
         self._handler = FileUpdateHandler(
             repo_path=self.repo_path,
             graph_builder=graph_builder,
@@ -96,11 +111,15 @@ class FileWatcher:
             recalculate_calls=recalculate_calls,
         )
 
-        self._observer = None
+        self._change_handler = FileChangeHandler(repo_path=self.repo_path)
+        self._stop_event: asyncio.Event | None = None
         self._running = False
-        self._update_queue: asyncio.Queue[tuple[str, Path]] = asyncio.Queue()
-        self._update_task = None
-        self._pending_changes: set[Path] = set()
+        self._watch_task: asyncio.Task | None = None
+        self._update_task: asyncio.Task | None = None
+        self._pending: dict[Path, str] = {}
+        self._work_event = asyncio.Event()
+        self.events_coalesced = 0
+        self._parse_pool: ProcessPoolExecutor | None = None
 
     @property
     def files_updated(self) -> int:
@@ -123,37 +142,16 @@ class FileWatcher:
             logger.warning("Watcher already running")
             return
 
-        event_handler_cls, observer_cls = _import_watchdog()
-
-        class WatchdogHandler(event_handler_cls):
-            def __init__(self, change_handler: FileChangeHandler):
-                super().__init__()
-                self.change_handler = change_handler
-
-            def on_created(self, event):
-                if not event.is_directory:
-                    self.change_handler.handle_event("created", event.src_path)
-
-            def on_modified(self, event):
-                if not event.is_directory:
-                    self.change_handler.handle_event("modified", event.src_path)
-
-            def on_deleted(self, event):
-                if not event.is_directory:
-                    self.change_handler.handle_event("deleted", event.src_path)
-
-        change_handler = FileChangeHandler(
-            repo_path=self.repo_path,
-            on_file_changed=lambda p: self._queue_update("changed", p),
-            on_file_deleted=lambda p: self._queue_update("deleted", p),
+        _import_watchfiles()
+        if self.parse_cache_path:
+            self._handler.parse_cache = ParseCache(self.parse_cache_path)
+        self._handler.parse_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="lattice-parse"
         )
-
-        self._observer = observer_cls()
-        handler = WatchdogHandler(change_handler)
-        self._observer.schedule(handler, str(self.repo_path), recursive=True)
-        self._observer.start()
+        self._stop_event = asyncio.Event()
         self._running = True
 
+        self._watch_task = asyncio.create_task(self._watch_changes())
         self._update_task = asyncio.create_task(self._process_updates())
 
         logger.info(f"Started watching: {self.repo_path}")
@@ -164,23 +162,35 @@ class FileWatcher:
 
         self._running = False
 
-        if self._observer:
-            self._observer.stop()
-            self._observer.join(timeout=5)
-            self._observer = None
+        if self._stop_event:
+            self._stop_event.set()
+
+        for task in (self._watch_task, self._update_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._watch_task = None
+        self._update_task = None
+
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
 
-        if self._update_task:
-            self._update_task.cancel()
-            try:
-                await self._update_task
-            except asyncio.CancelledError:
-                pass
-            self._update_task = None
+        if self._handler.parse_executor:
+            self._handler.parse_executor.shutdown(wait=False, cancel_futures=True)
+            self._handler.parse_executor = None
+
+        if self._handler.parse_cache:
+            self._handler.parse_cache.close()
+            self._handler.parse_cache = None
 
         logger.info(f"Stopped watching: {self.repo_path}")
         logger.info(
             f"Stats: {self.files_updated} updated, {self.files_deleted} deleted, "
-            f"{self.errors} errors"
+            f"{self.errors} errors, {self.events_coalesced} coalesced"
         )
 
     async def run_forever(self) -> None:
@@ -193,32 +203,72 @@ class FileWatcher:
         finally:
             await self.stop()
 
-    def _queue_update(self, action: str, path: Path) -> None:
+    async def _watch_changes(self) -> None:
         try:
-            self._update_queue.put_nowait((action, path))
-        except asyncio.QueueFull:
-            logger.warning(f"Update queue full, dropping: {path}")
+            await self._watch(force_polling=False)
+        except OSError as e:
+            logger.warning(f"Native file watching unavailable ({e}), falling back to polling")
+            await self._watch(force_polling=True)
+
+    async def _watch(self, force_polling: bool) -> None:
+        awatch = _import_watchfiles()
+        async for changes in awatch(
+            self.repo_path,
+            debounce=WatcherConfig.batch_debounce_ms,
+            step=WatcherConfig.batch_step_ms,
+            watch_filter=self._change_handler.accepts,
+            stop_event=self._stop_event,
+            rust_timeout=int(WatcherConfig.debounce_delay * 1000),
+            yield_on_timeout=True,
+            recursive=True,
+            force_polling=force_polling,
+            ignore_permission_denied=True,
+        ):
+            self._change_handler.record_changes(changes)
+            changed, deleted = self._change_handler.pop_settled()
+            for path in deleted:
+                self._queue_update("deleted", path)
+            for path in changed:
+                self._queue_update("changed", path)
+
+    def _queue_update(self, action: str, path: Path) -> None:
+        if path in self._pending:
+            self.events_coalesced += 1
+        self._pending[path] = action
+        self._work_event.set()
 
     async def _process_updates(self) -> None:
         while self._running:
+            await self._work_event.wait()
+            self._work_event.clear()
+            batch, self._pending = self._pending, {}
+
+            deleted = {path for path, action in batch.items() if action == "deleted"}
+            changed = {path for path, action in batch.items() if action == "changed"}
             try:
-                action, path = await asyncio.wait_for(
-                    self._update_queue.get(),
-                    timeout=1.0,
-                )
-
-                if action == "changed":
-                    await self._handler.handle_file_changed(path)
-                elif action == "deleted":
-                    await self._handler.handle_file_deleted(path)
-
-            except TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
+                await self._handle_batch_deleted(deleted)
+                await self._handle_batch_changed(changed)
             except Exception as e:
                 logger.error(f"Error processing update: {e}")
 
+    async def _handle_batch_changed(self, paths: set[Path]) -> None:
+        if len(paths) == 1:
+            await self._handler.handle_file_changed(next(iter(paths)))
+        elif paths:
+            await self._handler.handle_files_changed(sorted(paths), self._get_parse_pool())
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 4, 8),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._parse_pool
+
+    async def _handle_batch_deleted(self, paths: set[Path]) -> None:
+        for path in sorted(paths):
+            await self._handler.handle_file_deleted(path)
+
 
 async def start_watcher(
     repo_path: str | Path,
@@ -226,6 +276,7 @@ async def start_watcher(
     vector_indexer: VectorIndexer,
     parser: CodeParser,
     ast_cache: ASTCache,
+    parse_cache_path: Path | None = None,
 ) -> FileWatcher:
     watcher = FileWatcher(
         repo_path=Path(repo_path),
@@ -233,6 +284,7 @@ async def start_watcher(
         vector_indexer=vector_indexer,
         parser=parser,
         ast_cache=ast_cache,
+        parse_cache_path=parse_cache_path,
     )
     await watcher.start()
     return watcher
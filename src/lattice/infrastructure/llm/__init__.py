@@ -3,6 +3,7 @@
 from lattice.infrastructure.llm.api import (
     BaseEmbeddingProvider,
     BaseLLMProvider,
+    CachedEmbeddingProvider,
     ProviderConfig,
     get_embedding_provider,
     get_llm_provider,
@@ -11,6 +12,7 @@ from lattice.infrastructure.llm.api import (
 __all__ = [
     "BaseEmbeddingProvider",
     "BaseLLMProvider",
+    "CachedEmbeddingProvider",
     "ProviderConfig",
     "get_embedding_provider",
     "get_llm_provider",
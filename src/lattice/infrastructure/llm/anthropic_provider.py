@@ -65,6 +65,10 @@ class AnthropicLLMProvider(BaseLLMProvider):
         self._client = _get_anthropic_client(config.api_key)
         logger.info(f"Initialized Anthropic LLM provider with model {config.model}")
 
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self._client.close()
+
     async def _complete_impl(
         self,
         messages: list[dict[str, str]],
@@ -3,6 +3,7 @@ from lattice.infrastructure.llm.base import (
     BaseLLMProvider,
     ProviderConfig,
 )
+from lattice.infrastructure.llm.embedding_cache import CachedEmbeddingProvider
 from lattice.infrastructure.llm.factory import (
     get_embedding_provider,
     get_llm_provider,
@@ -13,5 +14,6 @@ __all__ = [
     "get_embedding_provider",
     "BaseLLMProvider",
     "BaseEmbeddingProvider",
+    "CachedEmbeddingProvider",
     "ProviderConfig",
 ]
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass, field
 
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -129,6 +129,26 @@ class BaseLLMProvider(ABC):
                 temperature=temperature if temperature is not None else self.config.temperature,
             )
 
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Generate a completion as a stream of text chunks.
+
+        Providers without native streaming yield the whole completion at once.
+
+        Args:
+            messages: Chat messages with 'role' and 'content' keys.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+
+        Yields:
+            Successive pieces of the completion text.
+        """
+        yield await self.complete(messages, max_tokens=max_tokens, temperature=temperature)
+
     def set_concurrency(self, max_concurrent: int) -> None:
         """Set the maximum concurrent requests.
 
@@ -137,6 +157,12 @@ class BaseLLMProvider(ABC):
         """
         self._semaphore = asyncio.Semaphore(max_concurrent)
 
+    async def aclose(self) -> None:
+        """Release network clients held by the provider.
+
+        Providers without persistent clients have nothing to release.
+        """
+
 
 class BaseEmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
@@ -226,3 +252,9 @@ class BaseEmbeddingProvider(ABC):
             max_concurrent: Maximum concurrent API calls.
         """
         self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def aclose(self) -> None:
+        """Release network clients held by the provider.
+
+        Providers without persistent clients have nothing to release.
+        """
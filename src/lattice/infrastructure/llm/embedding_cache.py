@@ -0,0 +1,92 @@
+"""Persistent cache in front of an embedding provider."""
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from lattice.infrastructure.llm.base import BaseEmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbeddingProvider(BaseEmbeddingProvider):
+    """Embedding provider that stores vectors in SQLite keyed by model and text.
+
+    Only texts missing from the cache are sent to the wrapped provider, in a
+    single request, so repeated texts are served locally across restarts.
+    """
+
+    def __init__(self, provider: BaseEmbeddingProvider, db_path: Path):
+        """Initialize the cache.
+
+        Args:
+            provider: Provider used for texts that are not cached yet.
+            db_path: SQLite database file holding the cached vectors.
+        """
+        super().__init__(provider.config)
+        self._provider = provider
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.config.model}\0{text}".encode()).digest()
+
+    async def _embed_impl(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, calling the wrapped provider only for cache misses.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            List of embedding vectors.
+        """
+        keys = [self._key(text) for text in texts]
+        placeholders = ",".join("?" * len(keys))
+        rows = self._conn.execute(
+            f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", keys
+        ).fetchall()
+        cached = {key: np.frombuffer(vector, dtype=np.float32).tolist() for key, vector in rows}
+
+        missing = list(
+            {key: text for key, text in zip(keys, texts, strict=True) if key not in cached}.items()
+        )
+        if missing:
+            vectors = await self._provider._embed_batch_internal([text for _, text in missing])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                [
+                    (key, np.asarray(vector, dtype=np.float32).tobytes())
+                    for (key, _), vector in zip(missing, vectors, strict=True)
+                ],
+            )
+            self._conn.commit()
+            cached.update((key, vector) for (key, _), vector in zip(missing, vectors, strict=True))
+
+        logger.debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return [cached[key] for key in keys]
+
+    def set_concurrency(self, max_concurrent: int) -> None:
+        """Set the maximum concurrent requests.
+
+        Args:
+            max_concurrent: Maximum concurrent API calls.
+        """
+        super().set_concurrency(max_concurrent)
+        self._provider.set_concurrency(max_concurrent)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    async def aclose(self) -> None:
+        """Close the cache database and the wrapped provider."""
+        self.close()
+        await self._provider.aclose()
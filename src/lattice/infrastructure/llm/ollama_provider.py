@@ -59,6 +59,10 @@ class OllamaLLMProvider(BaseLLMProvider):
 
         logger.info(f"Initialized Ollama LLM provider: {base_url} with model {config.model}")
 
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self._client.close()
+
     async def _complete_impl(
         self,
         messages: list[dict[str, str]],
@@ -118,6 +122,10 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
 
         logger.info(f"Initialized Ollama embedding provider: {base_url} with model {config.model}")
 
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self._client.close()
+
     async def _embed_impl(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings using Ollama API.
 
@@ -1,6 +1,7 @@
 """OpenAI provider implementation."""
 
 import logging
+from collections.abc import AsyncIterator
 
 from openai import AsyncOpenAI
 
@@ -29,6 +30,10 @@ class OpenAILLMProvider(BaseLLMProvider):
             base_url=config.base_url,
         )
 
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self._client.close()
+
     async def _complete_impl(
         self,
         messages: list[dict[str, str]],
@@ -61,6 +66,41 @@ class OpenAILLMProvider(BaseLLMProvider):
             logger.error(f"OpenAI completion failed: {e}")
             raise SummarizationError(f"OpenAI completion failed: {e}", cause=e)
 
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a completion from the OpenAI API.
+
+        Args:
+            messages: Chat messages.
+            max_tokens: Maximum tokens.
+            temperature: Sampling temperature.
+
+        Yields:
+            Content deltas as they arrive.
+
+        Raises:
+            SummarizationError: If API call fails.
+        """
+        async with self._semaphore:
+            try:
+                response = await self._client.chat.completions.create(
+                    model=self.config.model,
+                    messages=messages,
+                    temperature=temperature if temperature is not None else self.config.temperature,
+                    max_tokens=max_tokens or self.config.max_tokens,
+                    stream=True,
+                )
+                async for chunk in response:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                logger.error(f"OpenAI streaming completion failed: {e}")
+                raise SummarizationError(f"OpenAI completion failed: {e}", cause=e)
+
 
 class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
     """OpenAI embedding provider using text-embedding models."""
@@ -77,6 +117,10 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
             base_url=config.base_url,
         )
 
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self._client.close()
+
     async def _embed_impl(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings using OpenAI API.
 
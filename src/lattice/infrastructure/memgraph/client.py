@@ -16,10 +16,12 @@ class MemgraphClient:
         uri: str,
         user: str,
         password: str,
+        max_pool_size: int = 16,
     ):
         self._uri = uri
         self._user = user
         self._password = password
+        self._max_pool_size = max_pool_size
         self._driver: AsyncDriver | None = None
 
     async def connect(self) -> None:
@@ -28,6 +30,7 @@ class MemgraphClient:
                 self._driver = AsyncGraphDatabase.driver(
                     self._uri,
                     auth=(self._user, self._password),
+                    max_connection_pool_size=self._max_pool_size,
                 )
                 await self._driver.verify_connectivity()
                 logger.info(f"Connected to Memgraph at {self._uri}")
@@ -168,4 +171,5 @@ def create_memgraph_client() -> MemgraphClient:
         uri=settings.memgraph_uri,
         user=settings.memgraph_user,
         password=settings.memgraph_password,
+        max_pool_size=settings.memgraph_pool_max,
     )
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from functools import lru_cache
+from pathlib import PurePath
 
 import tiktoken
 
@@ -23,6 +24,7 @@ class CodeChunk:
     def to_payload(self) -> dict:
         return {
             "file_path": self.file_path,
+            "dir_path": parent_directories(self.file_path),
             "entity_type": self.entity_type,
             "entity_name": self.entity_name,
             "language": self.language,
@@ -35,6 +37,11 @@ class CodeChunk:
         }
 
 
+def parent_directories(file_path: str) -> list[str]:
+    """Every directory containing ``file_path``, so a keyword match can select a whole tree."""
+    return [str(parent) for parent in PurePath(file_path).parents]
+
+
 @lru_cache(maxsize=4)
 def _get_encoding(encoding_name: str = "cl100k_base") -> tiktoken.Encoding:
     return tiktoken.get_encoding(encoding_name)
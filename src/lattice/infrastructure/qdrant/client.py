@@ -1,5 +1,6 @@
 import logging
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from qdrant_client import AsyncQdrantClient, models
@@ -10,6 +11,15 @@ from lattice.shared.exceptions import VectorStoreError
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _match_filter(conditions: tuple[tuple[str, Any], ...]) -> models.Filter:
+    must_conditions = [
+        models.FieldCondition(key=key, match=models.MatchValue(value=value))
+        for key, value in conditions
+    ]
+    return models.Filter(must=must_conditions)
+
+
 class CollectionName(str, Enum):
     CODE_CHUNKS = "code_chunks"
     SUMMARIES = "summaries"
@@ -78,16 +88,31 @@ class QdrantManager:
             if CollectionName.CODE_CHUNKS.value not in existing:
                 await self._create_collection_with_indexes(
                     CollectionName.CODE_CHUNKS.value,
-                    ["file_path", "entity_type", "language", "content_hash", "project_name"],
+                    [
+                        "file_path",
+                        "dir_path",
+                        "entity_type",
+                        "language",
+                        "content_hash",
+                        "project_name",
+                    ],
                 )
                 logger.info(f"Created collection: {CollectionName.CODE_CHUNKS.value}")
+            else:
+                await self._ensure_keyword_indexes(
+                    CollectionName.CODE_CHUNKS.value, ["file_path", "dir_path"]
+                )
 
             if CollectionName.SUMMARIES.value not in existing:
                 await self._create_collection_with_indexes(
                     CollectionName.SUMMARIES.value,
-                    ["file_path", "entity_type"],
+                    ["file_path", "dir_path", "entity_type"],
                 )
                 logger.info(f"Created collection: {CollectionName.SUMMARIES.value}")
+            else:
+                await self._ensure_keyword_indexes(
+                    CollectionName.SUMMARIES.value, ["file_path", "dir_path"]
+                )
 
             if CollectionName.DOCUMENT_CHUNKS.value not in existing:
                 await self._create_collection_with_indexes(
@@ -124,6 +149,13 @@ class QdrantManager:
                 field_schema=models.PayloadSchemaType.KEYWORD,
             )
 
+    async def _ensure_keyword_indexes(self, collection: str, fields: list[str]) -> None:
+        info = await self.client.get_collection(collection)
+        missing = [field for field in fields if field not in info.payload_schema]
+        if missing:
+            await self._create_keyword_indexes(collection, missing)
+            logger.info(f"Added payload indexes {missing} to collection: {collection}")
+
     async def upsert(
         self,
         collection: str,
@@ -179,11 +211,7 @@ class QdrantManager:
             raise VectorStoreError(f"Failed to delete from {collection}", cause=e)
 
     def _build_filter(self, conditions: dict[str, Any]) -> models.Filter:
-        must_conditions = [
-            models.FieldCondition(key=key, match=models.MatchValue(value=value))
-            for key, value in conditions.items()
-        ]
-        return models.Filter(must=must_conditions)
+        return _match_filter(tuple(sorted(conditions.items())))
 
     async def file_needs_update(self, collection: str, file_path: str, content_hash: str) -> bool:
         try:
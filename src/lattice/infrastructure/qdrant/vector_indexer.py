@@ -3,7 +3,7 @@ import uuid
 from collections.abc import Callable
 
 from lattice.infrastructure.llm import BaseEmbeddingProvider
-from lattice.infrastructure.qdrant.chunker import chunk_file
+from lattice.infrastructure.qdrant.chunker import chunk_file, parent_directories
 from lattice.infrastructure.qdrant.client import CollectionName, QdrantManager
 from lattice.infrastructure.qdrant.embedder import embed_with_progress
 from lattice.parsing.api import ParsedFile
@@ -107,6 +107,7 @@ class VectorIndexer:
 
             payload = {
                 "file_path": file_path,
+                "dir_path": parent_directories(file_path),
                 "entity_type": entity_type,
                 "entity_name": entity_name,
                 "summary": summary,
@@ -24,7 +24,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from lattice.mcp.tools import (
     create_code_retrieval_tool,
@@ -33,6 +33,9 @@ from lattice.mcp.tools import (
     create_semantic_search_tool,
 )
 
+if TYPE_CHECKING:
+    from lattice.querying import QueryEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,11 +63,13 @@ class MCPServer:
         self.project_name = project_name
         self.tools: dict[str, dict[str, Any]] = {}
         self._running = False
+        self._query_engine: QueryEngine | None = None
+        self._query_engine_lock = asyncio.Lock()
 
         self._register_tools()
 
     def _register_tools(self) -> None:
-        index_tool = create_index_tool(self._create_orchestrator)
+        index_tool = create_index_tool(self._create_orchestrator, self._invalidate_answers)
         self.tools[index_tool["name"]] = index_tool
 
         query_tool = create_query_tool(self._create_query_engine)
@@ -86,10 +91,20 @@ class MCPServer:
 
         return await create_pipeline_orchestrator(repo_path=repo_path, project_name=project_name)
 
-    async def _create_query_engine(self):
-        from lattice.cli.bootstrap import create_query_engine
+    async def _create_query_engine(self) -> QueryEngine:
+        if self._query_engine is not None:
+            return self._query_engine
+
+        async with self._query_engine_lock:
+            if self._query_engine is None:
+                from lattice.cli.bootstrap import create_query_engine
+
+                self._query_engine = await create_query_engine()
+            return self._query_engine
 
-        return await create_query_engine()
+    def _invalidate_answers(self) -> None:
+        if self._query_engine is not None:
+            self._query_engine.bump_version()
 
     def _create_graph_client(self):
         from lattice.infrastructure.memgraph import MemgraphClient
@@ -296,6 +311,10 @@ class MCPServer:
             except Exception as e:
                 logger.error(f"Error in stdio loop: {e}", exc_info=True)
 
+        if self._query_engine is not None:
+            await self._query_engine.close()
+            self._query_engine = None
+
         logger.info("MCP server stopped")
 
 
@@ -315,4 +334,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from lattice.shared.event_loop import use_fast_event_loop
+
+    use_fast_event_loop()
     asyncio.run(main())
@@ -14,11 +14,13 @@ logger = logging.getLogger(__name__)
 
 def create_index_tool(
     orchestrator_factory: Callable[..., Any],
+    on_indexed: Callable[[], None] | None = None,
 ) -> dict[str, Any]:
     """Create the index_repository tool.
 
     Args:
-        orchestrator_factory: Factory function to create PipelineOrchestrator.
+        orchestrator_factory: Async factory returning a PipelineOrchestrator.
+        on_indexed: Called after a successful run, e.g. to drop cached answers.
 
     Returns:
         Tool definition dict for MCP registration.
@@ -52,9 +54,11 @@ def create_index_tool(
                 )
 
             name = project_name or path.name
-            orchestrator = orchestrator_factory(path, name)
+            orchestrator = await orchestrator_factory(path, name)
 
             stats = await orchestrator.run()
+            if on_indexed is not None:
+                on_indexed()
 
             return ToolResult(
                 success=True,
@@ -17,7 +17,7 @@ def create_query_tool(
     """Create the query_code_graph tool.
 
     Args:
-        query_engine_factory: Factory function to create QueryEngine.
+        query_engine_factory: Async factory returning the shared QueryEngine.
 
     Returns:
         Tool definition dict for MCP registration.
@@ -49,7 +49,7 @@ def create_query_tool(
         logger.info(f"[Tool:Query] Question: '{question}'")
 
         try:
-            engine = query_engine_factory()
+            engine = await query_engine_factory()
             result = await engine.query(question, limit=limit)
 
             sources = [
@@ -66,9 +66,7 @@ def create_query_tool(
                 data={
                     "answer": result.answer,
                     "sources": sources,
-                    "query_type": result.query_analysis.query_type.value
-                    if result.query_analysis
-                    else None,
+                    "query_type": result.query_plan.primary_intent.value,
                 },
                 message=f"Found {len(result.sources)} relevant code sections.",
             )
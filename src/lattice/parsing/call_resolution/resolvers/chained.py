@@ -113,5 +113,5 @@ def _infer_expression_type(
         return local_var_types[expr]
     if "(" in expr:
         if type_inference:
-            return type_inference._infer_method_call_return_type(expr, module_qn, local_var_types)
+            return type_inference.infer_method_call_return_type(expr, module_qn, local_var_types)
     return None
@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from tree_sitter import Tree
 
 from lattice.shared.types import EntityType, Language
 
@@ -48,6 +49,8 @@ class ParsedFile(BaseModel):
     entities: list[CodeEntity] = Field(default_factory=list)
     summary: str | None = None
 
+    _tree: Tree | None = PrivateAttr(default=None)
+
     @property
     def all_entities(self) -> list[CodeEntity]:
         result = []
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import hashlib
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
@@ -11,10 +11,11 @@ from lattice.parsing.extractors.javascript import JavaScriptExtractor
 from lattice.parsing.extractors.python import PythonExtractor
 from lattice.parsing.extractors.typescript import TypeScriptExtractor
 from lattice.parsing.models import CodeEntity, FileInfo, ImportInfo, ParsedFile
+from lattice.shared.hashing import compute_content_hash
 from lattice.shared.types import Language
 
 if TYPE_CHECKING:
-    from tree_sitter import Parser
+    from tree_sitter import Parser, Tree
 
 
 def create_default_extractors() -> dict[Language, BaseExtractor]:
@@ -31,6 +32,52 @@ def create_code_parser() -> CodeParser:
     return CodeParser(extractors=create_default_extractors())
 
 
+def _common_prefix_length(left: bytes, right: bytes) -> int:
+    left_view, right_view = memoryview(left), memoryview(right)
+    low, high = 0, min(len(left), len(right))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if left_view[:middle] == right_view[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(left: bytes, right: bytes, limit: int) -> int:
+    left_view, right_view = memoryview(left), memoryview(right)
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if left_view[len(left) - middle :] == right_view[len(right) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _point_at(source: bytes, offset: int) -> tuple[int, int]:
+    row = source.count(b"\n", 0, offset)
+    line_start = source.rfind(b"\n", 0, offset) + 1
+    return row, offset - line_start
+
+
+def _apply_edit(tree: Tree, old_source: bytes, new_source: bytes) -> None:
+    start = _common_prefix_length(old_source, new_source)
+    suffix_limit = min(len(old_source), len(new_source)) - start
+    suffix = _common_suffix_length(old_source, new_source, suffix_limit)
+    old_end = len(old_source) - suffix
+    new_end = len(new_source) - suffix
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old_source, start),
+        old_end_point=_point_at(old_source, old_end),
+        new_end_point=_point_at(new_source, new_end),
+    )
+
+
 class CodeParser:
     LANGUAGE_MAP: ClassVar[dict[Language, str]] = {
         Language.PYTHON: "python",
@@ -44,38 +91,75 @@ class CodeParser:
         self,
         extractors: dict[Language, BaseExtractor],
     ) -> None:
-        self._parsers: dict[str, Parser] = {}
+        self._thread_local = threading.local()
         self._extractors = extractors
 
     def _get_parser(self, language: Language) -> Parser:
         lang_id = self.LANGUAGE_MAP.get(language)
-        if lang_id not in self._parsers:
-            self._parsers[lang_id] = get_parser(lang_id)
-        return self._parsers[lang_id]
+        parsers: dict[str, Parser] | None = getattr(self._thread_local, "parsers", None)
+        if parsers is None:
+            parsers = self._thread_local.parsers = {}
+        if lang_id not in parsers:
+            parsers[lang_id] = get_parser(lang_id)
+        return parsers[lang_id]
 
     def _get_extractor(self, language: Language) -> BaseExtractor:
         return self._extractors[language]
 
     def _parse_and_extract(
         self, content: str, language: Language
-    ) -> tuple[list[ImportInfo], list[CodeEntity]]:
+    ) -> tuple[Tree, list[ImportInfo], list[CodeEntity]]:
         parser = self._get_parser(language)
         tree = parser.parse(content.encode("utf-8"))
         extractor = self._get_extractor(language)
         imports = extractor.extract_imports(tree.root_node, content)
         entities = extractor.extract_entities(tree.root_node, content)
-        return imports, entities
+        return tree, imports, entities
+
+    def parse_file(self, file_info: FileInfo, keep_tree: bool = False) -> ParsedFile:
+        """Parse a file from disk.
 
-    def parse_file(self, file_info: FileInfo) -> ParsedFile:
+        With keep_tree the ParsedFile holds on to its syntax tree. Leave it off
+        when the result crosses a process boundary, since trees cannot be pickled.
+        """
         content = file_info.path.read_text(encoding="utf-8", errors="replace")
-        imports, entities = self._parse_and_extract(content, file_info.language)
+        tree, imports, entities = self._parse_and_extract(content, file_info.language)
 
-        return ParsedFile(
+        parsed_file = ParsedFile(
             file_info=file_info,
             content=content,
             imports=imports,
             entities=entities,
         )
+        if keep_tree:
+            parsed_file._tree = tree
+        return parsed_file
+
+    def reparse_file(self, file_info: FileInfo, previous: ParsedFile | None) -> ParsedFile:
+        """Parse a file, reusing unchanged subtrees from a previous parse when possible.
+
+        The previous tree is edited in place and must not be used afterwards.
+        The returned ParsedFile keeps its tree for the next reparse.
+        """
+        content = file_info.path.read_text(encoding="utf-8", errors="replace")
+        source = content.encode("utf-8")
+        parser = self._get_parser(file_info.language)
+
+        if previous is not None and previous._tree is not None:
+            _apply_edit(previous._tree, previous.content.encode("utf-8"), source)
+            tree = parser.parse(source, previous._tree)
+        else:
+            tree = parser.parse(source)
+
+        extractor = self._get_extractor(file_info.language)
+        parsed_file = ParsedFile(
+            file_info=file_info,
+            content=content,
+            imports=extractor.extract_imports(tree.root_node, content),
+            entities=extractor.extract_entities(tree.root_node, content),
+        )
+        parsed_file._tree = tree
+        return parsed_file
 
     def parse_content(
         self,
@@ -87,12 +171,12 @@ class CodeParser:
             path=Path(file_path),
             relative_path=file_path,
             language=language,
-            content_hash=hashlib.sha256(content.encode()).hexdigest(),
+            content_hash=compute_content_hash(content.encode()),
             size_bytes=len(content.encode()),
             line_count=content.count("\n") + 1,
         )
 
-        imports, entities = self._parse_and_extract(content, language)
+        _, imports, entities = self._parse_and_extract(content, language)
 
         return ParsedFile(
             file_info=file_info,
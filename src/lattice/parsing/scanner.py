@@ -1,4 +1,3 @@
-import hashlib
 from collections.abc import Iterator
 from dataclasses import dataclass
 from fnmatch import fnmatch
@@ -6,6 +5,7 @@ from pathlib import Path
 
 from lattice.parsing.models import FileInfo
 from lattice.shared.config import get_settings
+from lattice.shared.hashing import compute_content_hash
 from lattice.shared.types import Language
 
 
@@ -41,7 +41,7 @@ class FileScanner:
         return False
 
     def _compute_hash(self, content: bytes) -> str:
-        return hashlib.sha256(content).hexdigest()
+        return compute_content_hash(content)
 
     def scan(self) -> Iterator[FileInfo]:
         for file_path in self.root_path.rglob("*"):
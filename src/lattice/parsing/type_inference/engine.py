@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from lattice.parsing.type_inference.js_ts_inference import JsTsTypeInference
 from lattice.parsing.type_inference.python_traversal import PythonTraversal
 from lattice.parsing.type_inference.type_resolver import TypeResolver
-from lattice.shared.cache import ASTCache, FunctionRegistry
+from lattice.shared.cache import ASTCache, FunctionRegistry, PersistentCache
 
 if TYPE_CHECKING:
     from tree_sitter import Node
@@ -23,6 +23,7 @@ class TypeInferenceEngine:
         ast_cache: ASTCache,
         module_qn_to_file_path: dict[str, Path],
         simple_name_lookup: dict[str, set[str]],
+        return_type_store: PersistentCache | None = None,
     ):
         self.function_registry = function_registry
         self.import_mapping = import_mapping
@@ -36,6 +37,7 @@ class TypeInferenceEngine:
             ast_cache=self.ast_cache,
             module_qn_to_file_path=self.module_qn_to_file_path,
             simple_name_lookup=self.simple_name_lookup,
+            return_type_store=return_type_store,
         )
         self._python_traversal = PythonTraversal(type_resolver=self._type_resolver)
         self._js_ts_inference = JsTsTypeInference(type_resolver=self._type_resolver)
@@ -58,3 +60,13 @@ class TypeInferenceEngine:
         except Exception as e:
             logger.debug(f"Failed to build local variable type map: {e}")
         return local_var_types
+
+    def infer_method_call_return_type(
+        self,
+        method_call: str,
+        module_qn: str,
+        local_var_types: dict[str, str] | None = None,
+    ) -> str | None:
+        return self._type_resolver.infer_method_call_return_type(
+            method_call, module_qn, local_var_types
+        )
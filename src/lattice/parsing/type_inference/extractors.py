@@ -10,7 +10,7 @@ if TYPE_CHECKING:
 
 def collect_assignments(node: Node) -> list[Node]:
     assignments = []
-    stack = [node]
+    stack = list(reversed(node.children))
 
     while stack:
         current = stack.pop()
@@ -51,3 +51,26 @@ def find_init_method(class_node: Node) -> Node | None:
                     return child
 
     return None
+
+
+def find_method_definition(root: Node, class_name: str, method_name: str) -> Node | None:
+    class_node = _find_named_definition(root, "class_definition", class_name)
+    if not class_node:
+        return None
+    body = class_node.child_by_field_name("body")
+    if not body:
+        return None
+    return _find_named_definition(body, "function_definition", method_name)
+
+
+def _find_named_definition(parent: Node, node_type: str, name: str) -> Node | None:
+    for child in parent.children:
+        definition = child
+        if child.type == "decorated_definition":
+            definition = child.child_by_field_name("definition") or child
+        if definition.type != node_type:
+            continue
+        name_node = definition.child_by_field_name("name")
+        if name_node and get_node_text(name_node) == name:
+            return definition
+    return None
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+from lattice.parsing.type_inference.utils import NodeTextCache
+
 
 class TypeSource(Enum):
     ANNOTATION = "annotation"
@@ -74,6 +76,8 @@ class TypeInferenceContext:
     class_name: str | None = None
     function_name: str | None = None
     local_types: VariableTypeMap = field(default_factory=VariableTypeMap)
+    text_cache: NodeTextCache = field(default_factory=NodeTextCache)
+    imports: dict[str, str] | None = None
 
     @property
     def class_qn(self) -> str | None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from lattice.parsing.type_inference.extractors import collect_assignments
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_IN_PROGRESS: ContextVar[set[str]] = ContextVar("python_type_inference_in_progress")
+
 
 class PythonTypeInference:
     def __init__(
@@ -31,7 +34,6 @@ class PythonTypeInference:
         self.function_registry = function_registry
         self.import_mapping = import_mapping or {}
         self._return_type_cache: dict[str, str | None] = {}
-        self._in_progress: set[str] = set()
 
     def infer_local_types(
         self,
@@ -40,26 +42,27 @@ class PythonTypeInference:
     ) -> VariableTypeMap:
         type_map = VariableTypeMap()
 
-        try:
-            infer_parameter_types(
-                function_node,
+        infer_parameter_types(
+            function_node,
+            type_map,
+            context,
+            self.import_mapping,
+            self.function_registry,
+        )
+
+        assignments = collect_assignments(function_node)
+
+        for assignment in assignments:
+            process_simple_assignment(
+                assignment,
                 type_map,
                 context,
                 self.import_mapping,
                 self.function_registry,
             )
 
-            assignments = collect_assignments(function_node)
-
-            for assignment in assignments:
-                process_simple_assignment(
-                    assignment,
-                    type_map,
-                    context,
-                    self.import_mapping,
-                    self.function_registry,
-                )
-
+        in_progress_token = _IN_PROGRESS.set(set())
+        try:
             for assignment in assignments:
                 process_complex_assignment(
                     assignment,
@@ -68,10 +71,24 @@ class PythonTypeInference:
                     self.import_mapping,
                     self.function_registry,
                     self._return_type_cache,
-                    self._in_progress,
+                    _IN_PROGRESS.get(),
                 )
+        except (RecursionError, KeyError, AttributeError) as e:
+            scope = context.function_qn or context.module_qn
+            logger.debug(f"Error inferring return types in {scope}: {e}")
+        finally:
+            _IN_PROGRESS.reset(in_progress_token)
 
-            infer_loop_variable_types(
+        infer_loop_variable_types(
+            function_node,
+            type_map,
+            context,
+            self.import_mapping,
+            self.function_registry,
+        )
+
+        if context.class_name:
+            infer_instance_attrs_from_init(
                 function_node,
                 type_map,
                 context,
@@ -79,16 +96,4 @@ class PythonTypeInference:
                 self.function_registry,
             )
 
-            if context.class_name:
-                infer_instance_attrs_from_init(
-                    function_node,
-                    type_map,
-                    context,
-                    self.import_mapping,
-                    self.function_registry,
-                )
-
-        except Exception as e:
-            logger.debug(f"Error inferring types: {e}")
-
         return type_map
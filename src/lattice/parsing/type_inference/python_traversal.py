@@ -2,26 +2,43 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from lattice.parsing.type_inference.type_resolver import TypeResolver, safe_decode_text
+from tree_sitter import Query
+from tree_sitter_language_pack import get_language
+
+from lattice.parsing.type_inference.type_resolver import TypeResolver
+from lattice.parsing.type_inference.utils import NodeTextCache, query_captures
 
 if TYPE_CHECKING:
     from tree_sitter import Node
 
+_TRAVERSAL_QUERY = """
+(assignment) @assignment
+(list_comprehension) @comprehension
+(for_statement) @for_statement
+"""
+_LIST_ELEMENT_QUERY = "(list (call function: (identifier) @class_name))"
+
 
 class PythonTraversal:
     def __init__(self, type_resolver: TypeResolver):
         self._type_resolver = type_resolver
+        self._text_cache = NodeTextCache()
+        self._text = self._text_cache.get
+        python = get_language("python")
+        self._traversal_query = Query(python, _TRAVERSAL_QUERY)
+        self._list_element_query = Query(python, _LIST_ELEMENT_QUERY)
 
     def infer_parameter_types(
         self, caller_node: Node, local_var_types: dict[str, str], module_qn: str
     ) -> None:
+        self._text_cache.clear()
         params_node = caller_node.child_by_field_name("parameters")
         if not params_node:
             return
 
         for param in params_node.children:
             if param.type == "identifier":
-                param_name = safe_decode_text(param)
+                param_name = self._text(param)
                 if param_name and param_name not in ("self", "cls"):
                     inferred = self._type_resolver.infer_type_from_parameter_name(
                         param_name, module_qn
@@ -32,64 +49,65 @@ class PythonTraversal:
                 name_node = param.child_by_field_name("name")
                 type_node = param.child_by_field_name("type")
                 if name_node and type_node:
-                    param_name = safe_decode_text(name_node)
-                    param_type = safe_decode_text(type_node)
+                    param_name = self._text(name_node)
+                    param_type = self._text(type_node)
                     if param_name and param_type:
                         local_var_types[param_name] = param_type
 
     def traverse_single_pass(
         self, node: Node, local_var_types: dict[str, str], module_qn: str
     ) -> None:
-        assignments, comprehensions, for_statements = [], [], []
-
-        stack: list[Node] = [node]
-        while stack:
-            current = stack.pop()
-            node_type = current.type
-            if node_type == "assignment":
-                assignments.append(current)
-            elif node_type == "list_comprehension":
-                comprehensions.append(current)
-            elif node_type == "for_statement":
-                for_statements.append(current)
-            stack.extend(reversed(current.children))
-
-        for assign in assignments:
-            self._process_assignment_simple(assign, local_var_types, module_qn)
-        for assign in assignments:
-            self._process_assignment_complex(assign, local_var_types, module_qn)
+        self._text_cache.clear()
+        captures = query_captures(self._traversal_query, node)
+        assignments = captures.get("assignment", [])
+        comprehensions = captures.get("comprehension", [])
+        for_statements = captures.get("for_statement", [])
+
+        variable_assignments, attribute_assignments = self._split_assignments(assignments)
+        for var_name, right in variable_assignments:
+            self._process_assignment_simple(var_name, right, local_var_types, module_qn)
+        for var_name, right in variable_assignments:
+            self._process_assignment_complex(var_name, right, local_var_types, module_qn)
         for comp in comprehensions:
             self._analyze_comprehension(comp, local_var_types, module_qn)
         for for_stmt in for_statements:
             self._analyze_for_loop(for_stmt, local_var_types, module_qn)
-        self._infer_instance_attrs(assignments, local_var_types, module_qn)
+        self._infer_instance_attrs(attribute_assignments, local_var_types, module_qn)
+
+    def _split_assignments(
+        self, assignments: list[Node]
+    ) -> tuple[list[tuple[str, Node]], list[tuple[Node, Node]]]:
+        variable_assignments: list[tuple[str, Node]] = []
+        attribute_assignments: list[tuple[Node, Node]] = []
+        for assign in assignments:
+            left = assign.child_by_field_name("left")
+            right = assign.child_by_field_name("right")
+            if not left or not right:
+                continue
+            if left.type == "identifier":
+                var_name = self._text(left)
+                if var_name:
+                    variable_assignments.append((var_name, right))
+            elif left.type == "attribute":
+                attribute_assignments.append((left, right))
+        return variable_assignments, attribute_assignments
 
     def _process_assignment_simple(
-        self, node: Node, local_var_types: dict[str, str], module_qn: str
+        self, var_name: str, right: Node, local_var_types: dict[str, str], module_qn: str
     ) -> None:
-        left, right = node.child_by_field_name("left"), node.child_by_field_name("right")
-        if not left or not right:
-            return
-        var_name = safe_decode_text(left) if left.type == "identifier" else None
-        if not var_name:
-            return
         inferred = self._infer_simple_type(right, module_qn)
         if inferred:
             local_var_types[var_name] = inferred
 
     def _process_assignment_complex(
-        self, node: Node, local_var_types: dict[str, str], module_qn: str
+        self, var_name: str, right: Node, local_var_types: dict[str, str], module_qn: str
     ) -> None:
-        left, right = node.child_by_field_name("left"), node.child_by_field_name("right")
-        if not left or not right:
-            return
-        var_name = safe_decode_text(left) if left.type == "identifier" else None
-        if not var_name or var_name in local_var_types:
+        if var_name in local_var_types:
             return
         if right.type == "call":
             func_node = right.child_by_field_name("function")
             if func_node and func_node.type == "attribute":
-                method_text = safe_decode_text(func_node)
+                method_text = self._text(func_node)
                 if method_text:
                     inferred = self._type_resolver.infer_method_call_return_type(
                         method_text, module_qn, local_var_types
@@ -101,7 +119,7 @@ class PythonTraversal:
         if node.type == "call":
             func_node = node.child_by_field_name("function")
             if func_node and func_node.type == "identifier":
-                class_name = safe_decode_text(func_node)
+                class_name = self._text(func_node)
                 if class_name and class_name[0].isupper():
                     return class_name
         elif node.type == "list_comprehension":
@@ -135,7 +153,7 @@ class PythonTraversal:
         local_var_types: dict[str, str],
         module_qn: str,
     ) -> None:
-        loop_var = safe_decode_text(left) if left.type == "identifier" else None
+        loop_var = self._text(left) if left.type == "identifier" else None
         if not loop_var:
             return
         elem_type = self._infer_iterable_element_type(right, local_var_types, module_qn)
@@ -146,15 +164,16 @@ class PythonTraversal:
         self, node: Node, local_var_types: dict[str, str], module_qn: str
     ) -> str | None:
         if node.type == "list":
-            for child in node.children:
-                if child.type == "call":
-                    func_node = child.child_by_field_name("function")
-                    if func_node and func_node.type == "identifier":
-                        class_name = safe_decode_text(func_node)
-                        if class_name and class_name[0].isupper():
-                            return class_name
+            captures = query_captures(self._list_element_query, node)
+            for func_node in captures.get("class_name", []):
+                call_node = func_node.parent
+                if not call_node or call_node.parent != node:
+                    continue
+                class_name = self._text(func_node)
+                if class_name and class_name[0].isupper():
+                    return class_name
         elif node.type == "identifier":
-            var_name = safe_decode_text(node)
+            var_name = self._text(node)
             if var_name and var_name in local_var_types:
                 var_type = local_var_types[var_name]
                 if var_type and var_type != "list":
@@ -162,14 +181,14 @@ class PythonTraversal:
         return None
 
     def _infer_instance_attrs(
-        self, assignments: list[Node], local_var_types: dict[str, str], module_qn: str
+        self,
+        attribute_assignments: list[tuple[Node, Node]],
+        local_var_types: dict[str, str],
+        module_qn: str,
     ) -> None:
-        for assign in assignments:
-            left = assign.child_by_field_name("left")
-            right = assign.child_by_field_name("right")
-            if left and right and left.type == "attribute":
-                left_text = safe_decode_text(left)
-                if left_text and left_text.startswith("self."):
-                    assigned_type = self._infer_simple_type(right, module_qn)
-                    if assigned_type:
-                        local_var_types[left_text] = assigned_type
+        for left, right in attribute_assignments:
+            left_text = self._text(left)
+            if left_text and left_text.startswith("self."):
+                assigned_type = self._infer_simple_type(right, module_qn)
+                if assigned_type:
+                    local_var_types[left_text] = assigned_type
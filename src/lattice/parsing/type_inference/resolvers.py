@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from lattice.parsing.type_inference.models import (
@@ -8,22 +9,29 @@ from lattice.parsing.type_inference.models import (
     TypeSource,
     VariableTypeMap,
 )
-from lattice.parsing.type_inference.utils import get_node_text
 
 if TYPE_CHECKING:
     from tree_sitter import Node
 
 
+def module_imports(
+    context: TypeInferenceContext,
+    import_mapping: dict[str, dict[str, str]],
+) -> dict[str, str]:
+    if context.imports is None:
+        context.imports = import_mapping.get(context.module_qn, {})
+    return context.imports
+
+
 def resolve_type_name(
     type_name: str,
     context: TypeInferenceContext,
     import_mapping: dict[str, dict[str, str]],
     function_registry: Any,
 ) -> str | None:
-    if context.module_qn in import_mapping:
-        imports = import_mapping[context.module_qn]
-        if type_name in imports:
-            return imports[type_name]
+    imported_qn = module_imports(context, import_mapping).get(type_name)
+    if imported_qn:
+        return imported_qn
 
     local_qn = f"{context.module_qn}.{type_name}"
     if function_registry and local_qn in function_registry:
@@ -38,18 +46,20 @@ def resolve_type_name(
     return None
 
 
+@lru_cache(maxsize=4096)
+def _snake_to_camel(name: str) -> str:
+    if "_" in name:
+        return "".join(part.capitalize() for part in name.split("_"))
+    return name.capitalize()
+
+
 def infer_type_from_name(
     name: str,
     context: TypeInferenceContext,
     import_mapping: dict[str, dict[str, str]],
     function_registry: Any,
 ) -> InferredType | None:
-    if "_" in name:
-        parts = name.split("_")
-        class_name = "".join(p.capitalize() for p in parts)
-    else:
-        class_name = name.capitalize()
-
+    class_name = _snake_to_camel(name)
     resolved = resolve_type_name(class_name, context, import_mapping, function_registry)
     if resolved:
         return InferredType(
@@ -69,19 +79,18 @@ def get_receiver_type(
     import_mapping: dict[str, dict[str, str]],
 ) -> str | None:
     if object_node.type == "identifier":
-        var_name = get_node_text(object_node)
+        var_name = context.text_cache.get(object_node)
         if var_name:
-            if var_name in type_map:
-                inferred = type_map[var_name]
+            inferred = type_map.get_type(var_name)
+            if inferred is not None:
                 return inferred.qualified_name or inferred.type_name
 
             if var_name == "self" and context.class_qn:
                 return context.class_qn
 
-            if context.module_qn in import_mapping:
-                imports = import_mapping[context.module_qn]
-                if var_name in imports:
-                    return imports[var_name]
+            imported_qn = module_imports(context, import_mapping).get(var_name)
+            if imported_qn:
+                return imported_qn
 
     elif object_node.type == "attribute":
         return resolve_attribute_type(object_node, type_map, context)
@@ -100,12 +109,12 @@ def resolve_attribute_type(
     if not object_node or not attr_name_node:
         return None
 
-    attr_name = get_node_text(attr_name_node)
+    attr_name = context.text_cache.get(attr_name_node)
     if not attr_name:
         return None
 
     if object_node.type == "identifier":
-        obj_name = get_node_text(object_node)
+        obj_name = context.text_cache.get(object_node)
         if obj_name == "self":
             attr_type = type_map.get_instance_attr(attr_name)
             if attr_type:
@@ -1,27 +1,38 @@
 from __future__ import annotations
 
 import logging
-import re
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from lattice.shared.cache import ASTCache, FunctionRegistry
+from lattice.parsing.type_inference.extractors import find_method_definition
+from lattice.shared.cache import ASTCache, FunctionRegistry, PersistentCache
 
 if TYPE_CHECKING:
     from tree_sitter import Node
 
 logger = logging.getLogger(__name__)
 
-_RE_METHOD_CHAIN = re.compile(r"\)\.[^)]*$")
-_RE_FINAL_METHOD = re.compile(r"\.([^.()]+)$")
+_MISSING = object()
 
 
 def safe_decode_text(node: Node) -> str | None:
     if node.text:
-        return node.text.decode("utf-8")
+        text = node.text.decode("utf-8")
+        return sys.intern(text) if text.isidentifier() else text
     return None
 
 
+def _index_classes_by_module(function_registry: FunctionRegistry) -> dict[str, list[str]]:
+    module_to_classes: dict[str, list[str]] = {}
+    for qn, entity_type in function_registry.items():
+        if entity_type == "Class":
+            parent, _, class_name = qn.rpartition(".")
+            if parent:
+                module_to_classes.setdefault(parent, []).append(class_name)
+    return module_to_classes
+
+
 class TypeResolver:
     def __init__(
         self,
@@ -30,6 +41,7 @@ class TypeResolver:
         ast_cache: ASTCache,
         module_qn_to_file_path: dict[str, Path],
         simple_name_lookup: dict[str, set[str]],
+        return_type_store: PersistentCache | None = None,
     ):
         self.function_registry = function_registry
         self.import_mapping = import_mapping
@@ -37,41 +49,65 @@ class TypeResolver:
         self.module_qn_to_file_path = module_qn_to_file_path
         self.simple_name_lookup = simple_name_lookup
         self._method_return_type_cache: dict[str, str | None] = {}
+        self._return_type_store = return_type_store
+        self._registry_hash: str | None = None
         self._type_inference_in_progress: set[str] = set()
+        self._module_to_classes = _index_classes_by_module(function_registry)
+        self._flat_imports = {
+            (module, local_name): imported_qn
+            for module, imports in import_mapping.items()
+            for local_name, imported_qn in imports.items()
+        }
+        self._unique_simple_names = {
+            name: next(iter(matches))
+            for name, matches in simple_name_lookup.items()
+            if len(matches) == 1
+        }
+        self._classes_in_scope_cache: dict[str, list[tuple[str, str]]] = {}
+        self._parameter_type_cache: dict[tuple[str, str], str | None] = {}
 
     def infer_type_from_parameter_name(self, param_name: str, module_qn: str) -> str | None:
-        available_class_names = []
-
-        for qn, entity_type in self.function_registry.all_entries().items():
-            if entity_type == "Class" and qn.startswith(module_qn + "."):
-                remaining = qn[len(module_qn) + 1 :]
-                if "." not in remaining:
-                    available_class_names.append(remaining)
-
-        if module_qn in self.import_mapping:
-            for local_name, imported_qn in self.import_mapping[module_qn].items():
-                if self.function_registry.get(imported_qn) == "Class":
-                    available_class_names.append(local_name)
+        key = (param_name, module_qn)
+        if key in self._parameter_type_cache:
+            return self._parameter_type_cache[key]
 
         param_lower = param_name.lower()
+        param_length = len(param_lower)
         best_match = None
         highest_score = 0
 
-        for class_name in available_class_names:
-            class_lower = class_name.lower()
+        for class_name, class_lower in self._classes_in_scope(module_qn):
             score = 0
             if param_lower == class_lower:
                 score = 100
             elif class_lower.endswith(param_lower) or param_lower.endswith(class_lower):
                 score = 90
             elif class_lower in param_lower:
-                score = int(80 * (len(class_lower) / len(param_lower)))
+                score = int(80 * (len(class_lower) / param_length))
 
             if score > highest_score:
                 highest_score = score
                 best_match = class_name
+                if score == 100:
+                    break
+
+        result = best_match if highest_score > 50 else None
+        self._parameter_type_cache[key] = result
+        return result
+
+    def _classes_in_scope(self, module_qn: str) -> list[tuple[str, str]]:
+        if module_qn in self._classes_in_scope_cache:
+            return self._classes_in_scope_cache[module_qn]
+
+        available_class_names = list(self._module_to_classes.get(module_qn, ()))
 
-        return best_match if highest_score > 50 else None
+        for local_name, imported_qn in self.import_mapping.get(module_qn, {}).items():
+            if self.function_registry.get(imported_qn) == "Class":
+                available_class_names.append(local_name)
+
+        classes = [(name, name.lower()) for name in available_class_names]
+        self._classes_in_scope_cache[module_qn] = classes
+        return classes
 
     def infer_method_call_return_type(
         self,
@@ -93,9 +129,10 @@ class TypeResolver:
             self._type_inference_in_progress.discard(cache_key)
 
     def _is_method_chain(self, call_name: str) -> bool:
-        if "(" in call_name and ")" in call_name:
-            return bool(_RE_METHOD_CHAIN.search(call_name))
-        return False
+        if "(" not in call_name:
+            return False
+        chain_index = call_name.rfind(").")
+        return chain_index != -1 and ")" not in call_name[chain_index + 2 :]
 
     def _infer_chained_call_return_type(
         self,
@@ -103,12 +140,12 @@ class TypeResolver:
         module_qn: str,
         local_var_types: dict[str, str] | None = None,
     ) -> str | None:
-        match = _RE_FINAL_METHOD.search(call_name)
-        if not match:
+        dot_index = call_name.rfind(".")
+        final_method = call_name[dot_index + 1 :]
+        if dot_index == -1 or not final_method or "(" in final_method or ")" in final_method:
             return None
 
-        final_method = match.group(1)
-        object_expr = call_name[: match.start()]
+        object_expr = call_name[:dot_index]
         object_type = self._infer_object_type_for_chained_call(
             object_expr, module_qn, local_var_types
         )
@@ -136,15 +173,14 @@ class TypeResolver:
         module_qn: str,
         local_var_types: dict[str, str] | None = None,
     ) -> str | None:
-        if "." not in method_call:
-            return None
-
-        parts = method_call.split(".")
-        if len(parts) < 2:
+        last_dot = method_call.rfind(".")
+        if last_dot == -1:
             return None
 
-        class_name = parts[0]
-        method_name = parts[-1].split("(")[0] if "(" in parts[-1] else parts[-1]
+        first_dot = method_call.find(".")
+        class_name = method_call[:first_dot]
+        paren = method_call.find("(", last_dot + 1)
+        method_name = method_call[last_dot + 1 : paren if paren != -1 else None]
 
         if local_var_types and class_name in local_var_types:
             var_type = local_var_types[class_name]
@@ -158,20 +194,72 @@ class TypeResolver:
         return None
 
     def _get_method_return_type_from_registry(self, method_qn: str) -> str | None:
-        if method_qn in self._method_return_type_cache:
-            return self._method_return_type_cache[method_qn]
-        self._method_return_type_cache[method_qn] = None
-        return None
+        cached = self._method_return_type_cache.get(method_qn, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
+        return_type = None
+        if method_qn in self.function_registry:
+            return_type = self._load_return_type(method_qn)
+        self._method_return_type_cache[method_qn] = return_type
+        return return_type
+
+    def _load_return_type(self, method_qn: str) -> str | None:
+        store = self._return_type_store
+        store_key = self._return_type_store_key(method_qn) if store is not None else None
+        if store is not None and store_key is not None and store_key in store:
+            cached: str | None = store[store_key]
+            return cached
+
+        class_qn = method_qn.rpartition(".")[0]
+        root_node = self._module_root(class_qn.rpartition(".")[0])
+        if root_node is None:
+            # Without the AST the return type is unknown, not absent; keep it out of the store.
+            return None
+        return_type = self._read_return_annotation(root_node, method_qn)
+        if store is not None and store_key is not None:
+            store[store_key] = return_type
+        return return_type
+
+    def _return_type_store_key(self, method_qn: str) -> str | None:
+        module_qn = method_qn.rpartition(".")[0].rpartition(".")[0]
+        file_path = self.module_qn_to_file_path.get(module_qn)
+        if not file_path:
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if self._registry_hash is None:
+            self._registry_hash = self.function_registry.version_hash()
+        return f"{self._registry_hash}:{method_qn}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _module_root(self, module_qn: str) -> Node | None:
+        file_path = self.module_qn_to_file_path.get(module_qn)
+        if not file_path:
+            return None
+        cached_ast = self.ast_cache.get(file_path)
+        if not cached_ast:
+            return None
+        root_node: Node = cached_ast[0]
+        return root_node
+
+    def _read_return_annotation(self, root_node: Node, method_qn: str) -> str | None:
+        class_qn, _, method_name = method_qn.rpartition(".")
+        module_qn, _, class_name = class_qn.rpartition(".")
+        method_node = find_method_definition(root_node, class_name, method_name)
+        return_node = method_node.child_by_field_name("return_type") if method_node else None
+        annotation = safe_decode_text(return_node) if return_node else None
+        if not annotation:
+            return None
+        annotation = annotation.strip("\"'")
+        return self.resolve_class_name(annotation, module_qn) or annotation
 
     def resolve_class_name(self, class_name: str, module_qn: str) -> str | None:
         local_qn = f"{module_qn}.{class_name}"
         if local_qn in self.function_registry:
             return local_qn
-        if module_qn in self.import_mapping:
-            if class_name in self.import_mapping[module_qn]:
-                return self.import_mapping[module_qn][class_name]
-        if class_name in self.simple_name_lookup:
-            matches = self.simple_name_lookup[class_name]
-            if len(matches) == 1:
-                return next(iter(matches))
-        return None
+        imported_qn = self._flat_imports.get((module_qn, class_name))
+        if imported_qn:
+            return imported_qn
+        return self._unique_simple_names.get(class_name)
@@ -1,12 +1,48 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
+import tree_sitter
+
 if TYPE_CHECKING:
-    from tree_sitter import Node
+    from tree_sitter import Node, Query
 
 
 def get_node_text(node: Node) -> str | None:
     if node.text:
-        return node.text.decode("utf-8")
+        text = node.text.decode("utf-8")
+        return sys.intern(text) if text.isidentifier() else text
     return None
+
+
+class NodeTextCache:
+    """Decodes each node's text once per tree.
+
+    Entries are keyed by byte span rather than node identity: the Python
+    bindings hand out fresh wrapper objects, and nodes sharing a span always
+    share their text. Clear the cache before moving on to another tree.
+    """
+
+    def __init__(self) -> None:
+        self._texts: dict[tuple[int, int], str | None] = {}
+
+    def get(self, node: Node) -> str | None:
+        key = (node.start_byte, node.end_byte)
+        try:
+            return self._texts[key]
+        except KeyError:
+            text = get_node_text(node)
+            self._texts[key] = text
+            return text
+
+    def clear(self) -> None:
+        self._texts.clear()
+
+
+def query_captures(query: Query, node: Node) -> dict[str, list[Node]]:
+    query_cursor = getattr(tree_sitter, "QueryCursor", None)
+    if query_cursor is None:
+        return query.captures(node)
+    captures: dict[str, list[Node]] = query_cursor(query).captures(node)
+    return captures
@@ -1,5 +1,6 @@
 """Service for cleaning up project data from databases."""
 
+import asyncio
 import logging
 
 from lattice.infrastructure.qdrant import CollectionName, QdrantManager, qdrant_models
@@ -14,24 +15,31 @@ class ProjectCleanupService:
     def __init__(self, qdrant: QdrantManager):
         self._qdrant = qdrant
 
-    async def delete_from_qdrant(self, path: str) -> int:
-        total_deleted = 0
+    async def delete_from_qdrant(self, path: str) -> None:
+        collections = (CollectionName.CODE_CHUNKS, CollectionName.SUMMARIES)
+        results = await asyncio.gather(
+            *(self._delete_from_collection(c, path) for c in collections),
+            return_exceptions=True,
+        )
 
-        for collection in [CollectionName.CODE_CHUNKS, CollectionName.SUMMARIES]:
-            try:
-                deleted = await self._delete_from_collection(collection, path)
-                total_deleted += deleted
-                logger.info(f"Deleted {deleted} points from {collection.value} for path '{path}'")
-            except Exception as e:
+        failure: tuple[CollectionName, Exception] | None = None
+        for collection, result in zip(collections, results, strict=True):
+            if isinstance(result, Exception):
                 logger.error(
                     f"Failed to delete from collection {collection.value} for path '{path}'",
-                    exc_info=True,
+                    exc_info=result,
                 )
-                raise VectorStoreError(
-                    f"Failed to delete from collection {collection.value}", cause=e
-                ) from e
+                failure = failure or (collection, result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            logger.info(f"Deleted points from {collection.value} for path '{path}'")
 
-        return total_deleted
+        if failure is not None:
+            collection, error = failure
+            raise VectorStoreError(
+                f"Failed to delete from collection {collection.value}", cause=error
+            ) from error
 
     async def get_chunk_count(self, path: str) -> int:
         try:
@@ -45,27 +53,34 @@ class ProjectCleanupService:
             logger.warning(f"Failed to get chunk count for path '{path}'", exc_info=True)
             return 0
 
-    async def _delete_from_collection(self, collection: CollectionName, path: str) -> int:
-        filter_condition = self._build_path_filter(path)
-
+    async def _delete_from_collection(self, collection: CollectionName, path: str) -> None:
         await self._qdrant.client.delete(
             collection_name=collection.value,
-            points_selector=qdrant_models.FilterSelector(filter=filter_condition),
-        )
-
-        count_result = await self._qdrant.client.count(
-            collection_name=collection.value,
-            count_filter=filter_condition,
+            points_selector=qdrant_models.FilterSelector(filter=self._build_path_filter(path)),
         )
 
-        return count_result.count
-
     def _build_path_filter(self, path: str) -> qdrant_models.Filter:
         return qdrant_models.Filter(
-            must=[
+            should=[
                 qdrant_models.FieldCondition(
                     key="file_path",
-                    match=qdrant_models.MatchText(text=path),
-                )
+                    match=qdrant_models.MatchValue(value=path),
+                ),
+                qdrant_models.FieldCondition(
+                    key="dir_path",
+                    match=qdrant_models.MatchValue(value=path),
+                ),
+                # Points indexed before dir_path existed only carry file_path.
+                qdrant_models.Filter(
+                    must=[
+                        qdrant_models.IsEmptyCondition(
+                            is_empty=qdrant_models.PayloadField(key="dir_path"),
+                        ),
+                        qdrant_models.FieldCondition(
+                            key="file_path",
+                            match=qdrant_models.MatchText(text=path),
+                        ),
+                    ]
+                ),
             ]
         )
@@ -1,11 +1,16 @@
 from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 from typing import Any
 
 import yaml
 
 PROMPTS_DIR = Path(__file__).parent
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+TemplateSegments = tuple[tuple[str, str | None], ...]
+
 
 @lru_cache(maxsize=32)
 def load_prompts(category: str) -> dict[str, Any]:
@@ -13,21 +18,59 @@ def load_prompts(category: str) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Prompt file not found: {path}")
     with path.open() as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
-def get_prompt(category: str, name: str, **kwargs: Any) -> str:
+@lru_cache(maxsize=256)
+def _get_template(category: str, name: str) -> str:
     prompts = load_prompts(category)
     if name not in prompts:
         raise KeyError(f"Prompt '{name}' not found in category '{category}'")
 
     prompt_data = prompts[name]
-    template = prompt_data.get("template") if isinstance(prompt_data, dict) else prompt_data
+    return prompt_data.get("template") if isinstance(prompt_data, dict) else prompt_data
+
 
-    if kwargs:
-        return template.format(**kwargs)
-    return template
+@lru_cache(maxsize=256)
+def _compile_template(category: str, name: str) -> TemplateSegments | None:
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(
+        _get_template(category, name)
+    ):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+def _render(segments: TemplateSegments, values: dict[str, Any]) -> str:
+    parts = []
+    for literal, field_name in segments:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(format(values[field_name]))
+    return "".join(parts)
+
+
+def get_prompt(category: str, name: str, **kwargs: Any) -> str:
+    template = _get_template(category, name)
+    if not kwargs:
+        return template
+    segments = _compile_template(category, name)
+    if segments is None:
+        return template.format_map(kwargs)
+    return _render(segments, kwargs)
+
+
+def preload_prompts() -> None:
+    for path in PROMPTS_DIR.glob("*.yaml"):
+        load_prompts(path.stem)
 
 
 def clear_cache() -> None:
     load_prompts.cache_clear()
+    _get_template.cache_clear()
+    _compile_template.cache_clear()
+
+
+preload_prompts()
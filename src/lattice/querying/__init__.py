@@ -1,4 +1,5 @@
 from lattice.querying.api import (
+    AnswerCache,
     CodeSearchResult,
     CodeSnippet,
     ContextBuilder,
@@ -11,6 +12,7 @@ from lattice.querying.api import (
     GraphPath,
     GraphReasoningEngine,
     HybridRanker,
+    PlanCache,
     QueryEngine,
     QueryIntent,
     QueryPlan,
@@ -44,6 +46,7 @@ from lattice.querying.api import (
 )
 
 __all__ = [
+    "AnswerCache",
     "CodeSearchResult",
     "CodeSnippet",
     "ContextBuilder",
@@ -56,6 +59,7 @@ __all__ = [
     "GraphPath",
     "GraphReasoningEngine",
     "HybridRanker",
+    "PlanCache",
     "QueryEngine",
     "QueryIntent",
     "QueryPlan",
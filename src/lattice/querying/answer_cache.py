@@ -0,0 +1,90 @@
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+
+from lattice.querying.models import QueryResult
+from lattice.shared.config import QueryConfig
+
+logger = logging.getLogger(__name__)
+
+AnswerKey = tuple[str, str | None, str | None, int, bool]
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+class AnswerCache:
+    """LRU cache of query answers with a semantic fallback.
+
+    Lookups first try the exact normalized question. Failing that, the question
+    embedding is compared against cached questions asked with the same options,
+    and the closest answer above the similarity threshold is reused.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = QueryConfig.answer_cache_size,
+        similarity_threshold: float = QueryConfig.answer_cache_similarity,
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._entries: OrderedDict[AnswerKey, QueryResult] = OrderedDict()
+        self._vectors: dict[AnswerKey, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        question: str,
+        language: str | None,
+        project_name: str | None,
+        limit: int,
+        use_llm_planning: bool,
+    ) -> AnswerKey:
+        return (normalize_question(question), language, project_name, limit, use_llm_planning)
+
+    def get(self, key: AnswerKey) -> QueryResult | None:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def get_similar(self, key: AnswerKey, vector: Sequence[float]) -> QueryResult | None:
+        candidates = [cached_key for cached_key in self._vectors if cached_key[1:] == key[1:]]
+        if not candidates:
+            return None
+
+        query = _unit_vector(vector)
+        similarities = np.stack([self._vectors[k] for k in candidates]) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        logger.debug(f"Semantic answer cache hit ({similarities[best]:.3f}): {candidates[best][0]}")
+        return self.get(candidates[best])
+
+    def put(
+        self, key: AnswerKey, result: QueryResult, vector: Sequence[float] | None = None
+    ) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if vector is not None:
+            self._vectors[key] = _unit_vector(vector)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._vectors.pop(evicted, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._vectors.clear()
+
+
+def _unit_vector(vector: Sequence[float]) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
@@ -1,3 +1,4 @@
+from lattice.querying.answer_cache import AnswerCache
 from lattice.querying.context import (
     CodeSnippet,
     ContextBuilder,
@@ -27,6 +28,7 @@ from lattice.querying.graph_search import (
     search_by_name,
 )
 from lattice.querying.models import QueryResult
+from lattice.querying.plan_cache import PlanCache
 from lattice.querying.query_planner import (
     ExtractedEntity,
     QueryIntent,
@@ -42,7 +44,7 @@ from lattice.querying.ranking import (
 )
 from lattice.querying.reranker import SearchResult, deduplicate_results, fuse_results
 from lattice.querying.responder import ResponseGenerator
-from lattice.querying.response_builder import ResponseBuilder
+from lattice.querying.response_builder import ResponseBuilder, ResponsePrompt
 from lattice.querying.search_coordinator import SearchCoordinator
 from lattice.querying.vector_search import (
     CodeSearchResult,
@@ -54,6 +56,7 @@ from lattice.querying.vector_search import (
 )
 
 __all__ = [
+    "AnswerCache",
     "CodeSearchResult",
     "CodeSnippet",
     "ContextBuilder",
@@ -66,6 +69,7 @@ __all__ = [
     "GraphPath",
     "GraphReasoningEngine",
     "HybridRanker",
+    "PlanCache",
     "QueryEngine",
     "QueryIntent",
     "QueryPlan",
@@ -77,6 +81,7 @@ __all__ = [
     "RelatedEntityResult",
     "ResponseBuilder",
     "ResponseGenerator",
+    "ResponsePrompt",
     "SearchCoordinator",
     "SearchResult",
     "SubQuery",
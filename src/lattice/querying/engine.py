@@ -1,23 +1,74 @@
 import asyncio
 import logging
-import time
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable
+from time import perf_counter_ns
+from typing import Any, TypeVar
 
+from lattice.infrastructure.llm import BaseEmbeddingProvider, BaseLLMProvider
 from lattice.infrastructure.memgraph import MemgraphClient
 from lattice.infrastructure.qdrant import QdrantManager
-from lattice.querying.context import ContextBuilder
+from lattice.querying.answer_cache import AnswerCache
+from lattice.querying.context import ContextBuilder, EnrichedContext
 from lattice.querying.graph_reasoning import GraphContext, GraphReasoningEngine
 from lattice.querying.models import QueryResult
-from lattice.querying.query_planner import QueryPlan, QueryPlanner
+from lattice.querying.plan_cache import PlanCache
+from lattice.querying.query_planner import (
+    ExtractedEntity,
+    QueryIntent,
+    QueryPlan,
+    QueryPlanner,
+    QueryRelationship,
+)
 from lattice.querying.ranking import HybridRanker, RankedResult
 from lattice.querying.response_builder import ResponseBuilder
 from lattice.querying.search_coordinator import SearchCoordinator
 from lattice.querying.statistics import get_codebase_statistics
-from lattice.shared.config import get_settings
+from lattice.shared.config import QueryConfig, get_settings
 from lattice.shared.exceptions import QueryError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class _StageTimer:
+    """Records the wall time of a block in milliseconds under stats[key]."""
+
+    def __init__(self, stats: dict[str, Any], key: str):
+        self._stats = stats
+        self._key = key
+        self._start = 0
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stats[self._key] = (perf_counter_ns() - self._start) // 1_000_000
+
+
+async def _timed(awaitable: Awaitable[T], stats: dict[str, Any], key: str) -> T:
+    with _StageTimer(stats, key):
+        return await awaitable
+
+
+async def _or_default(awaitable: Awaitable[T], default: Callable[[], T], label: str) -> T:
+    try:
+        return await awaitable
+    except QueryError as e:
+        logger.warning(f"{label} failed: {e}")
+        return default()
+
+
+async def _collect(stream: AsyncIterator[QueryResult | str]) -> QueryResult:
+    result: QueryResult | None = None
+    async for item in stream:
+        if isinstance(item, QueryResult):
+            result = item
+    if result is None:
+        raise QueryError("Query produced no result")
+    return result
+
 
 class QueryEngine:
     def __init__(
@@ -30,6 +81,10 @@ class QueryEngine:
         ranker: HybridRanker,
         response_builder: ResponseBuilder,
         search_coordinator: SearchCoordinator,
+        embedder: BaseEmbeddingProvider | None = None,
+        answer_cache: AnswerCache | None = None,
+        llm_provider: BaseLLMProvider | None = None,
+        plan_cache: PlanCache | None = None,
     ):
         self._memgraph = memgraph
         self._qdrant = qdrant
@@ -39,11 +94,28 @@ class QueryEngine:
         self._ranker = ranker
         self._response_builder = response_builder
         self._search_coordinator = search_coordinator
+        self._embedder = embedder
+        self._answer_cache = answer_cache
+        self._llm_provider = llm_provider
+        self._plan_cache = plan_cache
+        self._settings = get_settings().query
+
+    def bump_version(self) -> None:
+        """Drop cached answers after the graph or vector index has changed."""
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
 
     async def close(self) -> None:
         logger.info("Closing query engine")
-        await self._memgraph.close()
-        await self._qdrant.close()
+        self.bump_version()
+        closers = [self._memgraph.close(), self._qdrant.close()]
+        if self._embedder is not None:
+            closers.append(self._embedder.aclose())
+        if self._llm_provider is not None:
+            closers.append(self._llm_provider.aclose())
+        for error in await asyncio.gather(*closers, return_exceptions=True):
+            if isinstance(error, Exception):
+                logger.warning(f"Error while closing query engine: {error}")
 
     async def query(
         self,
@@ -53,49 +125,131 @@ class QueryEngine:
         use_llm_planning: bool = True,
         project_name: str | None = None,
     ) -> QueryResult:
-        settings = get_settings()
-        limit = limit or settings.query.search_limit
+        return await _collect(
+            self.query_stream(question, limit, language, use_llm_planning, project_name)
+        )
+
+    async def query_stream(
+        self,
+        question: str,
+        limit: int | None = None,
+        language: str | None = None,
+        use_llm_planning: bool = True,
+        project_name: str | None = None,
+    ) -> AsyncIterator[QueryResult | str]:
+        """Yield the ranked sources first, then the answer text as it is generated.
+
+        The QueryResult is yielded with an empty answer as soon as retrieval is
+        done; its answer is filled in once the stream has been consumed.
+        """
+        async for item in self._stream(
+            question, limit, language, project_name, use_llm_planning=use_llm_planning
+        ):
+            yield item
+
+    async def _query_with_plan(
+        self, question: str, plan: QueryPlan, limit: int | None = None
+    ) -> QueryResult:
+        return await _collect(self._stream(question, limit, None, None, plan=plan))
+
+    async def _stream(
+        self,
+        question: str,
+        limit: int | None,
+        language: str | None,
+        project_name: str | None,
+        use_llm_planning: bool = False,
+        plan: QueryPlan | None = None,
+    ) -> AsyncIterator[QueryResult | str]:
+        limit = limit or self._settings.search_limit
+        cache_key = AnswerCache.make_key(question, language, project_name, limit, use_llm_planning)
+
+        if self._answer_cache is not None:
+            cached = self._answer_cache.get(cache_key)
+            if cached:
+                logger.info(f"Answer cache hit: {question}")
+                yield cached
+                yield cached.answer
+                return
 
+        plan_task = asyncio.create_task(self._plan_query(question, use_llm_planning, plan))
         try:
+            question_vector = await self._embed_question(question)
+            if self._answer_cache is not None and question_vector:
+                cached = self._answer_cache.get_similar(cache_key, question_vector)
+                if cached:
+                    logger.info(f"Semantic answer cache hit: {question}")
+                    yield cached
+                    yield cached.answer
+                    return
+
             logger.info(f"Executing query: {question}")
-            plan, stats = await self._plan_query(question, use_llm_planning)
-            graph_context, vector_results, graph_time = await self._execute_searches(
-                question, plan, limit, language, project_name
+            plan, stats = await plan_task
+            graph_context, vector_results = await self._execute_searches(
+                question, plan, limit, language, project_name, question_vector, stats
             )
-            stats["graph_time_ms"] = graph_time
             ranked_results, stats = await self._rank_and_enrich(
-                plan, graph_context, vector_results, stats
-            )
-            start = time.time()
-            answer = await self._response_builder.generate_response(
-                question, plan, ranked_results[:limit], stats.get("enriched_context")
+                plan, graph_context, vector_results, stats, limit
             )
-            stats["response_time_ms"] = int((time.time() - start) * 1000)
-            logger.info(f"Query completed: {len(ranked_results)} results")
-            return QueryResult(
-                answer=answer,
-                sources=ranked_results[:limit],
+            result = QueryResult(
+                answer="",
+                sources=ranked_results,
                 query_plan=plan,
                 context=stats.pop("enriched_context"),
                 graph_context=graph_context,
                 execution_stats=stats,
             )
+            yield result
+
+            with _StageTimer(stats, "response_time_ms"):
+                prompt = self._response_builder.prepare_prompt(question, plan, result.context)
+                cached_answer = self._response_builder.cached_response(prompt)
+                stats["response_cache_hit"] = cached_answer is not None
+                if cached_answer is not None:
+                    result.answer = cached_answer
+                    yield cached_answer
+                else:
+                    chunks = []
+                    async for chunk in self._response_builder.stream_response(
+                        question, plan, result.sources, result.context, prompt
+                    ):
+                        chunks.append(chunk)
+                        yield chunk
+                    result.answer = "".join(chunks).strip()
+            logger.info(f"Query completed: {len(ranked_results)} results")
+
+            if self._answer_cache is not None:
+                self._answer_cache.put(cache_key, result, question_vector)
         except QueryError:
             raise
         except Exception as e:
             logger.error(f"Unexpected error during query: {e}")
             raise QueryError("Query execution failed", cause=e)
+        finally:
+            plan_task.cancel()
+
+    async def _embed_question(self, question: str) -> list[float] | None:
+        if not self._embedder:
+            return None
+        try:
+            return await self._embedder.embed(question)
+        except Exception as e:
+            logger.warning(f"Failed to embed question, continuing without it: {e}")
+            return None
 
     async def _plan_query(
-        self, question: str, use_llm_planning: bool
+        self, question: str, use_llm_planning: bool, plan: QueryPlan | None = None
     ) -> tuple[QueryPlan, dict[str, Any]]:
-        start = time.time()
-        plan = (
-            await self._planner.plan_query(question)
-            if use_llm_planning
-            else self._planner._fallback_plan(question)
-        )
-        return plan, {"planning_time_ms": int((time.time() - start) * 1000)}
+        stats: dict[str, Any] = {}
+        with _StageTimer(stats, "planning_time_ms"):
+            if plan is None:
+                if not use_llm_planning:
+                    plan = self._planner._fallback_plan(question)
+                elif self._plan_cache is not None:
+                    plan = await self._plan_cache.get_or_plan(question, self._planner.plan_query)
+                else:
+                    plan = await self._planner.plan_query(question)
+        return plan, stats
 
     async def _execute_searches(
         self,
@@ -104,23 +258,35 @@ class QueryEngine:
         limit: int,
         language: str | None,
         project_name: str | None,
-    ) -> tuple[GraphContext, list[dict[str, Any]], int]:
-        start = time.time()
-        graph_task = self._graph_engine.execute_query_plan(plan)
-        vector_task = self._search_coordinator.execute_vector_search(
-            question, plan, limit, language, project_name
-        )
-        graph_context, vector_results = await asyncio.gather(
-            graph_task, vector_task, return_exceptions=True
-        )
-        graph_time = int((time.time() - start) * 1000)
-        if isinstance(graph_context, Exception):
-            logger.warning(f"Graph search failed: {graph_context}")
-            graph_context = GraphContext.empty()
-        if isinstance(vector_results, Exception):
-            logger.warning(f"Vector search failed: {vector_results}")
-            vector_results = []
-        return graph_context, vector_results, graph_time
+        question_vector: list[float] | None,
+        stats: dict[str, Any],
+    ) -> tuple[GraphContext, list[dict[str, Any]]]:
+        async with asyncio.TaskGroup() as tg:
+            graph_task = tg.create_task(
+                _timed(
+                    _or_default(
+                        self._graph_engine.execute_query_plan(plan),
+                        GraphContext.empty,
+                        "Graph search",
+                    ),
+                    stats,
+                    "graph_time_ms",
+                )
+            )
+            vector_task = tg.create_task(
+                _timed(
+                    _or_default(
+                        self._search_coordinator.execute_vector_search(
+                            question, plan, limit, language, project_name, question_vector
+                        ),
+                        list,
+                        "Vector search",
+                    ),
+                    stats,
+                    "vector_time_ms",
+                )
+            )
+        return graph_task.result(), vector_task.result()
 
     async def _rank_and_enrich(
         self,
@@ -128,25 +294,39 @@ class QueryEngine:
         graph_context: GraphContext,
         vector_results: list[dict[str, Any]],
         stats: dict[str, Any],
+        limit: int,
     ) -> tuple[list[RankedResult], dict[str, Any]]:
-        start = time.time()
-        centrality_scores = await self._search_coordinator.get_centrality_scores(
-            graph_context, vector_results
-        )
-        stats["vector_time_ms"] = int((time.time() - start) * 1000)
-        start = time.time()
-        ranked_results = self._ranker.rank_results(
-            plan, graph_context, vector_results, centrality_scores
+        context_task = asyncio.create_task(
+            self._build_context(plan, graph_context, vector_results, stats)
         )
-        stats["ranking_time_ms"] = int((time.time() - start) * 1000)
-        start = time.time()
-        enriched_context = await self._context_builder.build_enriched_context(
-            plan, graph_context, vector_results
-        )
-        stats["context_time_ms"] = int((time.time() - start) * 1000)
-        stats["enriched_context"] = enriched_context
+        try:
+            with _StageTimer(stats, "centrality_time_ms"):
+                centrality_scores = await self._search_coordinator.get_centrality_scores(
+                    graph_context, vector_results
+                )
+            with _StageTimer(stats, "ranking_time_ms"):
+                rank_args = (plan, graph_context, vector_results, centrality_scores, limit)
+                if len(vector_results) > QueryConfig.ranking_thread_threshold:
+                    ranked_results = await asyncio.to_thread(self._ranker.rank_results, *rank_args)
+                else:
+                    ranked_results = self._ranker.rank_results(*rank_args)
+            stats["enriched_context"] = await context_task
+        finally:
+            context_task.cancel()
         return ranked_results, stats
 
+    async def _build_context(
+        self,
+        plan: QueryPlan,
+        graph_context: GraphContext,
+        vector_results: list[dict[str, Any]],
+        stats: dict[str, Any],
+    ) -> EnrichedContext:
+        with _StageTimer(stats, "context_time_ms"):
+            return await self._context_builder.build_enriched_context(
+                plan, graph_context, vector_results
+            )
+
     async def search(
         self,
         query: str,
@@ -154,11 +334,10 @@ class QueryEngine:
         language: str | None = None,
         project_name: str | None = None,
     ) -> list[RankedResult]:
-        settings = get_settings()
-        limit = limit or settings.query.search_limit
+        limit = limit or self._settings.search_limit
         try:
             logger.info(f"Executing search: {query}")
-            plan = await self._planner.plan_query(query)
+            plan, _ = await self._plan_query(query, use_llm_planning=True)
             graph_context, vector_results = await asyncio.gather(
                 self._graph_engine.execute_query_plan(plan),
                 self._search_coordinator.execute_vector_search(
@@ -169,10 +348,10 @@ class QueryEngine:
                 graph_context, vector_results
             )
             ranked_results = self._ranker.rank_results(
-                plan, graph_context, vector_results, centrality_scores
+                plan, graph_context, vector_results, centrality_scores, limit
             )
-            logger.info(f"Search completed: {len(ranked_results[:limit])} results")
-            return ranked_results[:limit]
+            logger.info(f"Search completed: {len(ranked_results)} results")
+            return ranked_results
         except QueryError:
             raise
         except Exception as e:
@@ -180,12 +359,36 @@ class QueryEngine:
             raise QueryError("Search execution failed", cause=e)
 
     async def explain_entity(self, entity_name: str) -> QueryResult:
-        return await self.query(f"Explain how {entity_name} works and is used in the codebase")
+        question = f"Explain how {entity_name} works and is used in the codebase"
+        plan = QueryPlan(
+            original_query=question,
+            primary_intent=QueryIntent.EXPLAIN_IMPLEMENTATION,
+            sub_queries=[],
+            entities=[ExtractedEntity(name=entity_name, is_primary=True)],
+            relationships=[],
+            requires_multi_hop=True,
+            max_hops=QueryConfig.default_max_depth,
+            context_requirements=["implementation_details"],
+            reasoning="Direct entity explanation",
+        )
+        return await self._query_with_plan(question, plan)
 
     async def find_call_path(self, source_name: str, target_name: str) -> QueryResult:
-        return await self.query(
-            f"How does {source_name} eventually call {target_name}? Show the call chain."
+        question = f"How does {source_name} eventually call {target_name}? Show the call chain."
+        plan = QueryPlan(
+            original_query=question,
+            primary_intent=QueryIntent.FIND_CALL_CHAIN,
+            sub_queries=[],
+            entities=[
+                ExtractedEntity(name=source_name, is_primary=True),
+                ExtractedEntity(name=target_name),
+            ],
+            relationships=[QueryRelationship(source_name, target_name, "calls")],
+            requires_multi_hop=True,
+            max_hops=QueryConfig.fallback_max_hops,
+            reasoning="Direct call path lookup",
         )
+        return await self._query_with_plan(question, plan)
 
     async def get_statistics(self) -> dict[str, Any]:
         return await get_codebase_statistics(self._memgraph, self._qdrant)
@@ -1,16 +1,20 @@
 import logging
+from pathlib import Path
 
-from lattice.infrastructure.llm import get_llm_provider
+from lattice.infrastructure.llm import CachedEmbeddingProvider, get_llm_provider
 from lattice.infrastructure.memgraph import MemgraphClient
 from lattice.infrastructure.qdrant import QdrantManager, create_embedder
+from lattice.querying.answer_cache import AnswerCache
 from lattice.querying.context import ContextBuilder
 from lattice.querying.engine import QueryEngine
 from lattice.querying.graph_reasoning import GraphReasoningEngine
+from lattice.querying.plan_cache import PlanCache
 from lattice.querying.query_planner import QueryPlanner
 from lattice.querying.ranking import HybridRanker, RankingConfig
 from lattice.querying.response_builder import ResponseBuilder
 from lattice.querying.search_coordinator import SearchCoordinator
 from lattice.querying.vector_search import VectorSearcher
+from lattice.shared.config import CachingConfig
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,10 @@ async def create_query_engine() -> QueryEngine:
     await qdrant.connect()
 
     embedder = create_embedder()
+    if CachingConfig.embedding_cache_path:
+        embedder = CachedEmbeddingProvider(
+            embedder, Path(CachingConfig.embedding_cache_path).expanduser()
+        )
     llm_provider = get_llm_provider()
 
     vector_searcher = VectorSearcher(qdrant, embedder)
@@ -39,4 +47,8 @@ async def create_query_engine() -> QueryEngine:
         ranker=HybridRanker(RankingConfig()),
         response_builder=ResponseBuilder(llm_provider),
         search_coordinator=SearchCoordinator(vector_searcher, graph_engine),
+        embedder=embedder,
+        answer_cache=AnswerCache(),
+        llm_provider=llm_provider,
+        plan_cache=PlanCache(),
     )
@@ -1,44 +1,66 @@
 import asyncio
+from collections.abc import Awaitable, Callable
 
 from lattice.infrastructure.memgraph import MemgraphClient
 from lattice.querying.graph_reasoning.graph_queries import (
     find_class_with_methods,
     find_file_context,
 )
-from lattice.querying.graph_reasoning.models import GraphContext
+from lattice.querying.graph_reasoning.models import GraphContext, GraphNode
 from lattice.querying.graph_reasoning.traversal import (
     find_call_chain,
     find_full_hierarchy,
     find_implementation_context,
-    find_transitive_callees,
-    find_transitive_callers,
+    find_transitive_callees_batch,
+    find_transitive_callees_by_id,
+    find_transitive_callers_batch,
+    find_transitive_callers_by_id,
 )
 from lattice.querying.query_planner import QueryPlan
 
 
+async def _traverse_from(
+    by_id: Callable[..., Awaitable[dict[int, list[GraphNode]]]],
+    by_name: Callable[..., Awaitable[dict[str, list[GraphNode]]]],
+    client: MemgraphClient,
+    entities: list[GraphNode],
+    **kwargs: int,
+) -> list[GraphNode]:
+    ids = [e.internal_id for e in entities if e.internal_id is not None]
+    names = [e.qualified_name or e.name for e in entities if e.internal_id is None]
+    found_by_id, found_by_name = await asyncio.gather(
+        by_id(client, ids, **kwargs), by_name(client, names, **kwargs)
+    )
+    nodes = []
+    for entity in entities:
+        if entity.internal_id is not None:
+            nodes.extend(found_by_id[entity.internal_id])
+        else:
+            nodes.extend(found_by_name[entity.qualified_name or entity.name])
+    return nodes
+
+
 async def gather_caller_context(
     client: MemgraphClient,
     context: GraphContext,
     plan: QueryPlan,
 ) -> None:
     max_hops = plan.max_hops if plan.requires_multi_hop else 1
-
     if context.primary_entities:
-        for entity in context.primary_entities:
-            callers = await find_transitive_callers(
-                client,
-                entity.qualified_name or entity.name,
-                max_hops=max_hops,
-            )
-            context.callers.extend(callers)
+        callers = await _traverse_from(
+            find_transitive_callers_by_id,
+            find_transitive_callers_batch,
+            client,
+            context.primary_entities,
+            max_hops=max_hops,
+        )
+        context.callers.extend(callers)
     else:
-        for entity in plan.entities:
-            callers = await find_transitive_callers(
-                client,
-                entity.name,
-                max_hops=max_hops,
-            )
-            context.callers.extend(callers)
+        found = await find_transitive_callers_batch(
+            client, [e.name for e in plan.entities], max_hops=max_hops
+        )
+        for entity_callers in found.values():
+            context.callers.extend(entity_callers)
 
 
 async def gather_callee_context(
@@ -47,23 +69,21 @@ async def gather_callee_context(
     plan: QueryPlan,
 ) -> None:
     max_hops = plan.max_hops if plan.requires_multi_hop else 1
-
     if context.primary_entities:
-        for entity in context.primary_entities:
-            callees = await find_transitive_callees(
-                client,
-                entity.qualified_name or entity.name,
-                max_hops=max_hops,
-            )
-            context.callees.extend(callees)
+        callees = await _traverse_from(
+            find_transitive_callees_by_id,
+            find_transitive_callees_batch,
+            client,
+            context.primary_entities,
+            max_hops=max_hops,
+        )
+        context.callees.extend(callees)
     else:
-        for entity in plan.entities:
-            callees = await find_transitive_callees(
-                client,
-                entity.name,
-                max_hops=max_hops,
-            )
-            context.callees.extend(callees)
+        found = await find_transitive_callees_batch(
+            client, [e.name for e in plan.entities], max_hops=max_hops
+        )
+        for entity_callees in found.values():
+            context.callees.extend(entity_callees)
 
 
 async def gather_call_chain_context(
@@ -83,35 +103,35 @@ async def gather_hierarchy_context(
     context: GraphContext,
     plan: QueryPlan,
 ) -> None:
-    for entity in context.primary_entities:
-        if entity.node_type == "Class":
-            _, ancestors, descendants = await find_full_hierarchy(
-                client,
-                entity.qualified_name or entity.name,
-            )
-            context.parent_classes.extend(ancestors)
-            context.child_classes.extend(descendants)
-        else:
-            callers = await find_transitive_callers(
-                client,
-                entity.qualified_name or entity.name,
-                max_hops=plan.max_hops if plan.requires_multi_hop else 1,
-            )
-            context.callers.extend(callers)
-
-    resolved_names = {e.name.lower() for e in context.primary_entities}
-    resolved_names.update(
-        e.qualified_name.lower() for e in context.primary_entities if e.qualified_name
+    max_hops = plan.max_hops if plan.requires_multi_hop else 1
+    classes = [e for e in context.primary_entities if e.node_type == "Class"]
+    others = [e for e in context.primary_entities if e.node_type != "Class"]
+
+    resolved_names = {
+        name.lower()
+        for e in context.primary_entities
+        for name in (e.name, e.qualified_name)
+        if name
+    }
+    unresolved = [e.name for e in plan.entities if e.name.lower() not in resolved_names]
+
+    hierarchies, entity_callers, unresolved_callers = await asyncio.gather(
+        asyncio.gather(*(find_full_hierarchy(client, e.qualified_name or e.name) for e in classes)),
+        _traverse_from(
+            find_transitive_callers_by_id,
+            find_transitive_callers_batch,
+            client,
+            others,
+            max_hops=max_hops,
+        ),
+        find_transitive_callers_batch(client, unresolved, max_hops=max_hops),
     )
-
-    for plan_entity in plan.entities:
-        if plan_entity.name.lower() not in resolved_names:
-            callers = await find_transitive_callers(
-                client,
-                plan_entity.name,
-                max_hops=plan.max_hops if plan.requires_multi_hop else 1,
-            )
-            context.callers.extend(callers)
+    for _, ancestors, descendants in hierarchies:
+        context.parent_classes.extend(ancestors)
+        context.child_classes.extend(descendants)
+    context.callers.extend(entity_callers)
+    for callers in unresolved_callers.values():
+        context.callers.extend(callers)
 
 
 async def gather_implementation_context(
@@ -119,23 +139,24 @@ async def gather_implementation_context(
     context: GraphContext,
     plan: QueryPlan,
 ) -> None:
-    for entity in context.primary_entities:
-        impl_context = await find_implementation_context(
-            client,
-            entity.qualified_name or entity.name,
-        )
+    entities = context.primary_entities
+    classes = [e for e in entities if e.node_type == "Class"]
+    impl_contexts, class_methods = await asyncio.gather(
+        asyncio.gather(
+            *(find_implementation_context(client, e.qualified_name or e.name) for e in entities)
+        ),
+        asyncio.gather(
+            *(find_class_with_methods(client, e.qualified_name or e.name) for e in classes)
+        ),
+    )
 
+    for impl_context in impl_contexts:
         if impl_context:
             context.callers.extend(impl_context.get("callers", []))
             context.callees.extend(impl_context.get("callees", []))
             context.file_context.extend(impl_context.get("siblings", []))
-
-        if entity.node_type == "Class":
-            _, methods = await find_class_with_methods(
-                client,
-                entity.qualified_name or entity.name,
-            )
-            context.methods.extend(methods)
+    for _, methods in class_methods:
+        context.methods.extend(methods)
 
 
 async def gather_dependency_context(
@@ -143,12 +164,17 @@ async def gather_dependency_context(
     context: GraphContext,
     plan: QueryPlan,
 ) -> None:
-    for entity in context.primary_entities:
-        if entity.file_path:
-            file_ctx = await find_file_context(client, entity.file_path)
-            for fc in file_ctx:
-                if fc.get("entity"):
-                    context.file_context.append(fc["entity"])
+    file_contexts = await asyncio.gather(
+        *(
+            find_file_context(client, entity.file_path)
+            for entity in context.primary_entities
+            if entity.file_path
+        )
+    )
+    for file_ctx in file_contexts:
+        for fc in file_ctx:
+            if fc.get("entity"):
+                context.file_context.append(fc["entity"])
 
 
 async def gather_comprehensive_context(
@@ -156,32 +182,37 @@ async def gather_comprehensive_context(
     context: GraphContext,
     plan: QueryPlan,
 ) -> None:
-    tasks = []
-
-    for entity in context.primary_entities[:3]:
-        entity_name = entity.qualified_name or entity.name
-
-        tasks.append(find_transitive_callers(client, entity_name, max_hops=2, limit=10))
-        tasks.append(find_transitive_callees(client, entity_name, max_hops=2, limit=10))
-
-        if entity.node_type == "Class":
-            tasks.append(find_class_with_methods(client, entity_name))
-
-    if tasks:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        idx = 0
-        for entity in context.primary_entities[:3]:
-            if idx < len(results) and isinstance(results[idx], list):
-                context.callers.extend(results[idx])
-            idx += 1
-
-            if idx < len(results) and isinstance(results[idx], list):
-                context.callees.extend(results[idx])
-            idx += 1
+    entities = context.primary_entities[:3]
+    if not entities:
+        return
+
+    callers, callees, class_methods = await asyncio.gather(
+        _traverse_from(
+            find_transitive_callers_by_id,
+            find_transitive_callers_batch,
+            client,
+            entities,
+            max_hops=2,
+            limit=10,
+        ),
+        _traverse_from(
+            find_transitive_callees_by_id,
+            find_transitive_callees_batch,
+            client,
+            entities,
+            max_hops=2,
+            limit=10,
+        ),
+        asyncio.gather(
+            *(
+                find_class_with_methods(client, e.qualified_name or e.name)
+                for e in entities
+                if e.node_type == "Class"
+            )
+        ),
+    )
 
-            if entity.node_type == "Class":
-                if idx < len(results) and isinstance(results[idx], tuple):
-                    _, methods = results[idx]
-                    context.methods.extend(methods)
-                idx += 1
+    context.callers.extend(callers)
+    context.callees.extend(callees)
+    for _, methods in class_methods:
+        context.methods.extend(methods)
@@ -15,6 +15,7 @@ from lattice.querying.graph_reasoning.entity_finder import find_entity, find_ent
 from lattice.querying.graph_reasoning.graph_queries import (
     find_class_with_methods,
     find_file_context,
+    get_entities_centrality,
     get_entity_centrality,
 )
 from lattice.querying.graph_reasoning.models import (
@@ -39,6 +40,13 @@ from lattice.shared.exceptions import QueryError
 logger = logging.getLogger(__name__)
 
 
+def _unique_nodes(nodes: list[GraphNode]) -> list[GraphNode]:
+    unique: dict[tuple[str, str], GraphNode] = {}
+    for node in nodes:
+        unique.setdefault((node.node_type, node.qualified_name or node.name), node)
+    return list(unique.values())
+
+
 class GraphReasoningEngine:
     def __init__(self, client: MemgraphClient):
         self.client = client
@@ -46,32 +54,26 @@ class GraphReasoningEngine:
     async def execute_query_plan(self, plan: QueryPlan) -> GraphContext:
         logger.debug(f"Executing query plan: intent={plan.primary_intent}")
 
-        context = GraphContext(
-            primary_entities=[],
-            callers=[],
-            callees=[],
-            parent_classes=[],
-            child_classes=[],
-            methods=[],
-            containing_class=None,
-            file_context=[],
-            dependencies=[],
-            dependents=[],
-            call_chains=[],
-            inheritance_chains=[],
-        )
+        context = GraphContext.empty()
 
         try:
+            resolved: set[tuple[str, str | None]] = set()
             for entity in plan.entities:
+                lookup = (entity.name, entity.entity_type)
+                if lookup in resolved:
+                    continue
                 if entity.is_primary or not context.primary_entities:
+                    resolved.add(lookup)
                     nodes = await find_entity(self.client, entity.name, entity.entity_type)
                     context.primary_entities.extend(nodes)
 
             if not context.primary_entities:
-                for entity in plan.entities:
-                    nodes = await find_entity_fuzzy(self.client, entity.name)
+                for name in dict.fromkeys(e.name for e in plan.entities):
+                    nodes = await find_entity_fuzzy(self.client, name)
                     context.primary_entities.extend(nodes)
 
+            context.primary_entities = _unique_nodes(context.primary_entities)
+
             if plan.primary_intent in (QueryIntent.FIND_CALLERS, QueryIntent.FIND_USAGES):
                 await gather_caller_context(self.client, context, plan)
 
@@ -155,6 +157,9 @@ class GraphReasoningEngine:
     async def get_entity_centrality(self, entity_name: str) -> dict[str, int]:
         return await get_entity_centrality(self.client, entity_name)
 
+    async def get_entities_centrality(self, entity_names: list[str]) -> dict[str, dict[str, int]]:
+        return await get_entities_centrality(self.client, entity_names)
+
     def _result_to_node(self, result: dict[str, Any]) -> GraphNode:
         return result_to_node(result)
 
@@ -4,47 +4,22 @@ from lattice.querying.graph_reasoning.node_utils import result_to_node
 from lattice.querying.graph_reasoning.queries import MultiHopGraphQueries
 from lattice.shared.exceptions import GraphError
 
+_ENTITY_LABELS = ("File", "Class", "Function", "Method", "Import")
+
+_FIND_ENTITY_QUERIES = {
+    label: MultiHopGraphQueries.FIND_ENTITY.format(label=f":{label}") for label in _ENTITY_LABELS
+}
+_FIND_ANY_ENTITY_QUERY = MultiHopGraphQueries.FIND_ENTITY.format(label="")
+
 
 async def find_entity(
     client: MemgraphClient,
     name: str,
     entity_type: str | None = None,
 ) -> list[GraphNode]:
+    query = _FIND_ANY_ENTITY_QUERY
     if entity_type:
-        type_label = entity_type.capitalize()
-        query = f"""
-        MATCH (n:{type_label})
-        WHERE n.name = $name OR n.qualified_name = $name
-        RETURN
-            labels(n)[0] as node_type,
-            n.name as name,
-            n.qualified_name as qualified_name,
-            n.file_path as file_path,
-            n.signature as signature,
-            n.docstring as docstring,
-            n.summary as summary,
-            n.start_line as start_line,
-            n.end_line as end_line,
-            n.is_async as is_async,
-            n.parent_class as parent_class
-        """
-    else:
-        query = """
-        MATCH (n)
-        WHERE n.name = $name OR n.qualified_name = $name
-        RETURN
-            labels(n)[0] as node_type,
-            n.name as name,
-            n.qualified_name as qualified_name,
-            n.file_path as file_path,
-            n.signature as signature,
-            n.docstring as docstring,
-            n.summary as summary,
-            n.start_line as start_line,
-            n.end_line as end_line,
-            n.is_async as is_async,
-            n.parent_class as parent_class
-        """
+        query = _FIND_ENTITY_QUERIES.get(entity_type.capitalize(), query)
 
     try:
         results = await client.execute(query, {"name": name})
@@ -85,3 +85,33 @@ async def get_entity_centrality(
     except GraphError as e:
         logger.warning(f"Error getting entity centrality: {e}")
         return {"in_degree": 0, "out_degree": 0, "total_degree": 0}
+
+
+async def get_entities_centrality(
+    client: MemgraphClient,
+    entity_names: list[str],
+) -> dict[str, dict[str, int]]:
+    empty = {"in_degree": 0, "out_degree": 0, "total_degree": 0}
+    try:
+        results = await client.execute(
+            MultiHopGraphQueries.GET_ENTITIES_CENTRALITY,
+            {"names": entity_names},
+        )
+    except GraphError as e:
+        logger.warning(f"Error getting entity centrality: {e}")
+        return {name: dict(empty) for name in entity_names}
+
+    scores: dict[str, dict[str, int]] = {}
+    for r in results:
+        scores.setdefault(
+            r["lookup"],
+            {
+                "in_degree": r.get("in_degree", 0),
+                "out_degree": r.get("out_degree", 0),
+                "total_degree": r.get("total_degree", 0),
+                "relationship_count": r.get("relationship_count", 0),
+            },
+        )
+    for name in entity_names:
+        scores.setdefault(name, dict(empty))
+    return scores
@@ -30,6 +30,7 @@ class GraphNode:
     is_async: bool = False
     parent_class: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    internal_id: int | None = None
 
 
 @dataclass
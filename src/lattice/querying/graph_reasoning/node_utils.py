@@ -17,6 +17,7 @@ def result_to_node(result: dict[str, Any]) -> GraphNode:
         is_async=result.get("is_async", False),
         parent_class=result.get("parent_class"),
         metadata={"depth": result.get("depth")} if "depth" in result else {},
+        internal_id=result.get("internal_id"),
     )
 
 
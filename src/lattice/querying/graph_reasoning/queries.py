@@ -1,6 +1,6 @@
 class MultiHopGraphQueries:
     FIND_TRANSITIVE_CALLERS = """
-    MATCH path = (caller)-[:CALLS*1..{max_hops}]->(target)
+    MATCH path = (caller)-[:CALLS *BFS ..{max_hops}]->(target)
     WHERE target.name = $name
        OR target.qualified_name = $name
        OR target.name CONTAINS $name
@@ -25,7 +25,7 @@ class MultiHopGraphQueries:
     """
 
     FIND_TRANSITIVE_CALLEES = """
-    MATCH path = (source)-[:CALLS*1..{max_hops}]->(callee)
+    MATCH path = (source)-[:CALLS *BFS ..{max_hops}]->(callee)
     WHERE source.name = $name
        OR source.qualified_name = $name
        OR source.name CONTAINS $name
@@ -49,6 +49,65 @@ class MultiHopGraphQueries:
     LIMIT $limit
     """
 
+    SEED_BY_NAME = """{seed}.name = lookup
+       OR {seed}.qualified_name = lookup
+       OR {seed}.name CONTAINS lookup
+       OR toLower({seed}.name) CONTAINS toLower(lookup)"""
+
+    SEED_BY_ID = "id({seed}) = lookup"
+
+    FIND_TRANSITIVE_CALLERS_BATCH = """
+    UNWIND $lookups AS lookup
+    MATCH (target)
+    WHERE {seed_filter}
+    MATCH path = (caller)-[:CALLS *BFS ..{max_hops}]->(target)
+    WITH lookup, caller, target, length(path) as depth
+    WHERE caller <> target
+    WITH DISTINCT lookup, caller, target, depth
+    ORDER BY depth
+    WITH lookup, collect({{
+        node_type: labels(caller)[0],
+        name: caller.name,
+        qualified_name: caller.qualified_name,
+        file_path: caller.file_path,
+        signature: caller.signature,
+        docstring: caller.docstring,
+        summary: caller.summary,
+        start_line: caller.start_line,
+        end_line: caller.end_line,
+        is_async: caller.is_async,
+        depth: depth,
+        target_name: target.name
+    }}) as nodes
+    RETURN lookup, nodes[..$limit] as nodes
+    """
+
+    FIND_TRANSITIVE_CALLEES_BATCH = """
+    UNWIND $lookups AS lookup
+    MATCH (source)
+    WHERE {seed_filter}
+    MATCH path = (source)-[:CALLS *BFS ..{max_hops}]->(callee)
+    WITH lookup, callee, source, length(path) as depth
+    WHERE callee <> source
+    WITH DISTINCT lookup, callee, source, depth
+    ORDER BY depth
+    WITH lookup, collect({{
+        node_type: labels(callee)[0],
+        name: callee.name,
+        qualified_name: callee.qualified_name,
+        file_path: callee.file_path,
+        signature: callee.signature,
+        docstring: callee.docstring,
+        summary: callee.summary,
+        start_line: callee.start_line,
+        end_line: callee.end_line,
+        is_async: callee.is_async,
+        depth: depth,
+        source_name: source.name
+    }}) as nodes
+    RETURN lookup, nodes[..$limit] as nodes
+    """
+
     FIND_CALL_CHAIN = """
     MATCH path = shortestPath((source)-[:CALLS*1..{max_hops}]->(target))
     WHERE (source.name = $source_name OR source.qualified_name = $source_name)
@@ -278,6 +337,24 @@ class MultiHopGraphQueries:
         } as resolved_entity
     """
 
+    FIND_ENTITY = """
+    MATCH (n{label})
+    WHERE n.name = $name OR n.qualified_name = $name
+    RETURN
+        id(n) as internal_id,
+        labels(n)[0] as node_type,
+        n.name as name,
+        n.qualified_name as qualified_name,
+        n.file_path as file_path,
+        n.signature as signature,
+        n.docstring as docstring,
+        n.summary as summary,
+        n.start_line as start_line,
+        n.end_line as end_line,
+        n.is_async as is_async,
+        n.parent_class as parent_class
+    """
+
     FIND_ENTITY_FUZZY = """
     MATCH (n)
     WHERE n.name CONTAINS $name
@@ -297,6 +374,7 @@ class MultiHopGraphQueries:
     ORDER BY match_score, n.name
     LIMIT $limit
     RETURN
+        id(n) as internal_id,
         labels(n)[0] as node_type,
         n.name as name,
         n.qualified_name as qualified_name,
@@ -327,3 +405,20 @@ class MultiHopGraphQueries:
         in_degree + out_degree as total_degree,
         count(DISTINCT r) as relationship_count
     """
+
+    GET_ENTITIES_CENTRALITY = """
+    UNWIND $names AS lookup
+    MATCH (n)
+    WHERE n.name = lookup OR n.qualified_name = lookup
+    OPTIONAL MATCH (caller)-[:CALLS]->(n)
+    WITH lookup, n, count(DISTINCT caller) as in_degree
+    OPTIONAL MATCH (n)-[:CALLS]->(callee)
+    WITH lookup, n, in_degree, count(DISTINCT callee) as out_degree
+    OPTIONAL MATCH (n)-[r]-()
+    RETURN
+        lookup,
+        in_degree,
+        out_degree,
+        in_degree + out_degree as total_degree,
+        count(DISTINCT r) as relationship_count
+    """
@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import Any, TypeVar
 
 from lattice.infrastructure.memgraph import MemgraphClient
 from lattice.querying.graph_reasoning.models import (
@@ -16,6 +16,11 @@ from lattice.shared.exceptions import GraphError
 
 logger = logging.getLogger(__name__)
 
+_CALLERS = ("callers", MultiHopGraphQueries.FIND_TRANSITIVE_CALLERS_BATCH, "target")
+_CALLEES = ("callees", MultiHopGraphQueries.FIND_TRANSITIVE_CALLEES_BATCH, "source")
+
+K = TypeVar("K", str, int)
+
 
 async def find_transitive_callers(
     client: MemgraphClient,
@@ -57,6 +62,78 @@ async def find_transitive_callees(
         return []
 
 
+async def find_transitive_callers_batch(
+    client: MemgraphClient,
+    entity_names: list[str],
+    max_hops: int = QueryConfig.fallback_max_hops,
+    limit: int = MAX_RESULTS_PER_QUERY,
+) -> dict[str, list[GraphNode]]:
+    return await _find_transitive_batch(
+        client, _CALLERS, MultiHopGraphQueries.SEED_BY_NAME, entity_names, max_hops, limit
+    )
+
+
+async def find_transitive_callees_batch(
+    client: MemgraphClient,
+    entity_names: list[str],
+    max_hops: int = QueryConfig.fallback_max_hops,
+    limit: int = MAX_RESULTS_PER_QUERY,
+) -> dict[str, list[GraphNode]]:
+    return await _find_transitive_batch(
+        client, _CALLEES, MultiHopGraphQueries.SEED_BY_NAME, entity_names, max_hops, limit
+    )
+
+
+async def find_transitive_callers_by_id(
+    client: MemgraphClient,
+    node_ids: list[int],
+    max_hops: int = QueryConfig.fallback_max_hops,
+    limit: int = MAX_RESULTS_PER_QUERY,
+) -> dict[int, list[GraphNode]]:
+    return await _find_transitive_batch(
+        client, _CALLERS, MultiHopGraphQueries.SEED_BY_ID, node_ids, max_hops, limit
+    )
+
+
+async def find_transitive_callees_by_id(
+    client: MemgraphClient,
+    node_ids: list[int],
+    max_hops: int = QueryConfig.fallback_max_hops,
+    limit: int = MAX_RESULTS_PER_QUERY,
+) -> dict[int, list[GraphNode]]:
+    return await _find_transitive_batch(
+        client, _CALLEES, MultiHopGraphQueries.SEED_BY_ID, node_ids, max_hops, limit
+    )
+
+
+async def _find_transitive_batch(
+    client: MemgraphClient,
+    relation: tuple[str, str, str],
+    seed_filter: str,
+    lookups: list[K],
+    max_hops: int,
+    limit: int,
+) -> dict[K, list[GraphNode]]:
+    nodes: dict[K, list[GraphNode]] = {lookup: [] for lookup in lookups}
+    if not nodes:
+        return nodes
+
+    relation_name, query_template, seed = relation
+    query = query_template.format(
+        max_hops=min(max_hops, MAX_TRAVERSAL_DEPTH),
+        seed_filter=seed_filter.format(seed=seed),
+    )
+    try:
+        results = await client.execute(query, {"lookups": list(nodes), "limit": limit})
+    except GraphError as e:
+        logger.warning(f"Error finding transitive {relation_name}: {e}")
+        return nodes
+
+    for r in results:
+        nodes[r["lookup"]] = [result_to_node(n) for n in r.get("nodes", [])]
+    return nodes
+
+
 async def find_call_chain(
     client: MemgraphClient,
     source_name: str,
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from lattice.querying.answer_cache import normalize_question
+from lattice.querying.query_planner import QueryPlan
+from lattice.shared.config import QueryConfig
+
+logger = logging.getLogger(__name__)
+
+
+class PlanCache:
+    """LRU cache of query plans with a time-to-live.
+
+    Plans depend only on the question text, so they stay valid across index
+    changes. Concurrent requests for the same question share one planning call.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = QueryConfig.plan_cache_size,
+        ttl_seconds: float = QueryConfig.plan_cache_ttl_seconds,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[asyncio.Future[QueryPlan], float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_plan(
+        self, question: str, plan_query: Callable[[str], Awaitable[QueryPlan]]
+    ) -> QueryPlan:
+        key = normalize_question(question)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[1] < self.ttl_seconds:
+            self._entries.move_to_end(key)
+            logger.debug(f"Plan cache hit: {key}")
+            return await asyncio.shield(entry[0])
+
+        future = asyncio.ensure_future(plan_query(question))
+        self._entries[key] = (future, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self._entries.get(key, (None,))[0] is future:
+                del self._entries[key]
+            raise
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -7,6 +7,7 @@ from lattice.querying.query_planner.models import (
 )
 from lattice.querying.query_planner.parsers import (
     build_fallback_plan,
+    build_literal_plan,
     determine_search_type,
     extract_entities_from_text,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "QueryRelationship",
     "SubQuery",
     "build_fallback_plan",
+    "build_literal_plan",
     "determine_search_type",
     "extract_entities_from_text",
 ]
@@ -6,6 +6,7 @@ from lattice.querying.query_planner.models import (
     ExtractedEntity,
     QueryIntent,
     QueryPlan,
+    QueryRelationship,
     SubQuery,
 )
 
@@ -15,6 +16,14 @@ _RE_JSON_OBJECT = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)
 _RE_CAMEL_CASE = re.compile(r"\b([A-Z][a-z]+(?:[A-Z][a-z]+)+)\b")
 _RE_SNAKE_CASE = re.compile(r"\b([a-z]+(?:_[a-z]+)+)\b")
 _RE_BACKTICK = re.compile(r"`([^`]+)`")
+_RE_IDENTIFIER = r"`?([A-Za-z_][\w.]*)(?:\(\))?`?"
+_RE_LITERAL_NAME = re.compile(rf"^{_RE_IDENTIFIER}\??$")
+# Backticks, a call, a dotted path, snake_case or camelCase/CamelCase; plain words are not code.
+_RE_CODE_SHAPED = re.compile(r"`|\(\)|\w\.\w|_|[a-z][A-Z]")
+_RE_EXPLAIN_TEMPLATE = re.compile(rf"^explain how {_RE_IDENTIFIER} works\b", re.IGNORECASE)
+_RE_CALL_CHAIN_TEMPLATE = re.compile(
+    rf"^how does {_RE_IDENTIFIER} eventually call {_RE_IDENTIFIER}\??", re.IGNORECASE
+)
 
 
 def extract_json(content: str) -> dict[str, Any]:
@@ -157,3 +166,67 @@ def build_fallback_plan(question: str) -> QueryPlan:
         ),
         reasoning="Fallback heuristic analysis",
     )
+
+
+def build_literal_plan(question: str) -> QueryPlan | None:
+    """Plan bare identifiers and templated questions without an LLM call."""
+    question = question.strip()
+
+    if match := _RE_CALL_CHAIN_TEMPLATE.match(question):
+        source, target = match.groups()
+        return _direct_plan(
+            question,
+            QueryIntent.FIND_CALL_CHAIN,
+            [
+                ExtractedEntity(name=source, is_primary=True),
+                ExtractedEntity(name=target),
+            ],
+            relationships=[QueryRelationship(source, target, "calls")],
+            max_hops=3,
+        )
+    if match := _RE_EXPLAIN_TEMPLATE.match(question):
+        return _direct_plan(
+            question,
+            QueryIntent.EXPLAIN_IMPLEMENTATION,
+            [ExtractedEntity(name=match.group(1), is_primary=True)],
+            max_hops=3,
+        )
+    if (match := _RE_LITERAL_NAME.match(question)) and _RE_CODE_SHAPED.search(question):
+        return _direct_plan(
+            question,
+            QueryIntent.LOCATE_ENTITY,
+            [ExtractedEntity(name=match.group(1), is_primary=True)],
+        )
+    return None
+
+
+def _direct_plan(
+    question: str,
+    intent: QueryIntent,
+    entities: list[ExtractedEntity],
+    relationships: list[QueryRelationship] | None = None,
+    max_hops: int = 1,
+) -> QueryPlan:
+    relationships = relationships or []
+    return QueryPlan(
+        original_query=question,
+        primary_intent=intent,
+        sub_queries=[
+            SubQuery(
+                query_text=question,
+                intent=intent,
+                entities=entities,
+                relationships=relationships,
+                search_type=determine_search_type(intent),
+                priority=1,
+            )
+        ],
+        entities=entities,
+        relationships=relationships,
+        requires_multi_hop=max_hops > 1,
+        max_hops=max_hops,
+        context_requirements=(
+            ["implementation_details"] if intent == QueryIntent.EXPLAIN_IMPLEMENTATION else []
+        ),
+        reasoning="Direct literal lookup",
+    )
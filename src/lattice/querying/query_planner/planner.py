@@ -15,6 +15,7 @@ from lattice.querying.query_planner.models import (
 )
 from lattice.querying.query_planner.parsers import (
     build_fallback_plan,
+    build_literal_plan,
     determine_search_type,
     extract_json,
 )
@@ -35,6 +36,11 @@ class QueryPlanner:
         if not question or not question.strip():
             raise QueryError("Question cannot be empty")
 
+        literal_plan = build_literal_plan(question)
+        if literal_plan is not None:
+            logger.debug(f"Literal query, skipping LLM planning: {question}")
+            return literal_plan
+
         try:
             logger.debug(f"Planning query: {question}")
 
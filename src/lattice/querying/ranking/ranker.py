@@ -1,3 +1,4 @@
+import heapq
 import logging
 from typing import Any
 
@@ -21,35 +22,35 @@ class HybridRanker:
         graph_context: GraphContext,
         vector_results: list[dict[str, Any]],
         centrality_scores: dict[str, dict[str, int]] | None = None,
+        limit: int | None = None,
     ) -> list[RankedResult]:
-        graph_count = len(self._count_graph_entities(graph_context))
-        vector_count = len(vector_results)
-        logger.debug(f"Ranking results: graph={graph_count}, vector={vector_count}")
+        if logger.isEnabledFor(logging.DEBUG):
+            graph_count = self._count_graph_entities(graph_context)
+            logger.debug(f"Ranking results: graph={graph_count}, vector={len(vector_results)}")
 
         weights = self._get_adjusted_weights(plan.primary_intent)
+        query_entities = {e.name.lower() for e in plan.entities}
+        centrality_scores = centrality_scores or {}
 
         results_map: dict[str, RankedResult] = {}
 
         self._process_graph_results(
             results_map,
             graph_context,
-            plan,
             weights,
-            centrality_scores or {},
+            centrality_scores,
+            query_entities,
         )
 
         self._process_vector_results(
             results_map,
             vector_results,
-            plan,
             weights,
-            centrality_scores or {},
+            centrality_scores,
+            query_entities,
         )
 
-        results = list(results_map.values())
-        results.sort(key=lambda r: r.final_score, reverse=True)
-
-        deduplicated = self._deduplicate_and_limit(results)
+        deduplicated = self._deduplicate_and_limit(list(results_map.values()), limit)
 
         logger.debug(f"Ranking complete: {len(deduplicated)} results after deduplication")
 
@@ -73,11 +74,10 @@ class HybridRanker:
         self,
         results_map: dict[str, RankedResult],
         graph_context: GraphContext,
-        plan: QueryPlan,
         weights: dict[str, float],
         centrality_scores: dict[str, dict[str, int]],
+        query_entities: set[str],
     ) -> None:
-        query_entities = {e.name.lower() for e in plan.entities}
 
         for node in graph_context.primary_entities:
             result = self._graph_node_to_result(node)
@@ -153,11 +153,10 @@ class HybridRanker:
         self,
         results_map: dict[str, RankedResult],
         vector_results: list[dict[str, Any]],
-        plan: QueryPlan,
         weights: dict[str, float],
         centrality_scores: dict[str, dict[str, int]],
+        query_entities: set[str],
     ) -> None:
-        query_entities = {e.name.lower() for e in plan.entities}
 
         for vr in vector_results:
             result = self._vector_result_to_ranked(vr)
@@ -203,12 +202,19 @@ class HybridRanker:
             existing.final_score = combined_score
             existing.source = ResultSource.HYBRID.value
 
-    def _deduplicate_and_limit(self, results: list[RankedResult]) -> list[RankedResult]:
+    def _deduplicate_and_limit(
+        self, results: list[RankedResult], limit: int | None = None
+    ) -> list[RankedResult]:
+        max_total = min(self.config.max_total, limit) if limit else self.config.max_total
+        heap = [(-result.final_score, i, result) for i, result in enumerate(results)]
+        heapq.heapify(heap)
+
         seen_keys = set()
         file_counts: dict[str, int] = {}
-        deduplicated = []
+        deduplicated: list[RankedResult] = []
 
-        for result in results:
+        while heap:
+            _, _, result = heapq.heappop(heap)
             key = result.get_key()
 
             if key in seen_keys:
@@ -222,7 +228,7 @@ class HybridRanker:
             file_counts[result.file_path] = file_count + 1
             deduplicated.append(result)
 
-            if len(deduplicated) >= self.config.max_total:
+            if len(deduplicated) >= max_total:
                 break
 
         return deduplicated
@@ -255,12 +261,12 @@ class HybridRanker:
             graph_node_id=vr.get("graph_node_id"),
         )
 
-    def _count_graph_entities(self, graph_context: GraphContext) -> list[GraphNode]:
-        entities = []
-        entities.extend(graph_context.primary_entities)
-        entities.extend(graph_context.callers)
-        entities.extend(graph_context.callees)
-        entities.extend(graph_context.methods)
-        entities.extend(graph_context.parent_classes)
-        entities.extend(graph_context.child_classes)
-        return entities
+    def _count_graph_entities(self, graph_context: GraphContext) -> int:
+        return (
+            len(graph_context.primary_entities)
+            + len(graph_context.callers)
+            + len(graph_context.callees)
+            + len(graph_context.methods)
+            + len(graph_context.parent_classes)
+            + len(graph_context.child_classes)
+        )
@@ -21,6 +21,7 @@ class ResponseGenerator:
     ):
         settings = get_settings()
         self.temperature = settings.llm_temperature
+        self._settings = settings.query
 
         self._llm_provider: BaseLLMProvider = get_llm_provider(
             provider=provider,
@@ -56,7 +57,7 @@ class ResponseGenerator:
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": response_prompt},
                 ],
-                max_tokens=get_settings().query.max_response_tokens,
+                max_tokens=self._settings.max_response_tokens,
             )
 
             logger.debug(f"Generated response length: {len(answer)}")
@@ -93,7 +94,7 @@ class ResponseGenerator:
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt},
                 ],
-                max_tokens=get_settings().query.max_explanation_tokens,
+                max_tokens=self._settings.max_explanation_tokens,
             )
 
             logger.debug(f"Generated explanation length: {len(answer)}")
@@ -1,17 +1,72 @@
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 
 from lattice.infrastructure.llm import BaseLLMProvider
 from lattice.prompts import get_prompt
 from lattice.querying.context import EnrichedContext, format_context_for_llm
 from lattice.querying.query_planner import QueryIntent, QueryPlan
 from lattice.querying.ranking import RankedResult
+from lattice.shared.config import QueryConfig
+from lattice.shared.hashing import compute_content_hash
 
 logger = logging.getLogger(__name__)
 
 
+_INTENT_PROMPTS = {
+    QueryIntent.FIND_CALLERS: "intent_find_callers",
+    QueryIntent.FIND_CALLEES: "intent_find_callees",
+    QueryIntent.FIND_CALL_CHAIN: "intent_find_call_chain",
+    QueryIntent.FIND_HIERARCHY: "intent_find_hierarchy",
+    QueryIntent.EXPLAIN_IMPLEMENTATION: "intent_explain_implementation",
+    QueryIntent.EXPLAIN_DATA_FLOW: "intent_explain_data_flow",
+    QueryIntent.SEARCH_FUNCTIONALITY: "intent_search_functionality",
+}
+
+
+def _build_system_prompts() -> dict[QueryIntent, str]:
+    base_prompt = get_prompt("query", "enhanced_system")
+    prompts = dict.fromkeys(QueryIntent, base_prompt)
+    for intent, prompt_name in _INTENT_PROMPTS.items():
+        prompts[intent] = base_prompt + get_prompt("query", prompt_name)
+    return prompts
+
+
+def _messages_key(messages: list[dict[str, str]]) -> str:
+    return compute_content_hash("\0".join(m["content"] for m in messages).encode())
+
+
+@dataclass(frozen=True)
+class ResponsePrompt:
+    messages: list[dict[str, str]]
+    key: str
+
+
 class ResponseBuilder:
-    def __init__(self, llm_provider: BaseLLMProvider):
+    def __init__(
+        self,
+        llm_provider: BaseLLMProvider,
+        cache_size: int = QueryConfig.response_cache_size,
+        cache_ttl_seconds: float = QueryConfig.response_cache_ttl_seconds,
+    ):
         self._llm_provider = llm_provider
+        self._system_prompts = _build_system_prompts()
+        self._cache_size = cache_size
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._responses: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def prepare_prompt(
+        self, question: str, plan: QueryPlan, context: EnrichedContext
+    ) -> ResponsePrompt:
+        """Build the LLM messages and their cache key once, for reuse by the calls below."""
+        messages = self._build_messages(question, plan, context)
+        return ResponsePrompt(messages=messages, key=_messages_key(messages))
+
+    def cached_response(self, prompt: ResponsePrompt) -> str | None:
+        """Return a stored answer for an identical prompt, if one is still fresh."""
+        return self._get_cached(prompt.key)
 
     async def generate_response(
         self,
@@ -20,38 +75,71 @@ class ResponseBuilder:
         results: list[RankedResult],
         context: EnrichedContext,
     ) -> str:
+        prompt = self.prepare_prompt(question, plan, context)
+        cached = self._get_cached(prompt.key)
+        if cached is not None:
+            return cached
+
+        response = await self._llm_provider.complete(messages=prompt.messages, max_tokens=2000)
+
+        answer = response.strip()
+        self._store(prompt.key, answer)
+        return answer
+
+    async def stream_response(
+        self,
+        question: str,
+        plan: QueryPlan,
+        results: list[RankedResult],
+        context: EnrichedContext,
+        prompt: ResponsePrompt | None = None,
+    ) -> AsyncIterator[str]:
+        if prompt is None:
+            prompt = self.prepare_prompt(question, plan, context)
+        cached = self._get_cached(prompt.key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        async for chunk in self._llm_provider.stream(messages=prompt.messages, max_tokens=2000):
+            chunks.append(chunk)
+            yield chunk
+        self._store(prompt.key, "".join(chunks).strip())
+
+    def _get_cached(self, key: str) -> str | None:
+        entry = self._responses.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] >= self._cache_ttl_seconds:
+            del self._responses[key]
+            return None
+        self._responses.move_to_end(key)
+        return entry[0]
+
+    def _store(self, key: str, answer: str) -> None:
+        if not answer:
+            return
+        self._responses[key] = (answer, time.monotonic())
+        self._responses.move_to_end(key)
+        while len(self._responses) > self._cache_size:
+            self._responses.popitem(last=False)
+
+    def _build_messages(
+        self, question: str, plan: QueryPlan, context: EnrichedContext
+    ) -> list[dict[str, str]]:
         context_text = format_context_for_llm(context)
 
         system_prompt = self._get_system_prompt(plan.primary_intent)
         user_prompt = self._build_user_prompt(question, plan, context_text)
 
-        response = await self._llm_provider.complete(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=2000,
-        )
-
-        return response.strip()
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
     def _get_system_prompt(self, intent: QueryIntent) -> str:
-        base_prompt = get_prompt("query", "enhanced_system")
-
-        intent_prompt_map = {
-            QueryIntent.FIND_CALLERS: "intent_find_callers",
-            QueryIntent.FIND_CALLEES: "intent_find_callees",
-            QueryIntent.FIND_CALL_CHAIN: "intent_find_call_chain",
-            QueryIntent.FIND_HIERARCHY: "intent_find_hierarchy",
-            QueryIntent.EXPLAIN_IMPLEMENTATION: "intent_explain_implementation",
-            QueryIntent.EXPLAIN_DATA_FLOW: "intent_explain_data_flow",
-            QueryIntent.SEARCH_FUNCTIONALITY: "intent_search_functionality",
-        }
-
-        prompt_name = intent_prompt_map.get(intent)
-        if prompt_name:
-            return base_prompt + get_prompt("query", prompt_name)
-        return base_prompt
+        return self._system_prompts[intent]
 
     def _build_user_prompt(
         self,
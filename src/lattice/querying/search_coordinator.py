@@ -6,9 +6,20 @@ from lattice.querying.graph_reasoning import GraphContext, GraphReasoningEngine
 from lattice.querying.query_planner import QueryIntent, QueryPlan
 from lattice.querying.vector_search import VectorSearcher
 from lattice.shared.config import get_settings
+from lattice.shared.exceptions import EmbeddingError, QueryError
 
 logger = logging.getLogger(__name__)
 
+_SUMMARY_INTENTS = frozenset(
+    {
+        QueryIntent.EXPLAIN_IMPLEMENTATION,
+        QueryIntent.EXPLAIN_RELATIONSHIP,
+        QueryIntent.EXPLAIN_DATA_FLOW,
+        QueryIntent.EXPLAIN_ARCHITECTURE,
+        QueryIntent.SEARCH_FUNCTIONALITY,
+    }
+)
+
 
 class SearchCoordinator:
     def __init__(
@@ -18,6 +29,7 @@ class SearchCoordinator:
     ):
         self._vector_searcher = vector_searcher
         self._graph_engine = graph_engine
+        self._settings = get_settings().query
 
     async def execute_vector_search(
         self,
@@ -26,56 +38,62 @@ class SearchCoordinator:
         limit: int,
         language: str | None,
         project_name: str | None = None,
+        query_vector: list[float] | None = None,
     ) -> list[dict[str, Any]]:
-        settings = get_settings()
-        max_vector = settings.query.max_vector_results
-        code_results = await self._vector_searcher.search_code(
+        max_vector = self._settings.max_vector_results
+        if query_vector is None:
+            query_vector = await self._embed_query(query)
+
+        code_search = self._vector_searcher.search_code(
             query=query,
             limit=min(limit, max_vector),
             language=language,
             project_name=project_name,
+            query_vector=query_vector,
         )
 
-        if plan.primary_intent in (
-            QueryIntent.EXPLAIN_IMPLEMENTATION,
-            QueryIntent.EXPLAIN_RELATIONSHIP,
-            QueryIntent.EXPLAIN_DATA_FLOW,
-            QueryIntent.EXPLAIN_ARCHITECTURE,
-            QueryIntent.SEARCH_FUNCTIONALITY,
-        ):
-            summary_results = await self._vector_searcher.search_summaries(
+        if plan.primary_intent not in _SUMMARY_INTENTS:
+            return await code_search
+
+        code_results, summary_results = await asyncio.gather(
+            code_search,
+            self._vector_searcher.search_summaries(
                 query=query,
                 limit=limit // 2,
                 project_name=project_name,
-            )
-            code_results.extend(summary_results)
+                query_vector=query_vector,
+            ),
+        )
+        return code_results + summary_results
 
-        return code_results
+    async def _embed_query(self, query: str) -> list[float]:
+        try:
+            return await self._vector_searcher.embedder.embed(query)
+        except EmbeddingError as e:
+            logger.error(f"Embedding error: {e}")
+            raise QueryError("Failed to embed search query", cause=e)
 
     async def get_centrality_scores(
         self,
         graph_context: GraphContext,
         vector_results: list[dict[str, Any]],
     ) -> dict[str, dict[str, int]]:
-        entities = set()
-
-        for entity in graph_context.primary_entities[:5]:
-            entities.add(entity.qualified_name or entity.name)
-
-        for vr in vector_results[:5]:
-            if vr.get("entity_name"):
-                entities.add(vr.get("graph_node_id") or vr.get("entity_name"))
-
-        settings = get_settings()
-        entities = list(entities)[: settings.query.max_centrality_lookups]
-
-        scores: dict[str, dict[str, int]] = {}
-        if entities:
-            tasks = [self._graph_engine.get_entity_centrality(name) for name in entities]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for name, result in zip(entities, results):
-                if isinstance(result, dict):
-                    scores[name] = result
+        candidates = dict.fromkeys(
+            [
+                *(e.qualified_name or e.name for e in graph_context.primary_entities[:5]),
+                *(
+                    vr.get("graph_node_id") or vr["entity_name"]
+                    for vr in vector_results[:5]
+                    if vr.get("entity_name")
+                ),
+            ]
+        )
+        entities = list(candidates)[: self._settings.max_centrality_lookups]
 
-        return scores
+        if not entities:
+            return {}
+        try:
+            return await self._graph_engine.get_entities_centrality(entities)
+        except Exception as e:
+            logger.warning(f"Centrality lookup failed: {e}")
+            return {}
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -8,32 +9,42 @@ from lattice.shared.exceptions import QueryError
 logger = logging.getLogger(__name__)
 
 
+_COUNT_LABELS = {
+    "file_count": "File",
+    "class_count": "Class",
+    "function_count": "Function",
+    "method_count": "Method",
+}
+
+_COUNT_QUERY = " UNION ALL ".join(
+    f"MATCH (n:{label}) RETURN '{key}' AS key, count(n) AS count"
+    for key, label in _COUNT_LABELS.items()
+)
+
+
+async def _node_counts(memgraph: MemgraphClient) -> dict[str, int]:
+    counts = dict.fromkeys(_COUNT_LABELS, 0)
+    for row in await memgraph.execute(_COUNT_QUERY):
+        counts[row["key"]] = row["count"]
+    return counts
+
+
+async def _vector_count(qdrant: QdrantManager) -> int:
+    try:
+        code_info = await qdrant.get_collection_info(CollectionName.CODE_CHUNKS.value)
+        return code_info.points_count or 0
+    except Exception:
+        return 0
+
+
 async def get_codebase_statistics(
     memgraph: MemgraphClient,
     qdrant: QdrantManager,
 ) -> dict[str, Any]:
     try:
-        graph_stats = await memgraph.execute(
-            """
-            MATCH (f:File)
-            WITH count(f) as file_count
-            MATCH (c:Class)
-            WITH file_count, count(c) as class_count
-            MATCH (fn:Function)
-            WITH file_count, class_count, count(fn) as function_count
-            MATCH (m:Method)
-            RETURN file_count, class_count, function_count, count(m) as method_count
-            """
-        )
-
-        try:
-            code_info = await qdrant.get_collection_info(CollectionName.CODE_CHUNKS.value)
-            vector_count = code_info.points_count
-        except Exception:
-            vector_count = 0
-
-        stats = graph_stats[0] if graph_stats else {}
-        stats["vector_count"] = vector_count
+        counts, vector_count = await asyncio.gather(_node_counts(memgraph), _vector_count(qdrant))
+
+        stats: dict[str, Any] = {**counts, "vector_count": vector_count}
 
         return stats
 
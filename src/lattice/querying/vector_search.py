@@ -82,6 +82,7 @@ async def search_code(
     language: str | None = None,
     entity_type: str | None = None,
     project_name: str | None = None,
+    query_vector: list[float] | None = None,
 ) -> list[dict]:
     if limit is None:
         limit = QueryConfig.default_search_limit
@@ -91,7 +92,7 @@ async def search_code(
 
     try:
         logger.debug(f"Searching code: query='{query}', limit={limit}, language={language}")
-        query_embedding = await embedder.embed(query)
+        query_embedding = query_vector or await embedder.embed(query)
 
         filters = {}
         if language:
@@ -125,6 +126,7 @@ async def search_summaries(
     query: str,
     limit: int | None = None,
     project_name: str | None = None,
+    query_vector: list[float] | None = None,
 ) -> list[dict]:
     if limit is None:
         limit = QueryConfig.default_search_limit
@@ -134,7 +136,7 @@ async def search_summaries(
 
     try:
         logger.debug(f"Searching summaries: query='{query}', limit={limit}")
-        query_embedding = await embedder.embed(query)
+        query_embedding = query_vector or await embedder.embed(query)
 
         filters = {}
         if project_name:
@@ -223,6 +225,7 @@ class VectorSearcher:
         language: str | None = None,
         entity_type: str | None = None,
         project_name: str | None = None,
+        query_vector: list[float] | None = None,
     ) -> list[dict]:
         return await search_code(
             self.qdrant,
@@ -232,6 +235,7 @@ class VectorSearcher:
             language,
             entity_type,
             project_name,
+            query_vector,
         )
 
     async def search_summaries(
@@ -239,6 +243,7 @@ class VectorSearcher:
         query: str,
         limit: int | None = None,
         project_name: str | None = None,
+        query_vector: list[float] | None = None,
     ) -> list[dict]:
         return await search_summaries(
             self.qdrant,
@@ -246,6 +251,7 @@ class VectorSearcher:
             query,
             limit,
             project_name,
+            query_vector,
         )
 
     async def find_similar_code(
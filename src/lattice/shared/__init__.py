@@ -6,12 +6,13 @@ This module provides unified access to:
 - exceptions: Domain exceptions
 - types: Shared type definitions
 - cache: Caching utilities
+- hashing: Content hashing for change detection
 - protocols: Protocol definitions
 """
 
 from __future__ import annotations
 
-from lattice.shared.cache import ASTCache, BoundedCache, FunctionRegistry
+from lattice.shared.cache import ASTCache, BoundedCache, FunctionRegistry, PersistentCache
 from lattice.shared.config import Settings, get_settings
 from lattice.shared.exceptions import (
     CodeRAGError,
@@ -27,6 +28,7 @@ from lattice.shared.exceptions import (
     SummarizationError,
     VectorStoreError,
 )
+from lattice.shared.hashing import CONTENT_HASH_ALGORITHM, compute_content_hash
 from lattice.shared.ports import (
     EmbeddingProvider,
     GraphReader,
@@ -93,5 +95,9 @@ __all__ = [
     # Cache
     "ASTCache",
     "BoundedCache",
+    "PersistentCache",
     "FunctionRegistry",
+    # Hashing
+    "CONTENT_HASH_ALGORITHM",
+    "compute_content_hash",
 ]
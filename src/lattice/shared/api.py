@@ -1,6 +1,6 @@
 """Public API for shared cross-cutting concerns."""
 
-from lattice.shared.cache import ASTCache, BoundedCache, FunctionRegistry
+from lattice.shared.cache import ASTCache, BoundedCache, FunctionRegistry, PersistentCache
 from lattice.shared.config import Settings, get_settings
 from lattice.shared.exceptions import (
     CodeRAGError,
@@ -16,6 +16,7 @@ from lattice.shared.exceptions import (
     SummarizationError,
     VectorStoreError,
 )
+from lattice.shared.hashing import CONTENT_HASH_ALGORITHM, compute_content_hash
 from lattice.shared.ports import (
     EmbeddingProvider,
     GraphReader,
@@ -82,5 +83,9 @@ __all__ = [
     # Cache
     "ASTCache",
     "BoundedCache",
+    "PersistentCache",
     "FunctionRegistry",
+    # Hashing
+    "CONTENT_HASH_ALGORITHM",
+    "compute_content_hash",
 ]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import shelve
 import sys
 from collections import OrderedDict
 from pathlib import Path
@@ -121,6 +123,30 @@ class ASTCache(BoundedCache[Path, tuple[Any, str]]):
         return list(self._cache.keys())
 
 
+class PersistentCache:
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._shelf: shelve.Shelf[Any] = shelve.open(str(path))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._shelf
+
+    def __getitem__(self, key: str) -> Any:
+        return self._shelf[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._shelf[key] = value
+
+    def __len__(self) -> int:
+        return len(self._shelf)
+
+    def sync(self) -> None:
+        self._shelf.sync()
+
+    def close(self) -> None:
+        self._shelf.close()
+
+
 class FunctionRegistry:
     def __init__(self, simple_name_lookup: dict[str, set[str]] | None = None):
         self._entries: dict[str, str] = {}
@@ -229,6 +255,12 @@ class FunctionRegistry:
             self.unregister(qn)
         return len(entries_to_remove)
 
+    def version_hash(self) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for qualified_name, entity_type in sorted(self._entries.items()):
+            digest.update(f"{qualified_name}\0{entity_type}\n".encode())
+        return digest.hexdigest()
+
     def all_entries(self) -> dict[str, str]:
         return dict(self._entries)
 
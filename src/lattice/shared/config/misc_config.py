@@ -47,7 +47,8 @@ class GraphConfig:
 
 class WatcherConfig:
     debounce_delay: float = get_config_value("watcher", "debounce_delay", default=0.5)
-    observer_join_timeout: float = get_config_value("watcher", "observer_join_timeout", default=5.0)
+    batch_debounce_ms: int = get_config_value("watcher", "batch_debounce_ms", default=1600)
+    batch_step_ms: int = get_config_value("watcher", "batch_step_ms", default=50)
     queue_get_timeout: float = get_config_value("watcher", "queue_get_timeout", default=1.0)
 
 
@@ -83,3 +84,6 @@ class CachingConfig:
     memory_pressure_threshold: float = get_config_value(
         "caching", "memory_pressure_threshold", default=0.8
     )
+    embedding_cache_path: str = get_config_value(
+        "caching", "embedding_cache_path", default="~/.lattice/embeddings.db"
+    )
@@ -12,6 +12,21 @@ class QueryConfig:
     planning_max_tokens: int = get_config_value("query", "planning_max_tokens", default=2000)
     completion_max_tokens: int = get_config_value("query", "completion_max_tokens", default=2000)
     fallback_max_hops: int = get_config_value("query", "fallback_max_hops", default=3)
+    answer_cache_size: int = get_config_value("query", "answer_cache_size", default=500)
+    answer_cache_similarity: float = get_config_value(
+        "query", "answer_cache_similarity", default=0.95
+    )
+    plan_cache_size: int = get_config_value("query", "plan_cache_size", default=256)
+    plan_cache_ttl_seconds: float = get_config_value(
+        "query", "plan_cache_ttl_seconds", default=3600
+    )
+    response_cache_size: int = get_config_value("query", "response_cache_size", default=1024)
+    response_cache_ttl_seconds: float = get_config_value(
+        "query", "response_cache_ttl_seconds", default=900
+    )
+    ranking_thread_threshold: int = get_config_value(
+        "query", "ranking_thread_threshold", default=50
+    )
 
 
 class QueryReasoningConfig:
@@ -17,6 +17,7 @@ class DatabaseSettings(BaseSettings):
     memgraph_port: int = Field(default=7687, ge=1, le=65535)
     memgraph_user: str = Field(default="memgraph")
     memgraph_password: str = Field(default="memgraph")
+    memgraph_pool_max: int = Field(default=16, ge=1, le=100)
 
     qdrant_host: str = Field(default="localhost")
     qdrant_port: int = Field(default=6333, ge=1, le=65535)
@@ -213,6 +214,10 @@ class Settings(BaseSettings):
     def memgraph_uri(self) -> str:
         return self.database.memgraph_uri
 
+    @property
+    def memgraph_pool_max(self) -> int:
+        return self.database.memgraph_pool_max
+
     @property
     def qdrant_host(self) -> str:
         return self.database.qdrant_host
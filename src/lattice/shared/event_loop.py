@@ -0,0 +1,24 @@
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def use_fast_event_loop() -> bool:
+    """Switch asyncio to uvloop (or winloop on Windows) when it is installed.
+
+    Must run before the first asyncio.run() call. Returns whether a faster loop
+    policy was installed; the default loop is kept otherwise.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl  # type: ignore[import-not-found]
+        else:
+            import uvloop as loop_impl  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+    logger.debug(f"Using {loop_impl.__name__} event loop")
+    return True
@@ -0,0 +1,9 @@
+import mmap
+
+import xxhash
+
+CONTENT_HASH_ALGORITHM = "xxh128"
+
+
+def compute_content_hash(content: bytes | mmap.mmap) -> str:
+    return xxhash.xxh128_hexdigest(content)
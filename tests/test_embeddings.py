@@ -6,6 +6,12 @@ from pathlib import Path
 
 from lattice.shared.types import EntityType, Language
 from lattice.shared.exceptions import EmbeddingError, IndexingError
+from lattice.infrastructure.llm import (
+    BaseEmbeddingProvider,
+    CachedEmbeddingProvider,
+    ProviderConfig,
+)
+from lattice.infrastructure.qdrant.client import QdrantManager
 from lattice.infrastructure.qdrant.chunker import CodeChunk, chunk_file, count_tokens
 from lattice.infrastructure.qdrant.indexer import VectorIndexer, VectorSearcher, CodeSearchResult
 from lattice.parsing.models import CodeEntity, FileInfo, ParsedFile
@@ -240,6 +246,7 @@ class TestCodeChunker:
         payload = chunk.to_payload()
 
         assert payload["file_path"] == "/project/main.py"
+        assert payload["dir_path"] == ["/project", "/"]
         assert payload["entity_type"] == "function"
         assert payload["entity_name"] == "hello"
         assert payload["language"] == "python"
@@ -567,6 +574,86 @@ class TestVectorSearcher:
         assert call_kwargs["limit"] == 5
 
 
+class TestQdrantFilters:
+    """Tests for QdrantManager filter construction."""
+
+    def test_equal_conditions_reuse_one_filter(self):
+        """Test that the same conditions in any order map to a single Filter object."""
+        manager = QdrantManager("localhost", 6333, 6334, 3)
+
+        first = manager._build_filter({"language": "python", "project_name": "demo"})
+        second = manager._build_filter({"project_name": "demo", "language": "python"})
+        other = manager._build_filter({"language": "rust", "project_name": "demo"})
+
+        assert first is second
+        assert other is not first
+        assert [c.key for c in first.must] == ["language", "project_name"]
+
+
+# ============================================================================
+# Embedding Cache Tests
+# ============================================================================
+
+class FakeEmbeddingProvider(BaseEmbeddingProvider):
+    """Embedding provider that records every batch it is asked to embed."""
+
+    def __init__(self, model: str = "fake-model"):
+        super().__init__(ProviderConfig(provider="fake", model=model))
+        self.batches: list[list[str]] = []
+
+    async def _embed_impl(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text)), 0.5, -1.0] for text in texts]
+
+
+class TestCachedEmbeddingProvider:
+    """Tests for CachedEmbeddingProvider."""
+
+    @pytest.mark.asyncio
+    async def test_cached_texts_survive_restart(self, tmp_path):
+        """Test that a reopened cache serves stored vectors without calling the provider."""
+        db_path = tmp_path / "embeddings.db"
+        cached = CachedEmbeddingProvider(FakeEmbeddingProvider(), db_path)
+        first = await cached.embed("how does login work")
+        cached.close()
+
+        provider = FakeEmbeddingProvider()
+        cached = CachedEmbeddingProvider(provider, db_path)
+        second = await cached.embed("how does login work")
+        cached.close()
+
+        assert first == second == [19.0, 0.5, -1.0]
+        assert provider.batches == []
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_embedded_in_one_batch(self, tmp_path):
+        """Test that a batch sends just the uncached, de-duplicated texts upstream."""
+        provider = FakeEmbeddingProvider()
+        cached = CachedEmbeddingProvider(provider, tmp_path / "embeddings.db")
+        await cached.embed("a")
+
+        vectors = await cached.embed_batch(["a", "bb", "bb", "ccc"])
+        cached.close()
+
+        assert provider.batches == [["a"], ["bb", "ccc"]]
+        assert [v[0] for v in vectors] == [1.0, 2.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_model(self, tmp_path):
+        """Test that switching embedding models does not reuse vectors."""
+        db_path = tmp_path / "embeddings.db"
+        cached = CachedEmbeddingProvider(FakeEmbeddingProvider("model-a"), db_path)
+        await cached.embed("text")
+        cached.close()
+
+        provider = FakeEmbeddingProvider("model-b")
+        cached = CachedEmbeddingProvider(provider, db_path)
+        await cached.embed("text")
+        cached.close()
+
+        assert provider.batches == [["text"]]
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -0,0 +1,37 @@
+"""Tests for the MCP server."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from lattice.mcp.server import MCPServer
+
+
+class TestMCPServer:
+    """Tests for MCPServer."""
+
+    async def test_index_invalidates_shared_query_engine(self, tmp_path):
+        """Test that a successful index run drops the held engine's cached answers."""
+        server = MCPServer(repo_path=tmp_path, project_name="demo")
+        engine = MagicMock()
+        server._query_engine = engine
+        orchestrator = MagicMock(run=AsyncMock(return_value={"files_indexed": 1}))
+        server._create_orchestrator = AsyncMock(return_value=orchestrator)
+        server._register_tools()
+
+        result = await server.tools["index_repository"]["function"](repo_path=str(tmp_path))
+
+        assert result.success
+        engine.bump_version.assert_called_once()
+
+    async def test_failed_index_keeps_cached_answers(self, tmp_path):
+        """Test that a failed index run leaves the held engine untouched."""
+        server = MCPServer(repo_path=tmp_path, project_name="demo")
+        engine = MagicMock()
+        server._query_engine = engine
+        orchestrator = MagicMock(run=AsyncMock(side_effect=RuntimeError("memgraph down")))
+        server._create_orchestrator = AsyncMock(return_value=orchestrator)
+        server._register_tools()
+
+        result = await server.tools["index_repository"]["function"](repo_path=str(tmp_path))
+
+        assert not result.success
+        engine.bump_version.assert_not_called()
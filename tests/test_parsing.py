@@ -38,7 +38,7 @@ class TestFileScanner:
 
         for f in files:
             assert f.content_hash, "Should have content hash"
-            assert len(f.content_hash) == 64, "Hash should be SHA256 (64 hex chars)"
+            assert len(f.content_hash) == 32, "Hash should be xxh128 (32 hex chars)"
 
     def test_scanner_ignores_node_modules(self, tmp_path: Path):
         """Test that scanner ignores node_modules."""
@@ -62,14 +62,14 @@ class TestCodeParser:
     def test_parse_python_file(self, sample_python_file: Path):
         """Test parsing a Python file."""
         from lattice.parsing.models import FileInfo
-        import hashlib
+        from lattice.shared.hashing import compute_content_hash
 
         content = sample_python_file.read_bytes()
         file_info = FileInfo(
             path=sample_python_file,
             relative_path=sample_python_file.name,
             language=Language.PYTHON,
-            content_hash=hashlib.sha256(content).hexdigest(),
+            content_hash=compute_content_hash(content),
             size_bytes=len(content),
             line_count=content.count(b"\n") + 1,
         )
@@ -124,7 +124,7 @@ class Greeter:
 
     def test_parse_typescript_content(self):
         """Test parsing TypeScript content."""
-        code = '''
+        code = """
 import React from 'react';
 
 interface Props {
@@ -142,7 +142,7 @@ export class Counter extends React.Component {
     this.setState({ count: this.state.count + 1 });
   }
 }
-'''
+"""
         parser = create_code_parser()
         parsed = parser.parse_content(code, Language.TSX)
 
@@ -168,12 +168,12 @@ def documented_function():
 
     def test_extract_function_calls(self):
         """Test that function calls are extracted."""
-        code = '''
+        code = """
 def caller():
     helper()
     other_func()
     obj.method()
-'''
+"""
         parser = create_code_parser()
         parsed = parser.parse_content(code, Language.PYTHON)
 
@@ -183,12 +183,12 @@ def caller():
 
     def test_extract_imports(self):
         """Test that imports are extracted."""
-        code = '''
+        code = """
 import os
 from pathlib import Path
 from typing import Optional, List
 import json as j
-'''
+"""
         parser = create_code_parser()
         parsed = parser.parse_content(code, Language.PYTHON)
 
@@ -198,10 +198,10 @@ import json as j
 
     def test_extract_class_inheritance(self):
         """Test that class inheritance is extracted."""
-        code = '''
+        code = """
 class Child(Parent, Mixin):
     pass
-'''
+"""
         parser = create_code_parser()
         parsed = parser.parse_content(code, Language.PYTHON)
 
@@ -209,6 +209,60 @@ class Child(Parent, Mixin):
         assert "Parent" in cls.base_classes, f"Should find Parent, got {cls.base_classes}"
         assert "Mixin" in cls.base_classes, f"Should find Mixin, got {cls.base_classes}"
 
+    def test_concurrent_parsing_uses_parser_per_thread(self):
+        """Test that parsing from several threads gives each thread its own parser."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        parser = create_code_parser()
+        main_parser = parser._get_parser(Language.PYTHON)
+        sources = [f"def func_{i}():\n    return {i}\n" for i in range(32)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda code: parser.parse_content(code, Language.PYTHON), sources)
+            )
+            thread_parsers = list(
+                executor.map(lambda _: parser._get_parser(Language.PYTHON), range(16))
+            )
+
+        assert [r.functions[0].name for r in results] == [f"func_{i}" for i in range(32)]
+        assert all(thread_parser is not main_parser for thread_parser in thread_parsers)
+
+    def test_reparse_file_matches_full_parse(self, tmp_path: Path):
+        """Test that an incremental reparse yields the same entities as a fresh parse."""
+        source_file = tmp_path / "service.py"
+        source_file.write_text("def first():\n    return 1\n\n\ndef second():\n    return 2\n")
+        parser = create_code_parser()
+        file_info = parser.parse_content(
+            source_file.read_text(), Language.PYTHON, str(source_file)
+        ).file_info
+
+        previous = parser.reparse_file(file_info, None)
+        source_file.write_text(
+            "def first():\n    return 1\n\n\n"
+            "def renamed(x):\n    return x\n\n\n"
+            "def third():\n    pass\n"
+        )
+        reparsed = parser.reparse_file(file_info, previous)
+        fresh = parser.parse_file(file_info)
+
+        assert [f.name for f in reparsed.functions] == [f.name for f in fresh.functions]
+        assert reparsed.entities == fresh.entities
+        assert reparsed._tree.root_node.end_byte == len(source_file.read_bytes())
+
+    def test_parse_file_keeps_tree_only_on_request(self, tmp_path: Path):
+        """Test that parse_file drops the syntax tree unless keep_tree is set."""
+        source_file = tmp_path / "service.py"
+        source_file.write_text("def first():\n    return 1\n")
+        parser = create_code_parser()
+        file_info = parser.parse_content(
+            source_file.read_text(), Language.PYTHON, str(source_file)
+        ).file_info
+
+        assert parser.parse_file(file_info)._tree is None
+        kept = parser.parse_file(file_info, keep_tree=True)
+        assert kept._tree.root_node.end_byte == len(source_file.read_bytes())
+
 
 class TestParsingIntegration:
     """Integration tests for parsing."""
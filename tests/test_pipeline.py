@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 from lattice.indexing.orchestrator import PipelineOrchestrator
 from lattice.indexing.progress import ProgressTracker
+from lattice.indexing.stages import ParseStage, ScanStage
 from lattice.shared.types import PipelineStage
 from lattice.parsing.scanner import FileScanner
 from lattice.parsing.parser import create_code_parser
@@ -17,6 +18,7 @@ def create_mock_orchestrator(
     progress_callback=None,
     force: bool = False,
     skip_metadata: bool = False,
+    cache_dir: Path | None = None,
 ) -> PipelineOrchestrator:
     return PipelineOrchestrator(
         repo_path=repo_path,
@@ -31,6 +33,7 @@ def create_mock_orchestrator(
         summarizer=MagicMock(),
         max_workers=4,
         max_concurrent_api=5,
+        cache_dir=cache_dir,
     )
 
 
@@ -150,6 +153,44 @@ class TestPipelineScanAndParse:
         assert total_entities > 0, "Should find entities"
 
 
+class TestParseStageTypeInference:
+    """Tests for the type inference wiring set up by the parse stage."""
+
+    @pytest.mark.asyncio
+    async def test_return_types_are_stored(self, tmp_path: Path):
+        """Test that resolving a chained call persists the method's return type."""
+        repo_path = tmp_path / "shop"
+        (repo_path / "app").mkdir(parents=True)
+        (repo_path / "app" / "models.py").write_text("class User:\n    pass\n")
+        (repo_path / "app" / "repositories.py").write_text(
+            "from app.models import User\n"
+            "\n"
+            "\n"
+            "class UserRepository:\n"
+            "    def get(self, user_id) -> User:\n"
+            "        pass\n"
+            "\n"
+            "    def active(self) -> 'UserRepository':\n"
+            "        return self\n"
+        )
+        orchestrator = create_mock_orchestrator(repo_path, cache_dir=tmp_path / "cache")
+        ctx = orchestrator._create_context()
+        try:
+            await ScanStage().execute(ctx)
+            await ParseStage().execute(ctx)
+
+            result = ctx.call_processor.resolve_call(
+                "repo.active().get",
+                "shop.app.services",
+                {"repo": "shop.app.repositories.UserRepository"},
+            )
+
+            assert result == ("Method", "shop.app.repositories.UserRepository.get")
+            assert len(ctx.return_type_store) == 1
+        finally:
+            ctx.return_type_store.close()
+
+
 class TestPipelineWithMocks:
     """Tests for pipeline with mocked external services."""
 
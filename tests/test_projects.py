@@ -0,0 +1,57 @@
+"""Tests for project management services."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lattice.infrastructure.qdrant import CollectionName, qdrant_models
+from lattice.projects.cleanup import ProjectCleanupService
+from lattice.shared.exceptions import VectorStoreError
+
+
+class TestProjectCleanupService:
+    """Tests for ProjectCleanupService."""
+
+    async def test_failed_collection_does_not_stop_the_other(self):
+        """Test that one failing collection still lets the other be cleared before raising."""
+        deleted = []
+
+        async def delete(collection_name, points_selector):
+            if collection_name == CollectionName.CODE_CHUNKS.value:
+                raise RuntimeError("qdrant unavailable")
+            deleted.append(collection_name)
+
+        qdrant = MagicMock()
+        qdrant.client.delete = AsyncMock(side_effect=delete)
+        service = ProjectCleanupService(qdrant)
+
+        with pytest.raises(VectorStoreError, match=CollectionName.CODE_CHUNKS.value):
+            await service.delete_from_qdrant("/repo")
+
+        assert deleted == [CollectionName.SUMMARIES.value]
+
+    def test_path_filter_still_matches_legacy_points(self):
+        """Test that points without a dir_path payload are matched by file_path text."""
+        service = ProjectCleanupService(MagicMock())
+        legacy = {"file_path": "/repo/src/app.py"}
+        current = {"file_path": "/other/app.py", "dir_path": ["/other", "/"]}
+
+        path_filter = service._build_path_filter("/repo")
+
+        assert _matches(path_filter, legacy)
+        assert not _matches(path_filter, current)
+
+
+def _matches(condition, payload: dict) -> bool:
+    """Evaluate the subset of Qdrant filter conditions used by cleanup against a payload."""
+    if isinstance(condition, qdrant_models.Filter):
+        must = all(_matches(c, payload) for c in condition.must or [])
+        should = any(_matches(c, payload) for c in condition.should or []) or not condition.should
+        return must and should
+    if isinstance(condition, qdrant_models.IsEmptyCondition):
+        return not payload.get(condition.is_empty.key)
+    value = payload.get(condition.key)
+    values = value if isinstance(value, list) else [value]
+    if isinstance(condition.match, qdrant_models.MatchText):
+        return any(isinstance(v, str) and condition.match.text in v for v in values)
+    return condition.match.value in values
@@ -0,0 +1,75 @@
+"""Tests for the prompt loader."""
+
+import pytest
+
+from lattice.prompts import get_prompt, load_prompts, loader
+
+
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    (tmp_path / "sample.yaml").write_text(
+        "plain: Summarize the code.\n"
+        "greeting:\n"
+        "  template: 'Hello {user}, you have {count} new {{messages}}.'\n"
+        "scored: 'Score for {user!r}: {score:.2f}'\n"
+    )
+    monkeypatch.setattr(loader, "PROMPTS_DIR", tmp_path)
+    loader.clear_cache()
+    yield tmp_path
+    loader.clear_cache()
+
+
+class TestGetPrompt:
+    """Tests for get_prompt."""
+
+    def test_static_prompt_returns_template(self, prompts_dir):
+        """Test that a prompt without arguments is returned unformatted."""
+        assert get_prompt("sample", "plain") == "Summarize the code."
+        assert get_prompt("sample", "greeting") == (
+            "Hello {user}, you have {count} new {{messages}}."
+        )
+
+    def test_prompt_arguments_are_substituted(self, prompts_dir):
+        """Test that keyword arguments fill the template placeholders."""
+        prompt = get_prompt("sample", "greeting", user="Ada", count=3)
+
+        assert prompt == "Hello Ada, you have 3 new {messages}."
+
+    def test_format_specs_and_conversions_are_honoured(self, prompts_dir):
+        """Test that templates using format specs render like str.format."""
+        prompt = get_prompt("sample", "scored", user="Ada", score=0.5)
+
+        assert prompt == "Score for 'Ada': 0.50"
+
+    def test_missing_argument_raises_key_error(self, prompts_dir):
+        """Test that a placeholder without a value raises KeyError."""
+        with pytest.raises(KeyError):
+            get_prompt("sample", "greeting", user="Ada")
+
+    def test_unknown_prompt_raises_key_error(self, prompts_dir):
+        """Test that requesting a missing prompt raises KeyError."""
+        with pytest.raises(KeyError):
+            get_prompt("sample", "does_not_exist")
+
+    def test_clear_cache_reloads_templates(self, prompts_dir):
+        """Test that clearing the cache picks up edited prompt files."""
+        get_prompt("sample", "plain")
+        (prompts_dir / "sample.yaml").write_text("plain: Explain the code.\n")
+        loader.clear_cache()
+
+        assert get_prompt("sample", "plain") == "Explain the code."
+        assert load_prompts("sample") == {"plain": "Explain the code."}
+
+
+class TestPreloadPrompts:
+    """Tests for preload_prompts."""
+
+    def test_preload_parses_every_category(self, prompts_dir):
+        """Test that preloading caches each prompt file so first use does not parse YAML."""
+        (prompts_dir / "other.yaml").write_text("plain: Other prompt.\n")
+
+        loader.preload_prompts()
+
+        assert loader.load_prompts.cache_info().currsize == 2
+        (prompts_dir / "other.yaml").unlink()
+        assert get_prompt("other", "plain") == "Other prompt."
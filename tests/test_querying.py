@@ -0,0 +1,784 @@
+"""Tests for the query engine."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lattice.prompts import get_prompt
+from lattice.querying.answer_cache import AnswerCache
+from lattice.querying.context import EnrichedContext
+from lattice.querying.engine import QueryEngine
+from lattice.querying.graph_reasoning import GraphContext, GraphNode, GraphReasoningEngine
+from lattice.querying.graph_reasoning.context_builder import gather_caller_context
+from lattice.querying.graph_reasoning.entity_finder import find_entity
+from lattice.querying.graph_reasoning.traversal import find_transitive_callers_batch
+from lattice.querying.models import QueryResult
+from lattice.querying.plan_cache import PlanCache
+from lattice.querying.query_planner import (
+    ExtractedEntity,
+    QueryIntent,
+    QueryPlan,
+    QueryPlanner,
+    build_literal_plan,
+)
+from lattice.querying.ranking import HybridRanker, RankingConfig
+from lattice.querying.response_builder import ResponseBuilder
+from lattice.querying.search_coordinator import SearchCoordinator
+from lattice.querying.statistics import get_codebase_statistics
+from lattice.shared.config import QueryConfig
+from lattice.shared.exceptions import GraphError, QueryError
+
+
+def _plan(question: str = "How does login work?") -> QueryPlan:
+    return QueryPlan(
+        original_query=question,
+        primary_intent=QueryIntent.EXPLAIN_IMPLEMENTATION,
+        sub_queries=[],
+        entities=[],
+        relationships=[],
+    )
+
+
+def _result(answer: str) -> MagicMock:
+    result = MagicMock()
+    result.answer = answer
+    return result
+
+
+async def _stream_answer(question, plan, results, context, prompt=None):
+    for chunk in ("The ", "answer."):
+        yield chunk
+
+
+@pytest.fixture
+def engine_parts():
+    planner = MagicMock()
+    planner.plan_query = AsyncMock(return_value=_plan())
+    graph_engine = MagicMock()
+    graph_engine.execute_query_plan = AsyncMock(return_value=GraphContext.empty())
+    search_coordinator = MagicMock()
+    search_coordinator.execute_vector_search = AsyncMock(return_value=[])
+    search_coordinator.get_centrality_scores = AsyncMock(return_value={})
+    context_builder = MagicMock()
+    context_builder.build_enriched_context = AsyncMock(return_value=MagicMock())
+    response_builder = MagicMock()
+    response_builder.stream_response = MagicMock(side_effect=_stream_answer)
+    response_builder.cached_response = MagicMock(return_value=None)
+    embedder = MagicMock()
+    vectors = {
+        "How does login work?": [1.0, 0.0, 0.0],
+        "how does the login work": [0.99, 0.1, 0.0],
+        "Where is billing configured?": [0.0, 1.0, 0.0],
+    }
+    embedder.embed = AsyncMock(side_effect=lambda question: vectors[question])
+    return {
+        "memgraph": MagicMock(close=AsyncMock()),
+        "qdrant": MagicMock(close=AsyncMock()),
+        "planner": planner,
+        "graph_engine": graph_engine,
+        "context_builder": context_builder,
+        "ranker": HybridRanker(RankingConfig()),
+        "response_builder": response_builder,
+        "search_coordinator": search_coordinator,
+        "embedder": embedder,
+    }
+
+
+class TestAnswerCache:
+    """Tests for AnswerCache."""
+
+    def test_exact_lookup_ignores_case_and_whitespace(self):
+        """Test that questions differing only in case and spacing share an entry."""
+        cache = AnswerCache()
+        cached = _result("cached")
+        cache.put(AnswerCache.make_key("How does  login work?", None, None, 10, True), cached)
+
+        key = AnswerCache.make_key("how does login WORK?", None, None, 10, True)
+
+        assert cache.get(key) is cached
+
+    def test_similar_question_reuses_answer_within_threshold(self):
+        """Test that a near-identical embedding returns the cached answer."""
+        cache = AnswerCache(similarity_threshold=0.95)
+        cached = _result("cached")
+        cache.put(AnswerCache.make_key("a", None, None, 10, True), cached, [1.0, 0.0])
+        key = AnswerCache.make_key("b", None, None, 10, True)
+
+        assert cache.get_similar(key, [0.99, 0.05]) is cached
+        assert cache.get_similar(key, [0.5, 0.5]) is None
+
+    def test_similar_lookup_is_scoped_to_query_options(self):
+        """Test that answers for another project or limit are never reused."""
+        cache = AnswerCache()
+        cache.put(AnswerCache.make_key("a", None, "alpha", 10, True), _result("a"), [1.0, 0.0])
+
+        assert cache.get_similar(AnswerCache.make_key("b", None, "beta", 10, True), [1, 0]) is None
+        assert cache.get_similar(AnswerCache.make_key("b", None, "alpha", 5, True), [1, 0]) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays within max_entries."""
+        cache = AnswerCache(max_entries=2)
+        keys = [AnswerCache.make_key(q, None, None, 10, True) for q in ("a", "b", "c")]
+        cache.put(keys[0], _result("a"), [1.0, 0.0])
+        cache.put(keys[1], _result("b"))
+        cache.get(keys[0])
+        cache.put(keys[2], _result("c"))
+
+        assert len(cache) == 2
+        assert cache.get(keys[1]) is None
+        assert cache.get_similar(keys[1], [1.0, 0.0]) is not None
+
+
+class TestPlanCache:
+    """Tests for PlanCache."""
+
+    async def test_concurrent_identical_questions_share_one_plan(self):
+        """Test that simultaneous requests for the same question plan only once."""
+        planner = AsyncMock(side_effect=lambda question: _plan(question))
+        cache = PlanCache()
+
+        plans = await asyncio.gather(
+            cache.get_or_plan("How does login work?", planner),
+            cache.get_or_plan("how does  login work?", planner),
+        )
+
+        assert plans[0] is plans[1]
+        planner.assert_awaited_once()
+
+    async def test_expired_plans_are_replanned(self):
+        """Test that plans older than the TTL are not reused."""
+        planner = AsyncMock(side_effect=lambda question: _plan(question))
+        cache = PlanCache(ttl_seconds=0)
+
+        await cache.get_or_plan("How does login work?", planner)
+        await cache.get_or_plan("How does login work?", planner)
+
+        assert planner.await_count == 2
+
+    async def test_failed_planning_is_not_cached(self):
+        """Test that a planning error is raised and the next request retries."""
+        planner = AsyncMock(side_effect=[RuntimeError("planner down"), _plan()])
+        cache = PlanCache()
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_plan("How does login work?", planner)
+        plan = await cache.get_or_plan("How does login work?", planner)
+
+        assert plan.primary_intent == QueryIntent.EXPLAIN_IMPLEMENTATION
+        assert len(cache) == 1
+
+
+class TestQueryEngineAnswerCache:
+    """Tests for answer caching in QueryEngine.query."""
+
+    async def test_repeated_question_skips_pipeline(self, engine_parts):
+        """Test that exact and near-identical questions are answered from the cache."""
+        engine = QueryEngine(**engine_parts, answer_cache=AnswerCache())
+
+        first = await engine.query("How does login work?")
+        second = await engine.query("how does  login work?")
+        third = await engine.query("how does the login work")
+
+        assert first is second is third
+        engine_parts["planner"].plan_query.assert_awaited_once()
+        engine_parts["response_builder"].stream_response.assert_called_once()
+
+    async def test_response_miss_streams_the_prepared_prompt(self, engine_parts):
+        """Test that a response cache miss reuses the prompt built for the lookup."""
+        engine = QueryEngine(**engine_parts)
+        response_builder = engine_parts["response_builder"]
+
+        await engine.query("How does login work?")
+
+        prompt = response_builder.prepare_prompt.return_value
+        response_builder.prepare_prompt.assert_called_once()
+        response_builder.cached_response.assert_called_once_with(prompt)
+        assert response_builder.stream_response.call_args.args[4] is prompt
+
+    async def test_question_vector_is_passed_to_vector_search(self, engine_parts):
+        """Test that the question is embedded once and reused for vector search."""
+        engine = QueryEngine(**engine_parts, answer_cache=AnswerCache())
+
+        await engine.query("Where is billing configured?")
+
+        engine_parts["embedder"].embed.assert_awaited_once()
+        call = engine_parts["search_coordinator"].execute_vector_search.await_args
+        assert call.args[-1] == [0.0, 1.0, 0.0]
+
+    async def test_question_is_planned_while_it_is_embedded(self, engine_parts):
+        """Test that planning starts without waiting for the question embedding."""
+        planning_started = asyncio.Event()
+
+        async def plan_query(question):
+            planning_started.set()
+            return _plan(question)
+
+        async def embed(question):
+            await asyncio.wait_for(planning_started.wait(), timeout=1)
+            return [1.0, 0.0, 0.0]
+
+        engine_parts["planner"].plan_query = plan_query
+        engine_parts["embedder"].embed = embed
+        engine = QueryEngine(**engine_parts)
+
+        result = await engine.query("How does login work?")
+
+        assert result.answer == "The answer."
+
+    async def test_plans_survive_answer_invalidation(self, engine_parts):
+        """Test that a re-asked question after an index change reuses its plan."""
+        engine = QueryEngine(**engine_parts, answer_cache=AnswerCache(), plan_cache=PlanCache())
+
+        await engine.query("How does login work?")
+        engine.bump_version()
+        await engine.query("How does login work?")
+
+        engine_parts["planner"].plan_query.assert_awaited_once()
+        assert engine_parts["response_builder"].stream_response.call_count == 2
+
+    async def test_bump_version_invalidates_answers(self, engine_parts):
+        """Test that bumping the index version forces a fresh answer."""
+        engine = QueryEngine(**engine_parts, answer_cache=AnswerCache())
+
+        await engine.query("How does login work?")
+        engine.bump_version()
+        await engine.query("How does login work?")
+
+        assert engine_parts["planner"].plan_query.await_count == 2
+
+    async def test_close_releases_provider_clients(self, engine_parts):
+        """Test that closing the engine closes the embedding and LLM provider clients."""
+        engine_parts["embedder"].aclose = AsyncMock()
+        llm_provider = MagicMock(aclose=AsyncMock())
+        engine = QueryEngine(**engine_parts, llm_provider=llm_provider)
+
+        await engine.close()
+
+        engine_parts["embedder"].aclose.assert_awaited_once()
+        llm_provider.aclose.assert_awaited_once()
+
+    async def test_close_continues_after_a_failing_client(self, engine_parts):
+        """Test that one client failing to close does not leave the others open."""
+        engine_parts["memgraph"].close = AsyncMock(side_effect=RuntimeError("socket gone"))
+        engine_parts["embedder"].aclose = AsyncMock()
+        engine = QueryEngine(**engine_parts)
+
+        await engine.close()
+
+        engine_parts["qdrant"].close.assert_awaited_once()
+        engine_parts["embedder"].aclose.assert_awaited_once()
+
+    async def test_context_is_built_while_centrality_is_fetched(self, engine_parts):
+        """Test that the context build does not wait for centrality scores."""
+        context_started = asyncio.Event()
+
+        async def get_centrality_scores(graph_context, vector_results):
+            await asyncio.wait_for(context_started.wait(), timeout=1)
+            return {}
+
+        async def build_enriched_context(plan, graph_context, vector_results):
+            context_started.set()
+            return MagicMock()
+
+        engine_parts["search_coordinator"].get_centrality_scores = get_centrality_scores
+        engine_parts["context_builder"].build_enriched_context = build_enriched_context
+        engine = QueryEngine(**engine_parts)
+
+        result = await engine.query("How does login work?")
+
+        assert "context_time_ms" in result.execution_stats
+
+    async def test_each_stage_records_its_own_time(self, engine_parts):
+        """Test that graph, vector and centrality stages are timed separately."""
+        engine = QueryEngine(**engine_parts)
+
+        result = await engine.query("How does login work?")
+
+        for key in (
+            "planning_time_ms",
+            "graph_time_ms",
+            "vector_time_ms",
+            "centrality_time_ms",
+            "ranking_time_ms",
+        ):
+            assert isinstance(result.execution_stats[key], int)
+
+    async def test_large_result_sets_rank_off_the_event_loop(self, engine_parts, monkeypatch):
+        """Test that ranking many results runs in a worker thread."""
+        ranking_threads = []
+
+        def rank_results(*args):
+            ranking_threads.append(threading.get_ident())
+            return []
+
+        monkeypatch.setattr(QueryConfig, "ranking_thread_threshold", 1)
+        engine_parts["search_coordinator"].execute_vector_search = AsyncMock(
+            return_value=[{"entity_name": "login"}, {"entity_name": "logout"}]
+        )
+        engine_parts["ranker"] = MagicMock(rank_results=rank_results)
+        engine = QueryEngine(**engine_parts)
+
+        await engine.query("How does login work?")
+
+        assert len(ranking_threads) == 1
+        assert ranking_threads[0] != threading.get_ident()
+
+    async def test_graph_failure_keeps_vector_results(self, engine_parts):
+        """Test that a failed graph search degrades to an empty graph context."""
+        engine_parts["graph_engine"].execute_query_plan = AsyncMock(
+            side_effect=QueryError("Graph reasoning failed")
+        )
+        engine_parts["search_coordinator"].execute_vector_search = AsyncMock(
+            return_value=[{"entity_name": "login"}]
+        )
+        engine = QueryEngine(**engine_parts)
+
+        await engine.query("How does login work?")
+
+        args = engine_parts["search_coordinator"].get_centrality_scores.await_args.args
+        assert args[0].primary_entities == []
+        assert args[1] == [{"entity_name": "login"}]
+
+    async def test_unexpected_search_error_cancels_sibling(self, engine_parts):
+        """Test that an unrecoverable error fails the query without awaiting the other search."""
+        vector_cancelled = asyncio.Event()
+
+        async def execute_vector_search(*args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                vector_cancelled.set()
+                raise
+
+        engine_parts["graph_engine"].execute_query_plan = AsyncMock(
+            side_effect=RuntimeError("bad credentials")
+        )
+        engine_parts["search_coordinator"].execute_vector_search = execute_vector_search
+        engine = QueryEngine(**engine_parts)
+
+        with pytest.raises(QueryError):
+            await engine.query("How does login work?")
+
+        assert vector_cancelled.is_set()
+
+
+class TestQueryStream:
+    """Tests for QueryEngine.query_stream."""
+
+    async def test_sources_are_yielded_before_answer_tokens(self, engine_parts):
+        """Test that the ranked result arrives first and the answer streams after it."""
+        engine = QueryEngine(**engine_parts)
+
+        items = [item async for item in engine.query_stream("How does login work?")]
+
+        result, *chunks = items
+        assert isinstance(result, QueryResult)
+        assert chunks == ["The ", "answer."]
+        assert result.answer == "The answer."
+        assert "response_time_ms" in result.execution_stats
+
+    async def test_query_returns_accumulated_answer(self, engine_parts):
+        """Test that query collects the streamed answer into the result."""
+        engine = QueryEngine(**engine_parts)
+
+        result = await engine.query("How does login work?")
+
+        assert result.answer == "The answer."
+
+
+class TestStructuredQueries:
+    """Tests for helpers that build their own query plan."""
+
+    async def test_explain_entity_skips_llm_planning(self, engine_parts):
+        """Test that explain_entity queries the graph with a prebuilt plan."""
+        engine_parts["embedder"].embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        engine = QueryEngine(**engine_parts)
+
+        await engine.explain_entity("login")
+
+        engine_parts["planner"].plan_query.assert_not_awaited()
+        plan = engine_parts["graph_engine"].execute_query_plan.await_args.args[0]
+        assert plan.primary_intent == QueryIntent.EXPLAIN_IMPLEMENTATION
+        assert [e.name for e in plan.entities] == ["login"]
+
+    async def test_find_call_path_plans_source_and_target(self, engine_parts):
+        """Test that find_call_path asks for a call chain between both entities."""
+        engine_parts["embedder"].embed = AsyncMock(return_value=[1.0, 0.0, 0.0])
+        engine = QueryEngine(**engine_parts)
+
+        await engine.find_call_path("handle_request", "save_user")
+
+        engine_parts["planner"].plan_query.assert_not_awaited()
+        plan = engine_parts["graph_engine"].execute_query_plan.await_args.args[0]
+        assert plan.primary_intent == QueryIntent.FIND_CALL_CHAIN
+        assert [e.name for e in plan.entities] == ["handle_request", "save_user"]
+
+
+class TestQueryPlanner:
+    """Tests for QueryPlanner."""
+
+    async def test_literal_name_skips_llm(self):
+        """Test that a bare identifier is planned as a lookup without an LLM call."""
+        llm_provider = MagicMock(complete=AsyncMock())
+        planner = QueryPlanner(llm_provider)
+
+        plan = await planner.plan_query("`AuthService.login()`")
+
+        llm_provider.complete.assert_not_awaited()
+        assert plan.primary_intent == QueryIntent.LOCATE_ENTITY
+        assert [e.name for e in plan.entities] == ["AuthService.login"]
+
+    def test_identifier_shaped_names_are_planned_directly(self):
+        """Test that snake_case, CamelCase and dotted names are looked up directly."""
+        for question in ("handle_request", "UserService?", "auth.login", "getUser"):
+            plan = build_literal_plan(question)
+            assert plan is not None, question
+            assert plan.primary_intent == QueryIntent.LOCATE_ENTITY
+
+    def test_plain_word_needs_planning(self):
+        """Test that a one-word English question is not mistaken for an identifier."""
+        assert build_literal_plan("authentication") is None
+        assert build_literal_plan("Caching?") is None
+
+    def test_templated_questions_are_planned_directly(self):
+        """Test that explain and call chain templates map to their intents."""
+        explain = build_literal_plan("Explain how login works and is used in the codebase")
+        chain = build_literal_plan("How does handle_request eventually call save_user?")
+
+        assert explain is not None
+        assert explain.primary_intent == QueryIntent.EXPLAIN_IMPLEMENTATION
+        assert chain is not None
+        assert chain.primary_intent == QueryIntent.FIND_CALL_CHAIN
+        assert [e.name for e in chain.entities] == ["handle_request", "save_user"]
+
+    def test_open_questions_need_planning(self):
+        """Test that free-form questions are left to the planner."""
+        assert build_literal_plan("How is authentication handled?") is None
+
+
+class TestGraphContextGathering:
+    """Tests for the graph context gatherers."""
+
+    async def test_callers_are_fetched_in_one_batch(self):
+        """Test that callers for every entity come from one UNWIND query, kept in order."""
+        rows = [
+            {"lookup": "logout", "nodes": [{"name": "caller_of_logout", "depth": 1}]},
+            {"lookup": "login", "nodes": [{"name": "caller_of_login", "depth": 1}]},
+        ]
+        client = MagicMock(execute=AsyncMock(return_value=rows))
+        plan = _plan()
+        plan.entities = [ExtractedEntity(name="login"), ExtractedEntity(name="logout")]
+        context = GraphContext.empty()
+
+        await gather_caller_context(client, context, plan)
+
+        client.execute.assert_awaited_once()
+        assert client.execute.await_args.args[1]["lookups"] == ["login", "logout"]
+        assert [c.name for c in context.callers] == ["caller_of_login", "caller_of_logout"]
+
+    async def test_resolved_entities_are_traversed_by_node_id(self):
+        """Test that resolved primary entities seed traversals by id, not by name."""
+        rows = [{"lookup": 7, "nodes": [{"name": "handle_request", "depth": 1}]}]
+        client = MagicMock(execute=AsyncMock(return_value=rows))
+        context = GraphContext.empty()
+        context.primary_entities.append(
+            GraphNode(
+                node_type="Function",
+                name="login",
+                qualified_name="auth.login",
+                file_path="auth.py",
+                internal_id=7,
+            )
+        )
+
+        await gather_caller_context(client, context, _plan())
+
+        query, params = client.execute.await_args.args
+        assert "id(target) = lookup" in query
+        assert params["lookups"] == [7]
+        assert [c.name for c in context.callers] == ["handle_request"]
+
+    async def test_batch_failure_yields_empty_callers(self):
+        """Test that a graph error leaves every entity with no callers."""
+        client = MagicMock(execute=AsyncMock(side_effect=GraphError("down")))
+
+        callers = await find_transitive_callers_batch(client, ["login", "logout"])
+
+        assert callers == {"login": [], "logout": []}
+
+    async def test_repeated_plan_entities_resolve_once(self, monkeypatch):
+        """Test that an entity named twice in the plan is looked up once per request."""
+        find_entity = AsyncMock(return_value=[])
+        monkeypatch.setattr("lattice.querying.graph_reasoning.engine.find_entity", find_entity)
+        monkeypatch.setattr(
+            "lattice.querying.graph_reasoning.engine.find_entity_fuzzy", AsyncMock(return_value=[])
+        )
+        plan = _plan()
+        plan.primary_intent = QueryIntent.FIND_CALL_CHAIN
+        plan.entities = [
+            ExtractedEntity(name="login", is_primary=True),
+            ExtractedEntity(name="login", is_primary=True),
+        ]
+
+        client = MagicMock(execute=AsyncMock(return_value=[]))
+        await GraphReasoningEngine(client).execute_query_plan(plan)
+
+        find_entity.assert_awaited_once()
+
+    async def test_typed_and_untyped_lookups_keep_one_node(self, monkeypatch):
+        """Test that a node found by two lookups is kept once as a primary entity."""
+        node = GraphNode(
+            node_type="Function", name="login", qualified_name="auth.login", file_path="auth.py"
+        )
+        monkeypatch.setattr(
+            "lattice.querying.graph_reasoning.engine.find_entity", AsyncMock(return_value=[node])
+        )
+        plan = _plan()
+        plan.primary_intent = QueryIntent.FIND_CALL_CHAIN
+        plan.entities = [
+            ExtractedEntity(name="login", entity_type="function", is_primary=True),
+            ExtractedEntity(name="login", is_primary=True),
+        ]
+        client = MagicMock(execute=AsyncMock(return_value=[]))
+
+        context = await GraphReasoningEngine(client).execute_query_plan(plan)
+
+        assert context.primary_entities == [node]
+
+    async def test_unknown_entity_type_is_not_spliced_into_cypher(self):
+        """Test that planner-supplied types only select known labels."""
+        client = MagicMock(execute=AsyncMock(return_value=[]))
+
+        await find_entity(client, "login", "function")
+        await find_entity(client, "login", "x) DETACH DELETE (n")
+
+        typed_query = client.execute.await_args_list[0].args[0]
+        unknown_query = client.execute.await_args_list[1].args[0]
+        assert "MATCH (n:Function)" in typed_query
+        assert "MATCH (n)" in unknown_query
+        assert "DELETE" not in unknown_query
+
+
+class TestSearchCoordinator:
+    """Tests for SearchCoordinator."""
+
+    async def test_centrality_is_fetched_in_one_batch(self):
+        """Test that all candidate entities are scored by a single graph query."""
+        graph_engine = MagicMock()
+        graph_engine.get_entities_centrality = AsyncMock(
+            side_effect=lambda names: {name: {"total_degree": len(name)} for name in names}
+        )
+        coordinator = SearchCoordinator(MagicMock(), graph_engine)
+        vector_results = [{"entity_name": f"func_{i}"} for i in range(5)]
+
+        scores = await coordinator.get_centrality_scores(GraphContext.empty(), vector_results)
+
+        assert len(scores) == 5
+        graph_engine.get_entities_centrality.assert_awaited_once()
+
+    async def test_centrality_candidates_are_deduplicated(self):
+        """Test that graph and vector hits for the same entity are looked up once, in order."""
+        graph_engine = MagicMock(get_entities_centrality=AsyncMock(return_value={}))
+        coordinator = SearchCoordinator(MagicMock(), graph_engine)
+        graph_context = GraphContext.empty()
+        graph_context.primary_entities.append(
+            GraphNode(
+                node_type="Function",
+                name="login",
+                qualified_name="auth.login",
+                file_path="auth.py",
+            )
+        )
+        vector_results = [
+            {"entity_name": "login", "graph_node_id": "auth.login"},
+            {"entity_name": "logout"},
+            {"entity_name": None},
+        ]
+
+        await coordinator.get_centrality_scores(graph_context, vector_results)
+
+        graph_engine.get_entities_centrality.assert_awaited_once_with(["auth.login", "logout"])
+
+    async def test_centrality_failure_yields_no_scores(self):
+        """Test that a failing centrality query does not fail the search."""
+        graph_engine = MagicMock()
+        graph_engine.get_entities_centrality = AsyncMock(side_effect=RuntimeError("down"))
+        coordinator = SearchCoordinator(MagicMock(), graph_engine)
+
+        scores = await coordinator.get_centrality_scores(
+            GraphContext.empty(), [{"entity_name": "login"}]
+        )
+
+        assert scores == {}
+
+    async def test_query_is_embedded_once_for_code_and_summaries(self):
+        """Test that both vector searches reuse a single query embedding."""
+        vector_searcher = MagicMock()
+        vector_searcher.embedder.embed = AsyncMock(return_value=[1.0, 0.0])
+        vector_searcher.search_code = AsyncMock(return_value=[])
+        vector_searcher.search_summaries = AsyncMock(return_value=[])
+        coordinator = SearchCoordinator(vector_searcher, MagicMock())
+
+        await coordinator.execute_vector_search("login", _plan(), limit=5, language=None)
+
+        vector_searcher.embedder.embed.assert_awaited_once_with("login")
+        for search in (vector_searcher.search_code, vector_searcher.search_summaries):
+            assert search.await_args.kwargs["query_vector"] == [1.0, 0.0]
+
+    async def test_code_and_summary_searches_run_concurrently(self):
+        """Test that the summary search does not wait for the code search to finish."""
+        started = []
+
+        async def search(kind, **kwargs):
+            started.append(kind)
+            await asyncio.sleep(0.01)
+            assert started == ["code", "summary"]
+            return [{"kind": kind}]
+
+        vector_searcher = MagicMock()
+        vector_searcher.search_code = lambda **kwargs: search("code", **kwargs)
+        vector_searcher.search_summaries = lambda **kwargs: search("summary", **kwargs)
+        coordinator = SearchCoordinator(vector_searcher, MagicMock())
+
+        results = await coordinator.execute_vector_search(
+            "login", _plan(), limit=5, language=None, query_vector=[1.0, 0.0]
+        )
+
+        assert results == [{"kind": "code"}, {"kind": "summary"}]
+
+
+class TestCodebaseStatistics:
+    """Tests for get_codebase_statistics."""
+
+    async def test_labels_are_counted_in_one_round_trip(self):
+        """Test that per-label counts come back from a single UNION query."""
+        counts = {"File": 3, "Class": 0, "Function": 7, "Method": 2}
+
+        rows = [
+            {"key": key, "count": counts[label]}
+            for key, label in [
+                ("file_count", "File"),
+                ("class_count", "Class"),
+                ("function_count", "Function"),
+                ("method_count", "Method"),
+            ]
+        ]
+        memgraph = MagicMock(execute=AsyncMock(return_value=rows))
+        qdrant = MagicMock()
+        qdrant.get_collection_info = AsyncMock(return_value=MagicMock(points_count=42))
+
+        stats = await get_codebase_statistics(memgraph, qdrant)
+
+        assert stats == {
+            "file_count": 3,
+            "class_count": 0,
+            "function_count": 7,
+            "method_count": 2,
+            "vector_count": 42,
+        }
+        memgraph.execute.assert_awaited_once()
+
+
+class TestHybridRanker:
+    """Tests for HybridRanker."""
+
+    def test_graph_and_vector_hits_merge_and_match_query_entities(self):
+        """Test that one entity found by both searches becomes a single hybrid result."""
+        plan = _plan()
+        plan.entities = [ExtractedEntity(name="Login")]
+        graph_context = GraphContext.empty()
+        graph_context.primary_entities.append(
+            GraphNode("Function", "login", "auth.login", "auth.py", start_line=3)
+        )
+        vector_results = [
+            {"file_path": "auth.py", "entity_name": "login", "start_line": 3, "score": 0.8},
+            {"file_path": "db.py", "entity_name": "connect", "start_line": 1, "score": 0.6},
+        ]
+
+        results = HybridRanker(RankingConfig()).rank_results(plan, graph_context, vector_results)
+
+        assert [r.entity_name for r in results] == ["login", "connect"]
+        assert results[0].source == "hybrid"
+        assert results[0].signal_scores["query_entity_match"] == 1.0
+
+    def test_limit_keeps_best_results_within_per_file_cap(self):
+        """Test that a limited ranking skips capped files and still returns limit results."""
+        vector_results = [
+            {"file_path": path, "entity_name": f"fn_{i}", "start_line": i, "score": score}
+            for i, (path, score) in enumerate(
+                [("a.py", 0.9), ("a.py", 0.8), ("a.py", 0.7), ("b.py", 0.6), ("c.py", 0.5)]
+            )
+        ]
+        ranker = HybridRanker(RankingConfig(max_per_file=2))
+
+        results = ranker.rank_results(_plan(), GraphContext.empty(), vector_results, limit=3)
+
+        assert [r.entity_name for r in results] == ["fn_0", "fn_1", "fn_3"]
+
+
+def _enriched_context() -> EnrichedContext:
+    return EnrichedContext(
+        query="Q",
+        intent=QueryIntent.EXPLAIN_IMPLEMENTATION,
+        primary_contexts=[],
+        call_chain_explanations=[],
+        hierarchy_explanations=[],
+        file_summaries={},
+        dependency_map={},
+        code_snippets=[],
+        graph_summary="No graph results.",
+        total_entities_found=0,
+        reasoning_notes=[],
+    )
+
+
+class TestResponseBuilder:
+    """Tests for ResponseBuilder."""
+
+    async def test_identical_prompt_reuses_streamed_answer(self):
+        """Test that a repeated prompt is answered without another LLM call."""
+        llm_provider = MagicMock()
+        llm_provider.stream = MagicMock(side_effect=lambda **kwargs: _stream_answer(*[None] * 4))
+        builder = ResponseBuilder(llm_provider)
+        context = _enriched_context()
+
+        prompt = builder.prepare_prompt("Q", _plan(), context)
+        assert builder.cached_response(prompt) is None
+        first = [chunk async for chunk in builder.stream_response("Q", _plan(), [], context)]
+        second = [chunk async for chunk in builder.stream_response("Q", _plan(), [], context)]
+
+        assert first == ["The ", "answer."]
+        assert second == ["The answer."]
+        assert builder.cached_response(prompt) == "The answer."
+        assert builder.cached_response(builder.prepare_prompt("Other", _plan(), context)) is None
+        llm_provider.stream.assert_called_once()
+
+    async def test_cache_miss_builds_messages_once(self):
+        """Test that checking the cache and streaming share one prepared prompt."""
+        llm_provider = MagicMock()
+        llm_provider.stream = MagicMock(side_effect=lambda **kwargs: _stream_answer(*[None] * 4))
+        builder = ResponseBuilder(llm_provider)
+        builder._build_messages = MagicMock(wraps=builder._build_messages)
+        context = _enriched_context()
+
+        prompt = builder.prepare_prompt("Q", _plan(), context)
+        assert builder.cached_response(prompt) is None
+        chunks = [
+            chunk async for chunk in builder.stream_response("Q", _plan(), [], context, prompt)
+        ]
+
+        assert chunks == ["The ", "answer."]
+        builder._build_messages.assert_called_once()
+        assert llm_provider.stream.call_args.kwargs["messages"] is prompt.messages
+
+    def test_system_prompt_adds_intent_guidance(self):
+        """Test that intents with extra guidance extend the base system prompt."""
+        builder = ResponseBuilder(MagicMock())
+        base = get_prompt("query", "enhanced_system")
+
+        assert builder._get_system_prompt(QueryIntent.FIND_CALLERS) == base + get_prompt(
+            "query", "intent_find_callers"
+        )
+        assert builder._get_system_prompt(QueryIntent.EXPLAIN_ARCHITECTURE) == base
@@ -0,0 +1,450 @@
+"""Tests for the type inference module.
+
+Tests cover:
+- Node text decoding cache
+- Parameter and assignment type inference in PythonTraversal
+- Class name resolution in TypeResolver
+"""
+
+from pathlib import Path
+
+import pytest
+from tree_sitter_language_pack import get_parser
+
+from lattice.parsing.type_inference import (
+    PythonTraversal,
+    PythonTypeInference,
+    TypeInferenceContext,
+    TypeResolver,
+)
+from lattice.parsing.type_inference.resolvers import infer_type_from_name
+from lattice.parsing.type_inference.utils import NodeTextCache, get_node_text
+from lattice.shared.cache import ASTCache, FunctionRegistry, PersistentCache
+
+
+def parse_function(source: str):
+    """Parse source and return the first function_definition node."""
+    tree = get_parser("python").parse(source.encode("utf-8"))
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        if node.type == "function_definition":
+            return node
+        stack.extend(reversed(node.children))
+    raise AssertionError("no function_definition in source")
+
+
+@pytest.fixture
+def function_registry():
+    """Create a function registry with test classes."""
+    registry = FunctionRegistry()
+    registry.register("myproject.models.User", "Class")
+    registry.register("myproject.models.User.save", "Method")
+    registry.register("myproject.models.UserProfile", "Class")
+    registry.register("myproject.services.PaymentService", "Class")
+    registry.register("myproject.services.process", "Function")
+    return registry
+
+
+@pytest.fixture
+def import_mapping():
+    return {
+        "myproject.services": {
+            "User": "myproject.models.User",
+            "helper": "myproject.utils.helper",
+        },
+    }
+
+
+@pytest.fixture
+def type_resolver(function_registry, import_mapping):
+    return TypeResolver(
+        function_registry=function_registry,
+        import_mapping=import_mapping,
+        ast_cache=ASTCache(),
+        module_qn_to_file_path={},
+        simple_name_lookup={
+            "UserProfile": {"myproject.models.UserProfile"},
+            "Config": {"myproject.a.Config", "myproject.b.Config"},
+        },
+    )
+
+
+@pytest.fixture
+def traversal(type_resolver):
+    return PythonTraversal(type_resolver=type_resolver)
+
+
+class TestNodeTextCache:
+    """Tests for NodeTextCache."""
+
+    def test_decodes_node_text(self):
+        """Test that the cache returns the decoded node text."""
+        node = parse_function("def handle(user):\n    pass\n")
+        cache = NodeTextCache()
+
+        name = cache.get(node.child_by_field_name("name"))
+
+        assert name == "handle"
+
+    def test_reuses_decoded_text_for_same_span(self):
+        """Test that nodes covering the same span share one decoded string."""
+        node = parse_function("def handle(user):\n    pass\n")
+        cache = NodeTextCache()
+
+        first = cache.get(node.child_by_field_name("name"))
+        second = cache.get(node.child_by_field_name("name"))
+
+        assert first is second
+
+    def test_clear_drops_entries(self):
+        """Test that clearing lets the cache be reused for another tree."""
+        cache = NodeTextCache()
+        cache.get(parse_function("def a():\n    pass\n").child_by_field_name("name"))
+        cache.clear()
+
+        name = cache.get(parse_function("def b():\n    pass\n").child_by_field_name("name"))
+
+        assert name == "b"
+
+
+class TestPythonTraversal:
+    """Tests for PythonTraversal local variable type inference."""
+
+    def test_parameter_name_matches_imported_class(self, traversal):
+        """Test that an untyped parameter is matched to an imported class."""
+        node = parse_function("def handle(user):\n    pass\n")
+        local_var_types: dict[str, str] = {}
+
+        traversal.infer_parameter_types(node, local_var_types, "myproject.services")
+
+        assert local_var_types == {"user": "User"}
+
+    def test_constructor_assignment(self, traversal):
+        """Test that a constructor call assigns the class type."""
+        node = parse_function("def handle():\n    service = PaymentService()\n")
+        local_var_types: dict[str, str] = {}
+
+        traversal.traverse_single_pass(node, local_var_types, "myproject.services")
+
+        assert local_var_types["service"] == "PaymentService"
+
+    def test_loop_variable_from_list_literal(self, traversal):
+        """Test that a loop over constructed objects types the loop variable."""
+        node = parse_function("def handle():\n    for item in [User(), User()]:\n        pass\n")
+        local_var_types: dict[str, str] = {}
+
+        traversal.traverse_single_pass(node, local_var_types, "myproject.services")
+
+        assert local_var_types["item"] == "User"
+
+    def test_loop_variable_ignores_nested_list_elements(self, traversal):
+        """Test that only the iterated list's own elements type the loop variable."""
+        node = parse_function(
+            "def handle():\n    for item in [make([Inner()]), Outer()]:\n        pass\n"
+        )
+        local_var_types: dict[str, str] = {}
+
+        traversal.traverse_single_pass(node, local_var_types, "myproject.services")
+
+        assert local_var_types["item"] == "Outer"
+
+    def test_instance_attribute_assignment(self, traversal):
+        """Test that self attribute assignments are recorded."""
+        node = parse_function("def __init__(self):\n    self.user = User()\n")
+        local_var_types: dict[str, str] = {}
+
+        traversal.traverse_single_pass(node, local_var_types, "myproject.services")
+
+        assert local_var_types["self.user"] == "User"
+
+    def test_repeated_traversals_do_not_leak_text(self, traversal):
+        """Test that text cached for one tree is not reused for another."""
+        first = parse_function("def a():\n    x = Alpha()\n")
+        second = parse_function("def b():\n    y = Omega()\n")
+        first_types: dict[str, str] = {}
+        second_types: dict[str, str] = {}
+
+        traversal.traverse_single_pass(first, first_types, "myproject.services")
+        traversal.traverse_single_pass(second, second_types, "myproject.services")
+
+        assert first_types == {"x": "Alpha"}
+        assert second_types == {"y": "Omega"}
+
+
+class TestTypeResolver:
+    """Tests for TypeResolver."""
+
+    def test_resolve_local_class(self, type_resolver):
+        """Test resolving a class defined in the same module."""
+        result = type_resolver.resolve_class_name("PaymentService", "myproject.services")
+        assert result == "myproject.services.PaymentService"
+
+    def test_resolve_imported_class(self, type_resolver):
+        """Test resolving a class through the module's imports."""
+        result = type_resolver.resolve_class_name("User", "myproject.services")
+        assert result == "myproject.models.User"
+
+    def test_resolve_unique_simple_name(self, type_resolver):
+        """Test resolving a class by a globally unique simple name."""
+        result = type_resolver.resolve_class_name("UserProfile", "myproject.other")
+        assert result == "myproject.models.UserProfile"
+
+    def test_ambiguous_simple_name_is_not_resolved(self, type_resolver):
+        """Test that a simple name defined in several modules stays unresolved."""
+        assert type_resolver.resolve_class_name("Config", "myproject.other") is None
+
+    def test_resolve_unknown_class(self, type_resolver):
+        """Test that unknown class names are not resolved."""
+        assert type_resolver.resolve_class_name("Missing", "myproject.services") is None
+
+    def test_parameter_name_exact_match(self, type_resolver):
+        """Test that a parameter named after a class infers that class."""
+        result = type_resolver.infer_type_from_parameter_name(
+            "paymentservice", "myproject.services"
+        )
+        assert result == "PaymentService"
+
+    def test_parameter_name_suffix_match(self, type_resolver):
+        """Test that a parameter ending with a class name infers that class."""
+        result = type_resolver.infer_type_from_parameter_name("current_user", "myproject.services")
+        assert result == "User"
+
+    def test_parameter_name_without_match(self, type_resolver):
+        """Test that unrelated parameter names are not typed."""
+        result = type_resolver.infer_type_from_parameter_name("count", "myproject.services")
+        assert result is None
+
+    def test_parameter_scope_does_not_rescan_registry(self, type_resolver, monkeypatch):
+        """Test that parameter lookups use the class index built at construction."""
+        registry = type_resolver.function_registry
+        calls = []
+        all_entries = registry.all_entries
+
+        def counting_all_entries():
+            calls.append(1)
+            return all_entries()
+
+        monkeypatch.setattr(registry, "all_entries", counting_all_entries)
+
+        type_resolver.infer_type_from_parameter_name("user", "myproject.services")
+        type_resolver.infer_type_from_parameter_name("payment_service", "myproject.services")
+        type_resolver.infer_type_from_parameter_name("user", "myproject.services")
+
+        assert calls == []
+
+
+class TestMethodReturnTypes:
+    """Tests for method return type lookup in TypeResolver."""
+
+    @pytest.fixture
+    def repo_resolver(self, function_registry):
+        source = (
+            "class UserRepository:\n"
+            "    def get(self, user_id) -> User:\n"
+            "        pass\n"
+            "\n"
+            "    def count(self):\n"
+            "        pass\n"
+            "\n"
+            "    def active(self) -> 'UserRepository':\n"
+            "        pass\n"
+        )
+        file_path = Path("/repo/myproject/repositories.py")
+        ast_cache = ASTCache()
+        ast_cache[file_path] = (get_parser("python").parse(source.encode()).root_node, "python")
+        function_registry.register("myproject.repositories.UserRepository", "Class")
+        function_registry.register("myproject.repositories.UserRepository.get", "Method")
+        function_registry.register("myproject.repositories.UserRepository.count", "Method")
+        function_registry.register("myproject.repositories.UserRepository.active", "Method")
+        return TypeResolver(
+            function_registry=function_registry,
+            import_mapping={"myproject.repositories": {"User": "myproject.models.User"}},
+            ast_cache=ast_cache,
+            module_qn_to_file_path={"myproject.repositories": file_path},
+            simple_name_lookup={},
+        )
+
+    def test_return_annotation_is_resolved(self, repo_resolver):
+        """Test that a method's return annotation is resolved to a qualified name."""
+        result = repo_resolver.infer_method_call_return_type(
+            "repo.get(1)",
+            "myproject.services",
+            {"repo": "myproject.repositories.UserRepository"},
+        )
+        assert result == "myproject.models.User"
+
+    def test_unannotated_method_has_no_return_type(self, repo_resolver):
+        """Test that methods without a return annotation are not typed."""
+        result = repo_resolver.infer_method_call_return_type(
+            "repo.count()",
+            "myproject.services",
+            {"repo": "myproject.repositories.UserRepository"},
+        )
+        assert result is None
+
+    def test_chained_call_uses_intermediate_return_type(self, repo_resolver):
+        """Test that a chained call resolves through each method's return type."""
+        result = repo_resolver.infer_method_call_return_type(
+            "repo.active().get",
+            "myproject.services",
+            {"repo": "myproject.repositories.UserRepository"},
+        )
+        assert result == "myproject.models.User"
+
+    def test_chain_with_arguments_after_last_call_is_not_a_chain(self, repo_resolver):
+        """Test that a call whose arguments follow the last dot is not treated as a chain."""
+        assert repo_resolver._is_method_chain("repo.active().get(x)") is False
+        assert repo_resolver._is_method_chain("repo.active().get") is True
+        assert repo_resolver._is_method_chain("repo.get") is False
+
+    def test_return_type_lookup_is_cached(self, repo_resolver, monkeypatch):
+        """Test that repeated lookups of a method do not re-read the AST."""
+        local_var_types = {"repo": "myproject.repositories.UserRepository"}
+        repo_resolver.infer_method_call_return_type("repo.get(1)", "m", local_var_types)
+        monkeypatch.setattr(repo_resolver, "ast_cache", ASTCache())
+
+        result = repo_resolver.infer_method_call_return_type("repo.get(2)", "m", local_var_types)
+
+        assert result == "myproject.models.User"
+
+
+class TestReturnTypeStore:
+    """Tests for persisting method return types across TypeResolver instances."""
+
+    SOURCE = "class UserRepository:\n    def get(self, user_id) -> User:\n        pass\n"
+
+    @pytest.fixture
+    def repo_file(self, tmp_path):
+        file_path = tmp_path / "repositories.py"
+        file_path.write_text(self.SOURCE)
+        return file_path
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = PersistentCache(tmp_path / "cache" / "return-types")
+        yield store
+        store.close()
+
+    def _resolver(self, repo_file, store, ast_cache, extra_entries=()):
+        registry = FunctionRegistry()
+        registry.register("myproject.repositories.UserRepository", "Class")
+        registry.register("myproject.repositories.UserRepository.get", "Method")
+        for qn in extra_entries:
+            registry.register(qn, "Function")
+        return TypeResolver(
+            function_registry=registry,
+            import_mapping={"myproject.repositories": {"User": "myproject.models.User"}},
+            ast_cache=ast_cache,
+            module_qn_to_file_path={"myproject.repositories": repo_file},
+            simple_name_lookup={},
+            return_type_store=store,
+        )
+
+    def _parsed_cache(self, repo_file):
+        ast_cache = ASTCache()
+        root = get_parser("python").parse(self.SOURCE.encode()).root_node
+        ast_cache[repo_file] = (root, "python")
+        return ast_cache
+
+    def test_return_type_is_reused_without_ast(self, repo_file, store):
+        """Test that a later resolver reads stored return types instead of the AST."""
+        method_qn = "myproject.repositories.UserRepository.get"
+        first = self._resolver(repo_file, store, self._parsed_cache(repo_file))
+        assert first._get_method_return_type_from_registry(method_qn) == "myproject.models.User"
+
+        second = self._resolver(repo_file, store, ASTCache())
+        assert second._get_method_return_type_from_registry(method_qn) == "myproject.models.User"
+
+    def test_missing_ast_is_not_stored(self, repo_file, store):
+        """Test that a lookup without the file's AST does not persist a missing type."""
+        method_qn = "myproject.repositories.UserRepository.get"
+        unparsed = self._resolver(repo_file, store, ASTCache())
+        assert unparsed._get_method_return_type_from_registry(method_qn) is None
+        assert len(store) == 0
+
+        parsed = self._resolver(repo_file, store, self._parsed_cache(repo_file))
+        assert parsed._get_method_return_type_from_registry(method_qn) == "myproject.models.User"
+
+    def test_registry_change_invalidates_stored_types(self, repo_file, store):
+        """Test that stored types are ignored once the registry contents change."""
+        method_qn = "myproject.repositories.UserRepository.get"
+        first = self._resolver(repo_file, store, self._parsed_cache(repo_file))
+        first._get_method_return_type_from_registry(method_qn)
+
+        changed = self._resolver(
+            repo_file, store, ASTCache(), extra_entries=["myproject.repositories.helper"]
+        )
+        assert changed._get_method_return_type_from_registry(method_qn) is None
+
+
+class TestNameBasedInference:
+    """Tests for inferring types from variable names."""
+
+    def test_snake_case_name_maps_to_class(self, function_registry):
+        """Test that a snake_case name resolves to its CamelCase class."""
+        context = TypeInferenceContext(module_qn="myproject.services")
+
+        inferred = infer_type_from_name("payment_service", context, {}, function_registry)
+
+        assert inferred is not None
+        assert inferred.type_name == "PaymentService"
+        assert inferred.qualified_name == "myproject.services.PaymentService"
+
+    def test_plain_name_maps_to_capitalized_class(self, function_registry, import_mapping):
+        """Test that a single-word name resolves through imports."""
+        context = TypeInferenceContext(module_qn="myproject.services")
+
+        inferred = infer_type_from_name("user", context, import_mapping, function_registry)
+
+        assert inferred is not None
+        assert inferred.qualified_name == "myproject.models.User"
+
+    def test_context_caches_module_imports(self, function_registry, import_mapping):
+        """Test that the module's imports are looked up once and kept on the context."""
+        context = TypeInferenceContext(module_qn="myproject.services")
+
+        infer_type_from_name("user", context, import_mapping, function_registry)
+        import_mapping["myproject.services"] = {}
+        inferred = infer_type_from_name("user", context, import_mapping, function_registry)
+
+        assert context.imports == {
+            "User": "myproject.models.User",
+            "helper": "myproject.utils.helper",
+        }
+        assert inferred is not None
+        assert inferred.qualified_name == "myproject.models.User"
+
+
+class TestPythonTypeInference:
+    """Tests for PythonTypeInference."""
+
+    def test_body_assignments_exclude_nested_functions(self, function_registry):
+        """Test that assignments in the function body are typed but nested defs are skipped."""
+        inference = PythonTypeInference(function_registry, {})
+        node = parse_function(
+            "def handle():\n"
+            "    service = PaymentService()\n"
+            "    def inner():\n"
+            "        other = PaymentService()\n"
+        )
+
+        type_map = inference.infer_local_types(
+            node, TypeInferenceContext(module_qn="myproject.services")
+        )
+
+        assert type_map.all_types() == {"service": "PaymentService"}
+
+
+class TestNodeTextInterning:
+    """Tests for interning of decoded identifier text."""
+
+    def test_identifiers_are_interned(self):
+        """Test that identifier text decoded from separate trees is the same object."""
+        first = parse_function("def handle_request():\n    pass\n")
+        second = parse_function("def handle_request():\n    return 1\n")
+
+        first_name = get_node_text(first.child_by_field_name("name"))
+        second_name = get_node_text(second.child_by_field_name("name"))
+
+        assert first_name is second_name
@@ -0,0 +1,385 @@
+"""Tests for the file watcher."""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+from watchfiles import Change
+
+from lattice.indexing import watcher as watcher_module
+from lattice.indexing.handlers import FileUpdateHandler
+from lattice.indexing.parse_cache import ParseCache
+from lattice.indexing.watcher import FileChangeHandler, FileWatcher
+from lattice.parsing.models import Language
+from lattice.parsing.parser import create_code_parser
+from lattice.shared.cache import ASTCache
+from lattice.shared.config import WatcherConfig
+from lattice.shared.hashing import compute_content_hash
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.changed: list[Path] = []
+        self.deleted: list[Path] = []
+        self.batch_seen = asyncio.Event()
+        self.files_updated = 0
+        self.files_deleted = 0
+        self.calls_recalculated = 0
+        self.errors = 0
+        self.parse_cache = None
+
+    async def handle_file_changed(self, file_path: Path) -> None:
+        self.changed.append(file_path)
+        self.batch_seen.set()
+
+    async def handle_file_deleted(self, file_path: Path) -> None:
+        self.deleted.append(file_path)
+        self.batch_seen.set()
+
+
+class FakeBackend:
+    def __init__(self):
+        self.indexed: list = []
+
+    async def delete_file_entities(self, relative_path: str) -> None:
+        pass
+
+    async def build_from_parsed_file(self, parsed_file) -> None:
+        pass
+
+    async def index_file(self, parsed_file, project_name: str) -> None:
+        self.indexed.append(parsed_file)
+
+    async def delete_file(self, relative_path: str) -> None:
+        pass
+
+
+class CountingParser:
+    def __init__(self):
+        self._parser = create_code_parser()
+        self.calls = 0
+        self.thread_names: list[str] = []
+
+    def reparse_file(self, file_info, previous):
+        self.calls += 1
+        self.thread_names.append(threading.current_thread().name)
+        return self._parser.reparse_file(file_info, previous)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "node_modules").mkdir()
+    return tmp_path.resolve()
+
+
+class TestFileChangeHandler:
+    """Tests for FileChangeHandler."""
+
+    def test_split_changes_separates_changed_and_deleted(self, repo: Path):
+        """Test that existing files are changed and missing files are deleted."""
+        kept = repo / "src" / "kept.py"
+        kept.write_text("x = 1\n")
+        gone = repo / "src" / "gone.py"
+        handler = FileChangeHandler(repo)
+
+        handler.record_changes(
+            {
+                (Change.modified, str(kept)),
+                (Change.added, str(kept)),
+                (Change.deleted, str(gone)),
+            },
+            now=0.0,
+        )
+        changed, deleted = handler.pop_settled(now=10.0)
+
+        assert changed == {kept}
+        assert deleted == {gone}
+
+    def test_accepts_only_supported_files_outside_ignored_dirs(self, repo: Path):
+        """Test that ignored directories and unsupported extensions are filtered out."""
+        handler = FileChangeHandler(repo)
+
+        assert handler.accepts(Change.modified, str(repo / "src" / "module.py"))
+        assert handler.accepts(Change.added, str(repo / "src" / "App.TSX"))
+        assert not handler.accepts(Change.modified, str(repo / "node_modules" / "lib.js"))
+        assert not handler.accepts(Change.modified, str(repo / "src" / "notes.txt"))
+        assert not handler.accepts(Change.modified, "/elsewhere/module.py")
+
+    def test_replaced_file_counts_as_changed(self, repo: Path):
+        """Test that a delete followed by a re-create in one batch is a change."""
+        module = repo / "src" / "module.py"
+        module.write_text("x = 2\n")
+        handler = FileChangeHandler(repo)
+
+        handler.record_changes(
+            {(Change.deleted, str(module)), (Change.added, str(module))}, now=0.0
+        )
+        changed, deleted = handler.pop_settled(now=10.0)
+
+        assert changed == {module}
+        assert not deleted
+
+    def test_changes_wait_for_quiet_period(self, repo: Path):
+        """Test that a path is only released once it has been quiet for the debounce delay."""
+        module = repo / "src" / "module.py"
+        module.write_text("x = 1\n")
+        handler = FileChangeHandler(repo)
+        delay = handler._debounce_delay
+
+        handler.record_changes({(Change.modified, str(module))}, now=0.0)
+        handler.record_changes({(Change.modified, str(module))}, now=delay * 0.8)
+
+        assert handler.pop_settled(now=delay) == (set(), set())
+        assert handler.pop_settled(now=delay * 1.8) == ({module}, set())
+        assert handler.pop_settled(now=delay * 10) == (set(), set())
+
+
+class TestFileWatcher:
+    """Tests for FileWatcher batching."""
+
+    async def test_burst_of_writes_is_handled_once(self, repo: Path, monkeypatch):
+        """Test that repeated writes to a file are coalesced into a single update."""
+        monkeypatch.setattr(WatcherConfig, "batch_debounce_ms", 400)
+        monkeypatch.setattr(WatcherConfig, "batch_step_ms", 100)
+        watcher = FileWatcher(
+            repo, graph_builder=None, vector_indexer=None, parser=None, ast_cache=None
+        )
+        recorder = RecordingHandler()
+        watcher._handler = recorder
+
+        await watcher.start()
+        try:
+            await asyncio.sleep(0.2)
+            module = repo / "src" / "module.py"
+            for i in range(5):
+                module.write_text(f"x = {i}\n")
+            await asyncio.wait_for(recorder.batch_seen.wait(), timeout=5)
+        finally:
+            await watcher.stop()
+
+        assert recorder.changed == [module]
+
+    async def test_falls_back_to_polling_when_watch_limit_is_reached(self, repo: Path, monkeypatch):
+        """Test that exhausting native watches switches the watcher to polling."""
+        polling_modes: list[bool] = []
+
+        async def fake_awatch(*paths, force_polling, **kwargs):
+            polling_modes.append(force_polling)
+            if not force_polling:
+                raise OSError("OS file watch limit reached")
+            return
+            yield
+
+        monkeypatch.setattr(watcher_module, "_import_watchfiles", lambda: fake_awatch)
+        watcher = FileWatcher(
+            repo, graph_builder=None, vector_indexer=None, parser=None, ast_cache=None
+        )
+
+        await watcher._watch_changes()
+
+        assert polling_modes == [False, True]
+
+    async def test_pending_updates_keep_latest_action_per_path(self, repo: Path):
+        """Test that queued updates for the same path collapse into one entry."""
+        watcher = FileWatcher(
+            repo, graph_builder=None, vector_indexer=None, parser=None, ast_cache=None
+        )
+        module = repo / "src" / "module.py"
+
+        watcher._queue_update("changed", module)
+        watcher._queue_update("changed", module)
+        watcher._queue_update("deleted", module)
+
+        assert watcher._pending == {module: "deleted"}
+        assert watcher.events_coalesced == 2
+        assert watcher._work_event.is_set()
+
+    async def test_single_file_parses_on_dedicated_thread(self, repo: Path):
+        """Test that single-file reparses run on the watcher's own parse thread."""
+        module = repo / "src" / "module.py"
+        module.write_text("def greet():\n    return 'hi'\n")
+        parser = CountingParser()
+        watcher = FileWatcher(
+            repo,
+            graph_builder=FakeBackend(),
+            vector_indexer=FakeBackend(),
+            parser=parser,
+            ast_cache=ASTCache(),
+            recalculate_calls=False,
+        )
+
+        await watcher.start()
+        try:
+            await watcher._handle_batch_changed({module})
+        finally:
+            await watcher.stop()
+
+        assert [name.startswith("lattice-parse") for name in parser.thread_names] == [True]
+
+
+class TestParseCache:
+    """Tests for the persistent parse cache."""
+
+    def _update_handler(
+        self, repo: Path, parser, cache: ParseCache, backend: FakeBackend | None = None
+    ) -> FileUpdateHandler:
+        backend = backend or FakeBackend()
+        return FileUpdateHandler(
+            repo_path=repo,
+            graph_builder=backend,
+            vector_indexer=backend,
+            parser=parser,
+            ast_cache=ASTCache(),
+            recalculate_calls=False,
+            parse_cache=cache,
+        )
+
+    async def test_unchanged_file_is_not_reparsed_after_restart(self, repo: Path, tmp_path: Path):
+        """Test that a new handler reuses the stored parse of an unchanged file."""
+        module = repo / "src" / "module.py"
+        module.write_text("def greet():\n    return 'hi'\n")
+        db_path = tmp_path / "cache" / "parse-cache.db"
+        parser = CountingParser()
+
+        cache = ParseCache(db_path)
+        await self._update_handler(repo, parser, cache).handle_file_changed(module)
+        cache.close()
+
+        cache = ParseCache(db_path)
+        handler = self._update_handler(repo, parser, cache)
+        await handler.handle_file_changed(module)
+        cache.close()
+
+        assert parser.calls == 1
+        assert handler.files_updated == 1
+
+    async def test_modified_file_is_reparsed(self, repo: Path, tmp_path: Path):
+        """Test that a content change misses the cache."""
+        module = repo / "src" / "module.py"
+        module.write_text("def greet():\n    return 'hi'\n")
+        parser = CountingParser()
+        backend = FakeBackend()
+        cache = ParseCache(tmp_path / "parse-cache.db")
+        handler = self._update_handler(repo, parser, cache, backend)
+
+        await handler.handle_file_changed(module)
+        module.write_text("def greet():\n    return 'hello'\n")
+        await handler.handle_file_changed(module)
+        cache.close()
+
+        assert parser.calls == 2
+        assert "hello" in backend.indexed[-1].content
+
+    async def test_identical_content_is_not_reindexed(self, repo: Path, tmp_path: Path):
+        """Test that a save without content changes skips parsing and indexing."""
+        module = repo / "src" / "module.py"
+        module.write_text("def greet():\n    return 'hi'\n")
+        parser = CountingParser()
+        backend = FakeBackend()
+        cache = ParseCache(tmp_path / "parse-cache.db")
+        handler = self._update_handler(repo, parser, cache, backend)
+
+        await handler.handle_file_changed(module)
+        module.touch()
+        await handler.handle_file_changed(module)
+        await handler.handle_file_deleted(module)
+        module.write_text("def greet():\n    return 'hi'\n")
+        await handler.handle_file_changed(module)
+        cache.close()
+
+        assert parser.calls == 2
+        assert len(backend.indexed) == 2
+        assert handler.files_updated == 2
+
+    def test_put_replaces_previous_entry_for_path(self, tmp_path: Path):
+        """Test that only the latest parse of a path is kept."""
+        parser = create_code_parser()
+        cache = ParseCache(tmp_path / "parse-cache.db")
+        first = parser.parse_content("x = 1\n", Language.PYTHON, "src/module.py")
+        second = parser.parse_content("x = 2\n", Language.PYTHON, "src/module.py")
+
+        cache.put(first)
+        cache.put(second)
+
+        assert cache.get("src/module.py", first.file_info.content_hash) is None
+        restored = cache.get("src/module.py", second.file_info.content_hash)
+        cache.close()
+        assert restored == second
+
+    def test_cache_from_another_hash_algorithm_is_discarded(self, tmp_path: Path):
+        """Test that entries written under a different content hash algorithm are dropped."""
+        db_path = tmp_path / "parse-cache.db"
+        parsed = create_code_parser().parse_content("x = 1\n", Language.PYTHON, "src/module.py")
+        cache = ParseCache(db_path)
+        cache.put(parsed)
+        cache._conn.execute("UPDATE meta SET value = 'sha256' WHERE key = 'hash_algorithm'")
+        cache._conn.commit()
+        cache.close()
+
+        cache = ParseCache(db_path)
+        restored = cache.get("src/module.py", parsed.file_info.content_hash)
+        cache.close()
+
+        assert restored is None
+
+
+class TestBuildFileInfo:
+    """Tests for reading file metadata on change events."""
+
+    def test_large_file_stats_match_small_file_stats(self, repo: Path):
+        """Test that memory-mapped files report the same hash, size and line count."""
+        line = "value = 'x' * 64\n"
+        large = repo / "src" / "large.py"
+        large.write_text(line * 8000)
+        handler = FileUpdateHandler(
+            repo_path=repo,
+            graph_builder=None,
+            vector_indexer=None,
+            parser=None,
+            ast_cache=ASTCache(),
+        )
+
+        file_info = handler._build_file_info(large)
+
+        raw = large.read_bytes()
+        assert file_info.size_bytes == len(raw) > 64 * 1024
+        assert file_info.content_hash == compute_content_hash(raw)
+        assert file_info.line_count == raw.count(b"\n") + 1
+
+
+class TestBatchParsing:
+    """Tests for parsing bursts of changed files in a process pool."""
+
+    async def test_batch_is_parsed_in_worker_processes(self, repo: Path):
+        """Test that every file in a batch is parsed and indexed once."""
+        paths = []
+        for i in range(3):
+            module = repo / "src" / f"module_{i}.py"
+            module.write_text(f"def func_{i}():\n    return {i}\n")
+            paths.append(module)
+        paths.append(repo / "src" / "missing.py")
+        backend = FakeBackend()
+        handler = FileUpdateHandler(
+            repo_path=repo,
+            graph_builder=backend,
+            vector_indexer=backend,
+            parser=None,
+            ast_cache=ASTCache(),
+            recalculate_calls=False,
+        )
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            await handler.handle_files_changed(paths, executor)
+
+        assert sorted(p.functions[0].name for p in backend.indexed) == [
+            "func_0",
+            "func_1",
+            "func_2",
+        ]
+        assert handler.files_updated == 3
+        assert handler.errors == 0